@@ -17,17 +17,53 @@ Daemon & Optimization Features (Implemented):
 - RAM EFFICIENCY: Hides window on close; garbage collects to free memory.
 - DAEMON MODE: Process stays alive in background (sleeping) when window is closed.
 - KEEPALIVE: self.hold() prevents GApplication 10s service timeout.
+- ZERO WAKEUPS: Every poller is suspended while the window is hidden and
+  re-armed (with one immediate refresh) when it is presented again.
 - INSTANT LAUNCH: UI is pre-built and realized during startup to ensure 0ms latency on activation.
+- LAZY PAGES: Only the selected page is built up front; the rest are stubs that
+  are materialized on first selection or by a time-sliced idle prefetcher, so
+  startup cost and RSS scale with the pages actually visited.
+- PAGE CACHE: Built pages live in an LRU bounded by page count, estimated RSS
+  and idle time; evicted pages are unrooted (releasing their pollers) and
+  rebuilt on demand with their scroll position restored.
+- INCREMENTAL RELOAD: Hot reload diffs the old and new compiled config. Pages
+  are matched by id (or title) and sections by position; only changed sections
+  are refilled, so untouched rows keep their warm values and pollers.
+- AUTO RELOAD: The config directory is watched; a CSS-only edit swaps the CSS
+  provider without touching widgets, and a config that fails to load leaves
+  the running UI in place.
+- SEARCH INDEX: Each reload (or the first query) builds a trigram/prefix index with
+  precomputed breadcrumbs; a keystroke is a few dict lookups, never a tree walk.
+- RANKED SEARCH: Results are ranked (title over description, exact over fuzzy)
+  with typo and acronym tolerance, and only the top results are kept.
+- RECYCLED RESULTS: Search results are a model-backed Gtk.ListView; only the
+  visible rows exist and they are rebound per query without starting pollers.
+  Toggles, buttons and sliders keep a working switch, run button or slider,
+  and labels their value. Their state is the last value fetched for the real
+  rows (a shared state store). Activating a result opens its page, pushes
+  its subpages, expands its expanders and focuses the row.
+- GENERATOR CACHE: `directory_generator` expansions are cached per directory
+  and reused until a directory monitor (or, without one, the mtime) reports a
+  change; `sort: name | name_desc | newest | oldest | none` orders them.
+- FAST CLIENT: The daemon listens on a Unix socket in $XDG_RUNTIME_DIR; later
+  launches (optionally `--page ID` or `--search QUERY`) hand their request over
+  before importing yaml or gi, and only fall through to GApplication if no
+  daemon answers.
+- STARTUP PROFILE: `--profile-startup[=PATH]` times each boot phase (and with
+  `--profile-startup-memory`, tracemalloc deltas) into a Chrome trace.
 """
 from __future__ import annotations
 
+import copy
 import gc
 import logging
+import os
+import socket
 import sys
 import threading
+import time
 import traceback
-from collections.abc import Callable, Iterator
-from copy import deepcopy
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass, field
 from enum import StrEnum
 from pathlib import Path
@@ -74,22 +110,47 @@ def _setup_cache() -> None:
         log.warning("Could not set custom pycache location: %s", e)
 
 
+_boot_ns = time.perf_counter_ns()
 _setup_cache()
+_cache_ns = time.perf_counter_ns()
+
+# =============================================================================
+# CLIENT FAST PATH
+# =============================================================================
+# Hand the request to a running daemon before any heavy import. Any other
+# argument (--gapplication-service, profiling flags) takes the full path.
+import lib.ipc as ipc
+
+_launch_request, sys.argv[1:] = ipc.parse_args(sys.argv[1:])
+if __name__ == "__main__" and len(sys.argv) == 1 and ipc.send(_launch_request):
+    sys.exit(0)
 
 # =============================================================================
 # IMPORTS & PRE-FLIGHT
 # =============================================================================
-import lib.utility as utility
+from lib.profiler import PROFILER
 
-utility.preflight_check()
+sys.argv[:] = PROFILER.configure(sys.argv, origin_ns=_boot_ns)
+PROFILER.add("setup_cache", _boot_ns, _cache_ns)
 
-import gi
+with PROFILER.span("import_utility"):
+    import lib.utility as utility
 
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-from gi.repository import Adw, Gdk, Gio, GLib, Gtk, Pango
+with PROFILER.span("preflight_check"):
+    utility.preflight_check()
 
-import lib.rows as rows
+with PROFILER.span("import_gi"):
+    import gi
+
+    gi.require_version("Gtk", "4.0")
+    gi.require_version("Adw", "1")
+    from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk, Pango
+
+with PROFILER.span("import_rows"):
+    import lib.generators as generators
+    import lib.model as model
+    import lib.rows as rows
+    import lib.search as search
 
 if TYPE_CHECKING:
     pass
@@ -118,7 +179,14 @@ EMPTY_PAGE_ID: Final[str] = "empty-state"
 
 # Behavior
 SEARCH_DEBOUNCE_MS: Final[int] = 200
-SEARCH_MAX_RESULTS: Final[int] = 50
+SEARCH_MAX_RESULTS: Final[int] = 200  # Rows are virtualized; this bounds ranking
+PREFETCH_SLICE_MS: Final[float] = 4.0
+RELOAD_DEBOUNCE_MS: Final[int] = 300  # Editors write files in several steps
+
+# Page cache defaults (overridable via the top-level `page_cache` config key)
+PAGE_CACHE_MAX_PAGES: Final[int] = 8
+PAGE_CACHE_MAX_RSS_MB: Final[int] = 0  # 0 disables the RSS budget
+PAGE_CACHE_IDLE_SECONDS: Final[int] = 900
 DEFAULT_TOAST_TIMEOUT: Final[int] = 2
 
 # Icons
@@ -207,9 +275,18 @@ class ConfigPage(TypedDict):
     layout: NotRequired[list[ConfigSection]]
 
 
+class PageCacheConfig(TypedDict, total=False):
+    """Budget for built page widget trees."""
+    max_pages: int
+    max_rss_mb: int
+    idle_timeout: int
+
+
 class AppConfig(TypedDict):
     """Root configuration object."""
     pages: list[ConfigPage]
+    page_cache: NotRequired[PageCacheConfig]
+    auto_reload: NotRequired[bool]  # Watch config and CSS files (default true)
 
 
 class RowContext(TypedDict):
@@ -221,16 +298,54 @@ class RowContext(TypedDict):
     nav_view: Adw.NavigationView | None
     builder_func: Callable[..., Adw.NavigationPage] | None
     path: list[str]  # Breadcrumb path for navigation depth
+    subpages: rows.SubpageCache | None  # Built subpages of this nav view
 
 
 class ConfigLoadResult(TypedDict):
     """Result from config loading operation."""
     success: bool
     config: AppConfig
+    pages: tuple[model.PageModel, ...]
+    search: search.SearchIndex | None  # None: built on first query
     css: str
     error: str | None
 
 
+def _resident_kb() -> int:
+    """Current resident set size of this process in KiB (0 if unknown)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0
+    return resident_pages * os.sysconf("SC_PAGESIZE") // 1024
+
+
+def _page_key(page: model.PageModel) -> str:
+    """Stable identity of a page across reloads."""
+    return page.id or page.title
+
+
+@dataclass(slots=True)
+class SectionSlot:
+    """A built root-page section: its group and the rows added to it."""
+    section: model.SectionModel
+    group: Adw.PreferencesGroup
+    children: list[Gtk.Widget] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PageCacheEntry:
+    """Bookkeeping for one built page."""
+    last_used: float
+    rss_kb: int = 0
+    build_ms: float = 0.0
+    # Kept so a reload can patch changed sections in place
+    content: Adw.PreferencesPage | None = None
+    context: RowContext | None = None
+    sections: list[SectionSlot] = field(default_factory=list)
+
+
 @dataclass(slots=True)
 class ApplicationState:
     """
@@ -239,10 +354,24 @@ class ApplicationState:
     eliminating the need for explicit locking in the main controller.
     """
     config: AppConfig = field(default_factory=lambda: {"pages": []})
+    pages: tuple[model.PageModel, ...] = ()  # Compiled from config
+    search_index: search.SearchIndex | None = None
+    generators: generators.GeneratorCache = field(default_factory=generators.GeneratorCache)
     css_content: str = ""
     last_visible_page: str | None = None
     debounce_source_id: int = 0
     config_error: str | None = None
+    pending_pages: dict[int, Iterator[None]] = field(default_factory=dict)
+    prefetch_source_id: int = 0
+    built_pages: dict[int, PageCacheEntry] = field(default_factory=dict)
+    page_scroll: dict[int, float] = field(default_factory=dict)
+    file_monitor: Gio.FileMonitor | None = None
+    file_monitor_handler: int = 0
+    reload_source_id: int = 0
+    changed_files: set[str] = field(default_factory=set)
+    ipc_server: socket.socket | None = None
+    ipc_watch_id: int = 0
+    pending_request: ipc.Request | None = None  # Applied on next activation
 
 
 class DuskyControlCenter(Adw.Application):
@@ -263,20 +392,28 @@ class DuskyControlCenter(Adw.Application):
         "_search_entry",
         "_search_btn",
         "_search_page",
-        "_search_results_group",
+        "_search_results",
+        "_search_content",
+        "_search_status",
+        "_search_title",
+        "_search_note",
+        "_search_view",
         "_css_provider",
         "_display",
         "_window",
         "_split_view",
     )
 
-    def __init__(self) -> None:
+    def __init__(self, request: ipc.Request | None = None) -> None:
         super().__init__(
             application_id=APP_ID,
             flags=Gio.ApplicationFlags.FLAGS_NONE,
         )
 
-        self._state = ApplicationState()
+        self._state = ApplicationState(
+            pending_request=request,
+            generators=generators.GeneratorCache(self._on_generator_changed),
+        )
         self._init_widget_refs()
         self._css_provider: Gtk.CssProvider | None = None
         self._display: Gdk.Display | None = None
@@ -291,7 +428,12 @@ class DuskyControlCenter(Adw.Application):
         self._search_entry: Gtk.SearchEntry | None = None
         self._search_btn: Gtk.ToggleButton | None = None
         self._search_page: Adw.NavigationPage | None = None
-        self._search_results_group: Adw.PreferencesGroup | None = None
+        self._search_results: Gio.ListStore | None = None
+        self._search_content: Gtk.Stack | None = None
+        self._search_status: Adw.StatusPage | None = None
+        self._search_title: Gtk.Label | None = None
+        self._search_note: Gtk.Label | None = None
+        self._search_view: Gtk.ListView | None = None
         self._split_view: Adw.OverlaySplitView | None = None
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -312,21 +454,34 @@ class DuskyControlCenter(Adw.Application):
         # INSTANT STARTUP FIX: 
         # Move config loading and UI building here (Background) instead of do_activate (Foreground).
         # This consumes RAM immediately but makes activation instant.
-        result = self._load_config_and_css_sync()
+        with PROFILER.span("load_config"):
+            result = self._load_config_and_css_sync()
         self._state.config = result["config"]
+        self._state.pages = result["pages"]
+        self._state.search_index = result["search"]
         self._state.css_content = result["css"]
         self._state.config_error = result["error"]
 
-        self._apply_css()
-        self._build_ui()
+        with PROFILER.span("apply_css"):
+            self._apply_css()
+        with PROFILER.span("build_ui"):
+            self._build_ui()
         
         # CRITICAL: Force the window to 'realize' immediately.
-        # This allocates the GDK surface and backend resources (the ~200MB RAM usage)
-        # without actually showing the window on screen (unmapped).
-        # This ensures that when do_activate calls present(), the heavy lifting is already done.
+        # This allocates the GDK surface and backend resources without actually
+        # showing the window on screen (unmapped). Only the selected page has
+        # been built at this point; the others stay stubs until they are
+        # selected or prefetched while the window is visible.
         if self._window:
-            self._window.realize()
-            self._window.set_visible(False)
+            with PROFILER.span("realize"):
+                self._window.realize()
+                self._window.set_visible(False)
+
+        # The window starts hidden, so no poller may wake the daemon yet
+        rows.suspend_pollers()
+        self._start_file_watch()
+        self._start_ipc_server()
+        PROFILER.finish(utility.get_cache_dir())
 
     def do_activate(self) -> None:
         """
@@ -335,11 +490,32 @@ class DuskyControlCenter(Adw.Application):
         """
         if self._window:
             self._window.present()
+            rows.resume_pollers()
+        if (request := self._state.pending_request) is not None:
+            self._state.pending_request = None
+            self._apply_request(request)
 
     def do_shutdown(self) -> None:
         """Cleanup resources on application exit."""
         self._cancel_debounce()
+        self._stop_file_watch()
+        self._stop_ipc_server()
+        self._state.generators.clear()
         self._remove_css_provider()
+        stats = rows.get_poll_stats()
+        if stats.fixed_polls > 0:
+            log.info(
+                "Adaptive polling: %d fetches instead of %.0f (%.0f%% saved)",
+                stats.polls, stats.fixed_polls, stats.saved_ratio * 100,
+            )
+        if timeouts := rows.get_timeout_counts():
+            log.info(
+                "Command timeouts: %s",
+                ", ".join(f"{cmd!r} x{n}" for cmd, n in list(timeouts.items())[:5]),
+            )
+        for priority, counters in rows.get_executor_stats().items():
+            if counters.submitted:
+                log.debug("Executor %s: %s", priority.name, counters)
         Adw.Application.do_shutdown(self)
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -362,6 +538,68 @@ class DuskyControlCenter(Adw.Application):
                 log.debug("CSS provider removal warning: %s", e)
         self._css_provider = None
 
+    # ─────────────────────────────────────────────────────────────────────────
+    # LAUNCHER SOCKET
+    # ─────────────────────────────────────────────────────────────────────────
+    def _start_ipc_server(self) -> None:
+        """Serve fast-path launcher requests (see lib.ipc)."""
+        if (server := ipc.bind_server()) is None:
+            return
+        self._state.ipc_server = server
+        self._state.ipc_watch_id = GLib.io_add_watch(
+            server.fileno(), GLib.PRIORITY_DEFAULT, GLib.IOCondition.IN,
+            self._on_ipc_ready,
+        )
+
+    def _stop_ipc_server(self) -> None:
+        if self._state.ipc_watch_id:
+            GLib.source_remove(self._state.ipc_watch_id)
+            self._state.ipc_watch_id = 0
+        if self._state.ipc_server is not None:
+            ipc.close_server(self._state.ipc_server)
+            self._state.ipc_server = None
+
+    def _on_ipc_ready(self, _fd: int, _condition: GLib.IOCondition) -> bool:
+        if self._state.ipc_server is None:
+            return GLib.SOURCE_REMOVE
+        if (request := ipc.read_request(self._state.ipc_server)) is not None:
+            log.debug("Launcher request: %s", request)
+            self._state.pending_request = request
+            self.activate()
+        return GLib.SOURCE_CONTINUE
+
+    def _apply_request(self, request: ipc.Request) -> None:
+        """Show the page or search a launcher asked for."""
+        match request.action:
+            case ipc.ACTION_PAGE:
+                self._show_page(request.argument)
+            case ipc.ACTION_SEARCH:
+                self._activate_search()
+                if self._search_entry:
+                    self._search_entry.set_text(request.argument)
+                    self._search_entry.set_position(-1)
+
+    def _page_index(self, key: str) -> int | None:
+        """Index of a page by id or (case-insensitive) title."""
+        folded = key.casefold()
+        for idx, page in enumerate(self._state.pages):
+            if page.id == key or page.title.casefold() == folded:
+                return idx
+        return None
+
+    def _show_page(self, key: str) -> None:
+        """Select a page by id or (case-insensitive) title."""
+        if (idx := self._page_index(key)) is None:
+            self._toast(f"No page named '{key}'", 3)
+            return
+
+        if self._search_bar and self._search_bar.get_search_mode():
+            self._deactivate_search()
+        if self._sidebar_list and (row := self._sidebar_list.get_row_at_index(idx)):
+            self._sidebar_list.select_row(row)
+            # Also pops back to the page root when it was already selected
+            self._on_row_selected(self._sidebar_list, row)
+
     # ─────────────────────────────────────────────────────────────────────────
     # CONFIG I/O
     # ─────────────────────────────────────────────────────────────────────────
@@ -374,14 +612,28 @@ class DuskyControlCenter(Adw.Application):
         """
         config, config_error = self._do_load_config()
         css = self._do_load_css()
-        
+        # The search index is left to the first query to keep startup lean
+        return self._compile_load_result(config, css, config_error, index=False)
+
+    def _compile_load_result(
+        self, config: AppConfig, css: str, error: str | None, index: bool = True
+    ) -> ConfigLoadResult:
+        """Compile the page model (and search index) of a loaded config."""
+        pages = model.compile_pages(config)
         return {
-            "success": config_error is None,
+            "success": error is None,
             "config": config,
+            "pages": pages,
+            "search": self._build_search_index(pages) if index else None,
             "css": css,
-            "error": config_error,
+            "error": error,
         }
 
+    def _build_search_index(
+        self, pages: tuple[model.PageModel, ...]
+    ) -> search.SearchIndex:
+        return search.SearchIndex.build(pages, expand=self._expand_generator)
+
     def _do_load_config(self) -> tuple[AppConfig, str | None]:
         """
         Safely load and validate the configuration file.
@@ -392,26 +644,14 @@ class DuskyControlCenter(Adw.Application):
         config_path = SCRIPT_DIR / CONFIG_FILENAME
         
         try:
+            # The page list is validated while the document is compiled
             loaded = utility.load_config(config_path)
-            
-            if not isinstance(loaded, dict):
-                return {"pages": []}, f"Config is not a dictionary (got {type(loaded).__name__})"
-            
-            if "pages" not in loaded:
+            if not loaded:
                 return {"pages": []}, "Config missing required 'pages' key"
-            
-            if not isinstance(loaded.get("pages"), list):
-                return {"pages": []}, "'pages' must be a list"
-            
-            # Validate each page has required 'title'
-            for idx, page in enumerate(loaded["pages"]):
-                if not isinstance(page, dict):
-                    return {"pages": []}, f"Page {idx} is not a dictionary"
-                if "title" not in page:
-                    return {"pages": []}, f"Page {idx} missing required 'title' key"
-            
             return loaded, None  # type: ignore[return-value]
-            
+
+        except utility.ConfigError as e:
+            return {"pages": []}, str(e)
         except FileNotFoundError:
             return {"pages": []}, f"Config file not found: {config_path}"
         except Exception as e:
@@ -435,31 +675,46 @@ class DuskyControlCenter(Adw.Application):
             log.warning("Failed to read CSS file: %s", e)
             return ""
 
-    def _apply_css(self) -> None:
-        """Apply loaded CSS to the default display."""
-        self._remove_css_provider()
+    def _apply_css(self) -> bool:
+        """
+        Apply loaded CSS to the default display.
 
+        A stylesheet with parse errors does not replace one that is already
+        applied; returns False in that case.
+        """
         if not self._state.css_content:
-            return
+            self._remove_css_provider()
+            return True
 
-        self._display = Gdk.Display.get_default()
-        if self._display is None:
+        display = Gdk.Display.get_default()
+        if display is None:
             log.warning("No default display available for CSS")
-            return
+            return False
 
+        errors: list[str] = []
         provider = Gtk.CssProvider()
+        provider.connect(
+            "parsing-error", lambda _p, _section, err: errors.append(err.message)
+        )
         try:
             provider.load_from_string(self._state.css_content)
-            Gtk.StyleContext.add_provider_for_display(
-                self._display,
-                provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-            )
-            # Only store reference after successful add to avoid leak on partial fail
-            self._css_provider = provider
         except GLib.Error as e:
-            log.error("CSS parsing failed: %s", e.message)
-            # Don't store the failed provider
+            errors.append(e.message)
+        if errors:
+            log.error("CSS parsing failed: %s", errors[0])
+            if self._css_provider is not None:
+                return False
+
+        # Swap providers; widgets are only restyled, never rebuilt
+        self._remove_css_provider()
+        self._display = display
+        Gtk.StyleContext.add_provider_for_display(
+            display,
+            provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+        )
+        self._css_provider = provider
+        return not errors
 
     def _get_context(
         self,
@@ -478,6 +733,7 @@ class DuskyControlCenter(Adw.Application):
             "nav_view": nav_view,
             "builder_func": builder_func,
             "path": path or [],
+            "subpages": rows.SubpageCache(nav_view) if nav_view else None,
         }
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -489,6 +745,8 @@ class DuskyControlCenter(Adw.Application):
         self._window.set_default_size(WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT)
         self._window.set_size_request(760, 600)  # (Min Width, Min Height)           # THIS IS THE ONE
         self._window.connect("close-request", self._on_close_request)
+        self._window.connect("notify::visible", self._on_window_visibility_changed)
+        self._window.connect("notify::is-active", self._on_window_active_changed)
 
         # Keyboard event handling
         key_ctrl = Gtk.EventControllerKey()
@@ -528,6 +786,25 @@ class DuskyControlCenter(Adw.Application):
         gc.collect()  # Explicitly free memory while hidden
         return True
 
+    def _on_window_visibility_changed(
+        self, window: Adw.Window, _pspec: GObject.ParamSpec
+    ) -> None:
+        """Suspend all pollers while hidden so the daemon never wakes up."""
+        if window.get_visible():
+            rows.resume_pollers()
+            self._schedule_prefetch()
+        else:
+            self._cancel_prefetch()
+            rows.suspend_pollers()
+            self._evict_pages()
+
+    def _on_window_active_changed(
+        self, window: Adw.Window, _pspec: GObject.ParamSpec
+    ) -> None:
+        """Poll at full speed again when the user comes back to the window."""
+        if window.is_active():
+            rows.boost_pollers()
+
     def _on_key_pressed(
         self,
         controller: Gtk.EventControllerKey,
@@ -571,32 +848,37 @@ class DuskyControlCenter(Adw.Application):
     # ─────────────────────────────────────────────────────────────────────────
     # ASYNC HOT RELOAD
     # ─────────────────────────────────────────────────────────────────────────
-    def _reload_app_async(self) -> None:
+    def _reload_app_async(self, keep_ui_on_error: bool = False) -> None:
         """
         Initiate hot reload with background I/O.
         
         Preserves the current page selection and restores it after rebuild.
-        Uses thread + idle pattern to prevent UI freeze.
+        Uses thread + idle pattern to prevent UI freeze. With
+        `keep_ui_on_error`, a config that fails to load only raises a toast
+        and the running UI stays live.
         """
         log.info("Hot Reload Initiated...")
         
         # Capture current selection for restoration
         current_page = self._get_current_page_index()
         
-        # Snapshot for rollback on failure
-        old_config = deepcopy(self._state.config)
+        # Snapshot for rollback on failure. The document is plain dicts and
+        # rows get it through their context, so it is copied; the compiled
+        # pages and the index are immutable, so references are enough.
+        old_config = copy.deepcopy(self._state.config)
+        old_pages = self._state.pages
+        old_index = self._state.search_index
         old_css = self._state.css_content
+        old_error = self._state.config_error
+
+        # Generators the new index does not expand are pruned once it is live
+        generation = self._state.generators.mark()
 
         def background_load() -> ConfigLoadResult:
             """Execute I/O operations in background thread."""
             config, error = self._do_load_config()
             css = self._do_load_css()
-            return {
-                "success": error is None,
-                "config": config,
-                "css": css,
-                "error": error,
-            }
+            return self._compile_load_result(config, css, error)
 
         def on_complete(
             result: ConfigLoadResult | None, 
@@ -612,15 +894,28 @@ class DuskyControlCenter(Adw.Application):
                 self._toast("Reload Failed: No result", 3)
                 return
 
+            if result["error"] and keep_ui_on_error and not old_error:
+                log.error("Config reload rejected: %s", result["error"])
+                if result["css"] != old_css:
+                    self._state.css_content = result["css"]
+                    self._apply_css()
+                self._toast(f"Config Error: {result['error'][:50]}...", 4)
+                return
+
             try:
                 # Update state
                 self._state.config = result["config"]
+                self._state.pages = result["pages"]
+                self._state.search_index = result["search"]
                 self._state.css_content = result["css"]
                 self._state.config_error = result["error"]
 
-                # Rebuild UI
-                self._apply_css()
-                self._clear_and_rebuild_ui(current_page)
+                # Patch the UI in place, or rebuild it when the page list changed
+                if result["css"] != old_css:
+                    self._apply_css()
+                if old_error or result["error"] or not self._patch_pages(old_pages):
+                    self._clear_and_rebuild_ui(current_page)
+                self._state.generators.prune(generation)
 
                 if result["error"]:
                     self._toast(f"Config Error: {result['error'][:50]}...", 4)
@@ -631,12 +926,184 @@ class DuskyControlCenter(Adw.Application):
                 log.error("UI Rebuild failed: %s", rebuild_error, exc_info=True)
                 # Rollback state
                 self._state.config = old_config
+                self._state.pages = old_pages
+                self._state.search_index = old_index
                 self._state.css_content = old_css
-                self._state.config_error = None
+                self._state.config_error = old_error
                 self._toast("Reload Failed: UI rebuild error", 3)
 
         self._run_in_background(background_load, on_complete)
 
+    # ─── File Watch ───
+    def _start_file_watch(self) -> None:
+        """
+        Watch the config directory for edits to the config and CSS files.
+        The directory is watched because editors often save by renaming a
+        temporary file over the original.
+        """
+        try:
+            monitor = Gio.File.new_for_path(str(SCRIPT_DIR)).monitor_directory(
+                Gio.FileMonitorFlags.WATCH_MOVES, None
+            )
+        except GLib.Error as e:
+            log.warning("Auto reload disabled, cannot watch %s: %s", SCRIPT_DIR, e.message)
+            return
+        self._state.file_monitor = monitor
+        self._state.file_monitor_handler = monitor.connect(
+            "changed", self._on_config_dir_changed
+        )
+
+    def _stop_file_watch(self) -> None:
+        state = self._state
+        if state.reload_source_id:
+            GLib.source_remove(state.reload_source_id)
+            state.reload_source_id = 0
+        if state.file_monitor is not None:
+            state.file_monitor.disconnect(state.file_monitor_handler)
+            state.file_monitor.cancel()
+        state.file_monitor = None
+        state.file_monitor_handler = 0
+        state.changed_files.clear()
+
+    def _on_config_dir_changed(
+        self,
+        _monitor: Gio.FileMonitor,
+        file: Gio.File,
+        other: Gio.File | None,
+        event: Gio.FileMonitorEvent,
+    ) -> None:
+        if event == Gio.FileMonitorEvent.ATTRIBUTE_CHANGED:
+            return
+        if not self._state.config.get("auto_reload", True):
+            return
+        # For renames the watched name is the destination
+        names = {file.get_basename()}
+        if other is not None:
+            names.add(other.get_basename())
+        changed = names & {CONFIG_FILENAME, CSS_FILENAME}
+        if not changed:
+            return
+
+        self._state.changed_files |= changed
+        if self._state.reload_source_id:
+            GLib.source_remove(self._state.reload_source_id)
+        self._state.reload_source_id = GLib.timeout_add(
+            RELOAD_DEBOUNCE_MS, self._on_reload_debounced
+        )
+
+    def _on_reload_debounced(self) -> bool:
+        self._state.reload_source_id = 0
+        changed = self._state.changed_files
+        self._state.changed_files = set()
+
+        if CONFIG_FILENAME in changed:
+            log.info("%s changed on disk, reloading", CONFIG_FILENAME)
+            self._reload_app_async(keep_ui_on_error=True)
+        elif CSS_FILENAME in changed:
+            self._reload_css()
+        return GLib.SOURCE_REMOVE
+
+    def _reload_css(self) -> None:
+        """Fast path: swap the CSS provider without touching any widget."""
+        css = self._do_load_css()
+        if css == self._state.css_content:
+            return
+        old_css, self._state.css_content = self._state.css_content, css
+        previous = self._css_provider
+        if self._apply_css():
+            log.info("Reloaded %s", CSS_FILENAME)
+            return
+        if self._css_provider is previous:
+            # Rejected: the previous stylesheet is still applied
+            self._state.css_content = old_css
+        self._toast(f"CSS Error: {CSS_FILENAME} has parse errors", 3)
+
+    def _patch_pages(self, old_pages: tuple[model.PageModel, ...]) -> bool:
+        """
+        Apply a reload by diffing the compiled pages.
+
+        Returns False when pages were added, removed or reordered; the caller
+        then falls back to a full rebuild.
+        """
+        new_pages = self._state.pages
+        if not old_pages or not new_pages:
+            return False
+        if [_page_key(p) for p in old_pages] != [_page_key(p) for p in new_pages]:
+            return False
+
+        clock = time.perf_counter()
+        changed = 0
+        current = self._get_current_page_index()
+        for idx, (old, new) in enumerate(zip(old_pages, new_pages)):
+            if old == new:
+                continue
+            changed += 1
+            if (old.title, old.icon) != (new.title, new.icon):
+                self._update_sidebar_row(idx, new)
+            if not self._patch_page(idx, old, new):
+                self._rebuild_page(idx, selected=idx == current)
+
+        # Results may show removed or edited items
+        if self._search_entry is not None and (query := self._search_entry.get_text()):
+            self._execute_search(query)
+        if self._window and self._window.get_visible():
+            self._schedule_prefetch()
+
+        log.info(
+            "Incremental reload: %d of %d pages changed (%.1f ms)",
+            changed, len(new_pages), (time.perf_counter() - clock) * 1000,
+        )
+        return True
+
+    def _patch_page(self, idx: int, old: model.PageModel, new: model.PageModel) -> bool:
+        """
+        Refill only the changed sections of a built page.
+
+        Returns False when the page has to be rebuilt instead: it is not fully
+        built yet, or its title (part of every subpage breadcrumb) changed.
+        """
+        entry = self._state.built_pages.get(idx)
+        if entry is None or entry.content is None or entry.context is None:
+            return False
+        if old.title != new.title:
+            return False
+
+        slots = entry.sections
+        for pos, section in enumerate(new.layout):
+            if pos >= len(slots):
+                slot = self._build_section(section, entry.context)
+                entry.content.add(slot.group)
+                slots.append(slot)
+            elif slots[pos].section != section:
+                self._fill_section(slots[pos], section, entry.context)
+
+        for slot in slots[len(new.layout):]:
+            entry.content.remove(slot.group)
+        del slots[len(new.layout):]
+        return True
+
+    def _rebuild_page(self, idx: int, selected: bool) -> None:
+        """Replace a page with a fresh stub, rebuilding it now if selected."""
+        if self._stack is None:
+            return
+        name = f"{PAGE_PREFIX}{idx}"
+        visible = self._stack.get_visible_child_name() == name
+        self._evict_page(idx)
+        if selected:
+            self._materialize_page(idx)
+            if (entry := self._state.built_pages.get(idx)) is not None:
+                entry.last_used = time.monotonic()
+        if visible:
+            self._stack.set_visible_child_name(name)
+
+    def _update_sidebar_row(self, idx: int, page: model.PageModel) -> None:
+        if self._sidebar_list is None:
+            return
+        if (row := self._sidebar_list.get_row_at_index(idx)) is not None:
+            row.set_child(
+                self._create_sidebar_row_content(page.title, page.icon or ICON_DEFAULT)
+            )
+
     def _get_current_page_index(self) -> int | None:
         """Get the index of the currently selected sidebar row."""
         if self._sidebar_list is None:
@@ -672,7 +1139,12 @@ class DuskyControlCenter(Adw.Application):
         """
         # Nullify widget references before clearing to avoid GTK warnings
         self._search_page = None
-        self._search_results_group = None
+        self._search_results = None
+        self._search_content = None
+        self._search_status = None
+        self._search_title = None
+        self._search_note = None
+        self._search_view = None
 
         # Clear containers
         self._clear_sidebar()
@@ -697,6 +1169,10 @@ class DuskyControlCenter(Adw.Application):
 
     def _clear_stack(self) -> None:
         """Remove all children from the content stack."""
+        self._cancel_prefetch()
+        self._state.pending_pages.clear()
+        self._state.built_pages.clear()
+        self._state.page_scroll.clear()
         if self._stack is None:
             return
         while (child := self._stack.get_first_child()) is not None:
@@ -718,15 +1194,150 @@ class DuskyControlCenter(Adw.Application):
         header.pack_start(self._create_sidebar_toggle_button())
         toolbar.add_top_bar(header)
 
-        pref_page = Adw.PreferencesPage()
-        self._search_results_group = Adw.PreferencesGroup(title="Search Results")
-        pref_page.add(self._search_results_group)
+        self._search_content = Gtk.Stack()
+        self._search_status = Adw.StatusPage(icon_name=ICON_SEARCH, vexpand=True)
+        self._search_content.add_named(self._search_status, "status")
+        self._search_content.add_named(self._create_search_results_view(), "results")
+        self._reset_search_results()
 
-        toolbar.set_content(pref_page)
+        toolbar.set_content(self._search_content)
         self._search_page.set_child(toolbar)
 
         self._stack.add_named(self._search_page, SEARCH_PAGE_ID)
 
+    def _create_search_results_view(self) -> Gtk.Widget:
+        """
+        Model-backed result list. The ListView only instantiates the rows in
+        view and rebinds them when the model changes.
+        """
+        self._search_results = Gio.ListStore(item_type=rows.SearchResult)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_search_row_setup)
+        factory.connect("bind", self._on_search_row_bind)
+        factory.connect("unbind", self._on_search_row_unbind)
+
+        self._search_view = Gtk.ListView(
+            model=Gtk.NoSelection(model=self._search_results),
+            factory=factory,
+            single_click_activate=True,
+            css_classes=["rich-list", "card"],
+        )
+        self._search_view.connect("activate", self._on_search_result_activated)
+
+        self._search_title = Gtk.Label(xalign=0, css_classes=["heading"])
+        self._search_note = Gtk.Label(
+            xalign=0,
+            css_classes=["dim-label", "caption"],
+            label=f"Showing the first {SEARCH_MAX_RESULTS} results. "
+            "Refine your search for more specific results.",
+        )
+        header = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=4,
+            margin_top=24,
+            margin_bottom=12,
+            margin_start=12,
+            margin_end=12,
+        )
+        header.append(self._search_title)
+        header.append(self._search_note)
+
+        clamp = Adw.ClampScrollable(child=self._search_view)
+        clamp.set_margin_start(12)
+        clamp.set_margin_end(12)
+        clamp.set_margin_bottom(24)
+        scroller = Gtk.ScrolledWindow(
+            child=clamp,
+            vexpand=True,
+            hscrollbar_policy=Gtk.PolicyType.NEVER,
+        )
+
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        box.append(Adw.Clamp(child=header))
+        box.append(scroller)
+        return box
+
+    @staticmethod
+    def _on_search_row_setup(
+        _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem
+    ) -> None:
+        list_item.set_child(rows.SearchResultRow())
+
+    def _on_search_row_bind(
+        self, _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem
+    ) -> None:
+        row = list_item.get_child()
+        result = list_item.get_item()
+        if isinstance(row, rows.SearchResultRow) and isinstance(result, rows.SearchResult):
+            row.bind(result.entry, self._get_context())
+
+    @staticmethod
+    def _on_search_row_unbind(
+        _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem
+    ) -> None:
+        if isinstance(row := list_item.get_child(), rows.SearchResultRow):
+            row.unbind()
+
+    def _on_search_result_activated(self, _view: Gtk.ListView, position: int) -> None:
+        if self._search_results is None:
+            return
+        result = self._search_results.get_item(position)
+        if isinstance(result, rows.SearchResult):
+            self._reveal_search_entry(result.entry)
+
+    def _reveal_search_entry(self, entry: search.SearchEntry) -> None:
+        """
+        Open the result's page, push the subpages and expand the expanders
+        holding it, then focus its row.
+        """
+        self._show_page(entry.page)
+        idx = self._page_index(entry.page)
+        if idx is None or self._stack is None:
+            return
+        nav = self._stack.get_child_by_name(f"{PAGE_PREFIX}{idx}")
+        if not isinstance(nav, Adw.NavigationView):
+            return
+
+        scope: Gtk.Widget | None = nav.get_visible_page()
+        for container in entry.trail:
+            row = self._find_item_widget(scope, container)
+            if isinstance(row, rows.NavigationRow):
+                scope = row.open_subpage()
+            elif isinstance(row, rows.ExpanderRow):
+                row.set_expanded(True)  # Builds its children right away
+                scope = row
+            else:
+                return  # Rebuilt since the index was made
+        if (target := self._find_item_widget(scope, entry.source)) is not None:
+            # Once laid out, so the page scrolls to it
+            GLib.idle_add(self._focus_widget, target)
+
+    @staticmethod
+    def _focus_widget(widget: Gtk.Widget) -> bool:
+        widget.grab_focus()
+        return GLib.SOURCE_REMOVE
+
+    @staticmethod
+    def _find_item_widget(
+        root: Gtk.Widget | None, item: model.ItemModel
+    ) -> Gtk.Widget | None:
+        """
+        The row or card under `root` built from `item`. Compared by value: an
+        incremental reload keeps the rows (and models) of unchanged sections,
+        while the search index holds the newly compiled, equal models.
+        """
+        pending = [root] if root is not None else []
+        while pending:
+            widget = pending.pop()
+            if getattr(widget, "item", None) == item:
+                return widget
+            child = widget.get_first_child()
+            while child is not None:
+                pending.append(child)
+                child = child.get_next_sibling()
+        return None
+
     def _activate_search(self) -> None:
         """Activate the search bar and focus the entry."""
         if self._search_bar:
@@ -774,12 +1385,12 @@ class DuskyControlCenter(Adw.Application):
         """
         self._state.debounce_source_id = 0
 
-        if self._stack is None or self._search_results_group is None:
+        if self._stack is None or self._search_results is None:
             return GLib.SOURCE_REMOVE
 
         query = query.strip().lower()
         if not query:
-            self._reset_search_results("Search Results")
+            self._reset_search_results()
             return GLib.SOURCE_REMOVE
 
         # Save current page before switching to search
@@ -788,174 +1399,53 @@ class DuskyControlCenter(Adw.Application):
             self._state.last_visible_page = current
 
         self._stack.set_visible_child_name(SEARCH_PAGE_ID)
-        self._reset_search_results(f"Results for '{query}'")
         self._populate_search_results(query)
 
         return GLib.SOURCE_REMOVE
 
-    def _reset_search_results(self, title: str) -> None:
-        """Reset the search results group with a new title."""
-        if self._search_page is None:
-            return
+    def _reset_search_results(self) -> None:
+        """Empty the result list and show the search hint."""
+        if self._search_results is not None:
+            self._search_results.remove_all()
+        self._show_search_status("Search Results", "Type to find a setting")
 
-        toolbar = self._search_page.get_child()
-        if not isinstance(toolbar, Adw.ToolbarView):
+    def _show_search_status(self, title: str, description: str) -> None:
+        if self._search_status is None or self._search_content is None:
             return
-
-        page = toolbar.get_content()
-        if not isinstance(page, Adw.PreferencesPage):
-            return
-
-        if self._search_results_group is not None:
-            page.remove(self._search_results_group)
-
-        self._search_results_group = Adw.PreferencesGroup(title=title)
-        page.add(self._search_results_group)
+        self._search_status.set_title(title)
+        self._search_status.set_description(description)
+        self._search_content.set_visible_child_name("status")
 
     def _populate_search_results(self, query: str) -> None:
-        """Populate search results, limited to prevent UI freeze."""
-        if self._search_results_group is None:
-            return
-
-        count = 0
-        context = self._get_context()
-
-        for match in self._iter_matching_items(query):
-            if count >= SEARCH_MAX_RESULTS:
-                # Add overflow indicator
-                overflow_row = Adw.ActionRow(
-                    title=f"Showing first {SEARCH_MAX_RESULTS} results...",
-                    subtitle="Refine your search for more specific results",
-                )
-                overflow_row.set_activatable(False)
-                overflow_row.add_css_class("dim-label")
-                self._search_results_group.add(overflow_row)
-                break
-
-            self._search_results_group.add(self._build_item_row(match, context))
-            count += 1
-
-        if count == 0:
-            no_results = Adw.ActionRow(
-                title="No results found",
-                subtitle="Try different search terms",
-            )
-            no_results.set_activatable(False)
-            self._search_results_group.add(no_results)
-
-    def _iter_matching_items(self, query: str) -> Iterator[ConfigItem]:
-        """
-        Iterate through all config items matching the search query.
-        """
-        for page in self._state.config.get("pages", []):
-            page_title = str(page.get("title", "Unknown"))
-            yield from self._recursive_search(
-                page.get("layout", []), 
-                query, 
-                page_title
-            )
-
-    def _recursive_search(
-        self,
-        layout: list[ConfigSection],
-        query: str,
-        breadcrumb: str,
-    ) -> Iterator[ConfigItem]:
         """
-        Recursively search through sections and nested layouts.
-        Injects breadcrumb path into the item description for context.
+        Replace the results in one model splice. Bound rows are recycled, so a
+        new query never builds row widgets or starts their pollers.
         """
-        for section in layout:
-            for item in section.get("items", []):
-                # Handle generators in search
-                if item.get("type") == ItemType.DIRECTORY_GENERATOR:
-                    for gen_item in self._process_directory_generator(item):
-                        yield from self._check_item_match(gen_item, query, breadcrumb)
-                else:
-                    yield from self._check_item_match(item, query, breadcrumb)
+        if self._search_results is None or self._search_content is None:
+            return
 
-    def _check_item_match(
-        self,
-        item: ConfigItem,
-        query: str,
-        breadcrumb: str,
-    ) -> Iterator[ConfigItem]:
-        """Check if a single item matches the query and recurse if needed."""
-        props = item.get("properties", {})
-        title = str(props.get("title", "")).lower()
-        desc = str(props.get("description", "")).lower()
-        item_type = item.get("type", "")
-
-        # Exclude navigation/structure items from direct results unless relevant
-        if item_type not in (ItemType.NAVIGATION, ItemType.EXPANDER):
-            if query in title or query in desc:
-                result: ConfigItem = deepcopy(item)
-                result.setdefault("properties", {})
-                original_desc = props.get("description", "")
-                result["properties"]["description"] = (
-                    f"{breadcrumb} • {original_desc}" 
-                    if original_desc 
-                    else breadcrumb
-                )
-                yield result
-
-        # Recurse into nested layouts (NavigationRow)
-        if "layout" in item:
-            sub_title = str(props.get("title", "Submenu"))
-            yield from self._recursive_search(
-                item.get("layout", []),
-                query,
-                f"{breadcrumb} › {sub_title}",
-            )
+        if self._state.search_index is None:
+            self._state.search_index = self._build_search_index(self._state.pages)
 
-        # Recurse into expander items
-        if "items" in item and item_type == ItemType.EXPANDER:
-            sub_title = str(props.get("title", "Expander"))
-            yield from self._search_expander_items(
-                item.get("items", []),
-                query,
-                f"{breadcrumb} › {sub_title}",
-            )
+        # One extra match tells whether the list was truncated
+        matches = self._state.search_index.search(query, limit=SEARCH_MAX_RESULTS + 1)
+        self._search_results.splice(
+            0,
+            self._search_results.get_n_items(),
+            [rows.SearchResult(entry) for entry in matches[:SEARCH_MAX_RESULTS]],
+        )
 
-    def _search_expander_items(
-        self,
-        items: list[ConfigItem],
-        query: str,
-        breadcrumb: str,
-    ) -> Iterator[ConfigItem]:
-        """
-        Search through expander child items recursively.
-        """
-        for item in items:
-            if not isinstance(item, dict):
-                continue
+        if not matches:
+            self._show_search_status("No results found", "Try different search terms")
+            return
 
-            props = item.get("properties", {})
-            title = str(props.get("title", "")).lower()
-            desc = str(props.get("description", "")).lower()
-            item_type = item.get("type", "")
-
-            # Match against query
-            if item_type not in (ItemType.NAVIGATION, ItemType.EXPANDER):
-                if query in title or query in desc:
-                    result: ConfigItem = deepcopy(item)
-                    result.setdefault("properties", {})
-                    original_desc = props.get("description", "")
-                    result["properties"]["description"] = (
-                        f"{breadcrumb} • {original_desc}"
-                        if original_desc
-                        else breadcrumb
-                    )
-                    yield result
-
-            # Recurse into nested expanders
-            if "items" in item and item_type == ItemType.EXPANDER:
-                sub_title = str(props.get("title", "Expander"))
-                yield from self._search_expander_items(
-                    item.get("items", []),
-                    query,
-                    f"{breadcrumb} › {sub_title}",
-                )
+        if self._search_title is not None:
+            self._search_title.set_label(f"Results for '{query}'")
+        if self._search_note is not None:
+            self._search_note.set_visible(len(matches) > SEARCH_MAX_RESULTS)
+        if self._search_view is not None:
+            self._search_view.scroll_to(0, Gtk.ListScrollFlags.NONE, None)
+        self._search_content.set_visible_child_name("results")
 
     # ─────────────────────────────────────────────────────────────────────────
     # SIDEBAR
@@ -1023,11 +1513,14 @@ class DuskyControlCenter(Adw.Application):
             return
 
         idx = row.get_index()
-        pages = self._state.config.get("pages", [])
-        if 0 <= idx < len(pages):
+        if 0 <= idx < len(self._state.pages):
+            self._materialize_page(idx)
+            if (entry := self._state.built_pages.get(idx)) is not None:
+                entry.last_used = time.monotonic()
             page_name = f"{PAGE_PREFIX}{idx}"
             root_tag = f"root_{idx}"
             self._switch_to_page_and_reset(page_name, root_tag)
+            self._evict_pages()
 
     def _on_row_activated(self, listbox: Gtk.ListBox, row: Gtk.ListBoxRow) -> None:
         """Handle sidebar row activation (clicking already selected row)."""
@@ -1049,9 +1542,12 @@ class DuskyControlCenter(Adw.Application):
     # ─────────────────────────────────────────────────────────────────────────
     def _populate_pages(self, select_index: int | None = None) -> None:
         """
-        Create sidebar rows and content pages from config.
+        Create sidebar rows and content page stubs from config.
+
+        Each page starts as an empty NavigationView; its content is built on
+        first selection or by the idle prefetcher.
         """
-        pages = self._state.config.get("pages", [])
+        pages = self._state.pages
         if not pages:
             self._show_empty_state()
             return
@@ -1060,12 +1556,8 @@ class DuskyControlCenter(Adw.Application):
         target_row: Gtk.ListBoxRow | None = None
 
         for idx, page in enumerate(pages):
-            title = str(page.get("title", "Untitled"))
-            icon = str(page.get("icon", ICON_DEFAULT))
-            root_tag = f"root_{idx}"
-
             # Create sidebar row
-            row = self._create_sidebar_row(title, icon)
+            row = self._create_sidebar_row(page.title, page.icon or ICON_DEFAULT)
             
             if self._sidebar_list:
                 self._sidebar_list.append(row)
@@ -1074,32 +1566,206 @@ class DuskyControlCenter(Adw.Application):
                 if idx == select_index:
                     target_row = row
 
-            # Create content page
+            # Create content page stub
             nav = Adw.NavigationView()
-            
-            ctx = self._get_context(
-                nav_view=nav, 
-                builder_func=self._build_nav_page,
-                path=[title]
-            )
-            
-            # Pass root_tag to ensure we can pop back to this specific page
-            root = self._build_nav_page(title, page.get("layout", []), ctx, root_tag=root_tag)
-            nav.add(root)
+            self._state.pending_pages[idx] = self._iter_root_page(nav, idx, page)
 
             if self._stack:
                 self._stack.add_named(nav, f"{PAGE_PREFIX}{idx}")
 
-        # Select appropriate row
+        # Select appropriate row (materializes that page synchronously)
         if self._sidebar_list:
             row_to_select = target_row or first_row
             if row_to_select:
                 self._sidebar_list.select_row(row_to_select)
 
+        if self._window and self._window.get_visible():
+            self._schedule_prefetch()
+
+    def _iter_root_page(
+        self, nav: Adw.NavigationView, idx: int, page: model.PageModel
+    ) -> Iterator[None]:
+        """Build a page's root into its stub, yielding after each section."""
+        rss_before = _resident_kb()
+        clock = time.perf_counter()
+        title = page.title
+        ctx = self._get_context(
+            nav_view=nav,
+            builder_func=self._build_nav_page,
+            path=[title]
+        )
+
+        # Pass root_tag to ensure we can pop back to this specific page
+        slots: list[SectionSlot] = []
+        root, sections = self._begin_nav_page(
+            title, page.layout, ctx, root_tag=f"root_{idx}", slots=slots
+        )
+        nav.add(root)
+
+        # Only time spent building counts, not the idle gaps between slices
+        build_s = time.perf_counter() - clock
+        while True:
+            yield
+            clock = time.perf_counter()
+            done = next(sections, StopIteration) is StopIteration
+            build_s += time.perf_counter() - clock
+            if done:
+                break
+
+        entry = PageCacheEntry(
+            last_used=time.monotonic(),
+            rss_kb=max(0, _resident_kb() - rss_before),
+            build_ms=build_s * 1000,
+            content=self._find_pref_page(root),
+            context=ctx,
+            sections=slots,
+        )
+        self._state.built_pages[idx] = entry
+        PROFILER.add_build(
+            f"page_build:{title}", int(build_s * 1e9),
+            index=idx, sections=len(slots), rss_kb=entry.rss_kb,
+        )
+        log.debug(
+            "Built page %d (%s) in %.1f ms, +%d KiB RSS",
+            idx, title, entry.build_ms, entry.rss_kb,
+        )
+        if (offset := self._state.page_scroll.pop(idx, None)) is not None:
+            self._restore_scroll(nav, offset)
+
+    def _materialize_page(self, idx: int) -> None:
+        """Finish building a page stub right now (no-op once built)."""
+        if (builder := self._state.pending_pages.pop(idx, None)) is not None:
+            with PROFILER.span(f"page:{self._state.pages[idx].title}", index=idx):
+                for _ in builder:
+                    pass
+
+    # ─── Idle Prefetch ───
+    def _schedule_prefetch(self) -> None:
+        """Build the remaining page stubs in the background while visible."""
+        if self._state.prefetch_source_id or not self._state.pending_pages:
+            return
+        self._state.prefetch_source_id = GLib.idle_add(
+            self._on_prefetch_idle, priority=GLib.PRIORITY_LOW
+        )
+
+    def _cancel_prefetch(self) -> None:
+        if self._state.prefetch_source_id:
+            GLib.source_remove(self._state.prefetch_source_id)
+            self._state.prefetch_source_id = 0
+
+    def _on_prefetch_idle(self) -> bool:
+        """Advance pending page builds for at most PREFETCH_SLICE_MS."""
+        pending = self._state.pending_pages
+        deadline = time.monotonic() + PREFETCH_SLICE_MS / 1000
+        while pending and not self._page_cache_full():
+            idx = next(iter(pending))
+            try:
+                # Off-screen rows must not delay the visible page's fetches
+                with rows.prefetching():
+                    next(pending[idx])
+            except StopIteration:
+                del pending[idx]
+            if pending and time.monotonic() >= deadline:
+                return GLib.SOURCE_CONTINUE
+        self._state.prefetch_source_id = 0
+        return GLib.SOURCE_REMOVE
+
+    # ─── Page Cache ───
+    def _page_cache_limits(self) -> tuple[int, int, int]:
+        """Return (max_pages, max_rss_kb, idle_seconds) from config."""
+        cache = self._state.config.get("page_cache") or {}
+        try:
+            max_pages = max(1, int(cache.get("max_pages", PAGE_CACHE_MAX_PAGES)))
+            max_rss_kb = max(0, int(cache.get("max_rss_mb", PAGE_CACHE_MAX_RSS_MB))) * 1024
+            idle = max(0, int(cache.get("idle_timeout", PAGE_CACHE_IDLE_SECONDS)))
+        except (TypeError, ValueError):
+            log.warning("Invalid page_cache config, using defaults")
+            return PAGE_CACHE_MAX_PAGES, PAGE_CACHE_MAX_RSS_MB * 1024, PAGE_CACHE_IDLE_SECONDS
+        return max_pages, max_rss_kb, idle
+
+    def _page_cache_full(self) -> bool:
+        """True once the built pages fill the count or RSS budget."""
+        max_pages, max_rss_kb, _idle = self._page_cache_limits()
+        built = self._state.built_pages
+        if len(built) >= max_pages:
+            return True
+        return bool(max_rss_kb) and sum(e.rss_kb for e in built.values()) >= max_rss_kb
+
+    def _evict_pages(self) -> None:
+        """Tear down least recently used pages that exceed the budget."""
+        max_pages, max_rss_kb, idle = self._page_cache_limits()
+        built = self._state.built_pages
+        # The selected page keeps its widgets, scroll position and nav depth
+        pinned = self._get_current_page_index()
+        now = time.monotonic()
+        total_kb = sum(e.rss_kb for e in built.values())
+
+        for idx in sorted(built, key=lambda i: built[i].last_used):
+            if idx == pinned:
+                continue
+            entry = built[idx]
+            over_count = len(built) > max_pages
+            over_rss = bool(max_rss_kb) and total_kb > max_rss_kb
+            stale = bool(idle) and now - entry.last_used > idle
+            if not (over_count or over_rss or stale):
+                break
+            total_kb -= entry.rss_kb
+            self._evict_page(idx)
+
+    def _evict_page(self, idx: int) -> None:
+        """Replace a built page with a fresh stub."""
+        self._state.built_pages.pop(idx, None)
+        pages = self._state.pages
+        name = f"{PAGE_PREFIX}{idx}"
+        if self._stack is None or not 0 <= idx < len(pages):
+            return
+        if (old := self._stack.get_child_by_name(name)) is None:
+            return
+
+        if (scroller := self._find_scroller(old)) is not None:
+            self._state.page_scroll[idx] = scroller.get_vadjustment().get_value()
+
+        # Removing the page unroots every row, whose do_unroot releases its
+        # pollers, streams and watches
+        self._stack.remove(old)
+        nav = Adw.NavigationView()
+        self._state.pending_pages[idx] = self._iter_root_page(nav, idx, pages[idx])
+        self._stack.add_named(nav, name)
+        log.debug("Evicted page %d from the page cache", idx)
+
+    @staticmethod
+    def _find_scroller(widget: Gtk.Widget) -> Gtk.ScrolledWindow | None:
+        """Depth-first search for the root page's scrolled window."""
+        child = widget.get_first_child()
+        while child is not None:
+            if isinstance(child, Gtk.ScrolledWindow):
+                return child
+            if (found := DuskyControlCenter._find_scroller(child)) is not None:
+                return found
+            child = child.get_next_sibling()
+        return None
+
+    def _restore_scroll(self, nav: Adw.NavigationView, offset: float) -> None:
+        """Scroll a rebuilt page back once its content has been measured."""
+        if offset <= 0 or (scroller := self._find_scroller(nav)) is None:
+            return
+        adjustment = scroller.get_vadjustment()
+
+        def on_changed(adj: Gtk.Adjustment) -> None:
+            adj.set_value(offset)
+            if adj.get_upper() - adj.get_page_size() >= offset:
+                adj.disconnect(handler_id)
+
+        handler_id = adjustment.connect("changed", on_changed)
+
     def _create_sidebar_row(self, title: str, icon_name: str) -> Gtk.ListBoxRow:
         """Create a styled sidebar navigation row."""
         row = Gtk.ListBoxRow(css_classes=["sidebar-row"])
-        
+        row.set_child(self._create_sidebar_row_content(title, icon_name))
+        return row
+
+    def _create_sidebar_row_content(self, title: str, icon_name: str) -> Gtk.Box:
+        """Create the icon and label of a sidebar row."""
         box = Gtk.Box()
         
         icon = Gtk.Image.new_from_icon_name(icon_name)
@@ -1115,23 +1781,39 @@ class DuskyControlCenter(Adw.Application):
         
         box.append(icon)
         box.append(label)
-        row.set_child(box)
-        
-        return row
+        return box
 
     def _build_nav_page(
         self, 
         title: str, 
-        layout: list[ConfigSection], 
+        layout: tuple[model.SectionModel, ...], 
         ctx: RowContext,
         root_tag: str | None = None
     ) -> Adw.NavigationPage:
         """
         Build a navigation page with toolbar and preferences content.
         """
+        page, sections = self._begin_nav_page(title, layout, ctx, root_tag)
+        for _ in sections:
+            pass
+        return page
+
+    def _begin_nav_page(
+        self,
+        title: str,
+        layout: tuple[model.SectionModel, ...],
+        ctx: RowContext,
+        root_tag: str | None = None,
+        slots: list[SectionSlot] | None = None,
+    ) -> tuple[Adw.NavigationPage, Iterator[None]]:
+        """
+        Build the page shell; its sections are added as the iterator advances
+        and recorded in `slots` when given.
+        """
         # Determine Path and Tag
         path = ctx.get("path", [title])
-        tag = root_tag if root_tag else f"page_{len(path)}_{title.replace(' ', '_')}"
+        # Cached subpages stay in the view, so tags must be unique per path
+        tag = root_tag if root_tag else "page_" + "/".join(path).replace(" ", "_")
         
         page = Adw.NavigationPage(title=title, tag=tag)
 
@@ -1156,48 +1838,77 @@ class DuskyControlCenter(Adw.Application):
         toolbar.add_top_bar(header)
 
         pref_page = Adw.PreferencesPage()
-        self._populate_pref_content(pref_page, layout, ctx)
-
         toolbar.set_content(pref_page)
         page.set_child(toolbar)
-        return page
-
-    def _populate_pref_content(
+        return page, self._iter_pref_content(pref_page, layout, ctx, slots)
+
+    @staticmethod
+    def _find_pref_page(page: Adw.NavigationPage) -> Adw.PreferencesPage | None:
+        toolbar = page.get_child()
+        if isinstance(toolbar, Adw.ToolbarView):
+            content = toolbar.get_content()
+            if isinstance(content, Adw.PreferencesPage):
+                return content
+        return None
+
+    def _iter_pref_content(
         self,
         page: Adw.PreferencesPage,
-        layout: list[ConfigSection],
+        layout: tuple[model.SectionModel, ...],
         ctx: RowContext,
-    ) -> None:
-        """Populate a preferences page with sections and items."""
+        slots: list[SectionSlot] | None = None,
+    ) -> Iterator[None]:
+        """Populate a preferences page with sections, yielding after each."""
         for section in layout:
-            section_type = section.get("type", SectionType.SECTION)
+            with PROFILER.span(
+                f"section:{section.title or section.type}", items=len(section.items)
+            ):
+                slot = self._build_section(section, ctx)
+            page.add(slot.group)
+            if slots is not None:
+                slots.append(slot)
+            yield
+
+    def _build_section(
+        self, section: model.SectionModel, ctx: RowContext
+    ) -> SectionSlot:
+        """Build one section as a preferences group."""
+        slot = SectionSlot(section, Adw.PreferencesGroup())
+        self._fill_section(slot, section, ctx)
+        return slot
+
+    def _fill_section(
+        self, slot: SectionSlot, section: model.SectionModel, ctx: RowContext
+    ) -> None:
+        """(Re)populate a section's group, replacing any rows it holds."""
+        group = slot.group
+        for child in slot.children:
+            group.remove(child)
+
+        if section.type == SectionType.GRID_SECTION:
+            children = self._build_grid_section(group, section, ctx)
+        elif section.item is not None:
+            # Single-item implicit section
+            group.set_title("")
+            group.set_description(None)
+            children = [self._build_item_row(section.item, ctx)]
+        else:
+            children = self._build_standard_section(group, section, ctx)
 
-            if section_type == SectionType.GRID_SECTION:
-                page.add(self._build_grid_section(section, ctx))
-            elif "items" in section:
-                page.add(self._build_standard_section(section, ctx))
-            else:
-                # Treat as single-item implicit section
-                group = Adw.PreferencesGroup()
-                # Safely convert section to item (they share structure)
-                item: ConfigItem = {
-                    "type": section.get("type", ""),
-                    "properties": section.get("properties", {}),
-                }
-                group.add(self._build_item_row(item, ctx))
-                page.add(group)
+        for child in children:
+            group.add(child)
+        slot.section = section
+        slot.children = children
 
     def _build_grid_section(
-        self, 
-        section: ConfigSection, 
+        self,
+        group: Adw.PreferencesGroup,
+        section: model.SectionModel,
         ctx: RowContext
-    ) -> Adw.PreferencesGroup:
-        """Build a grid section with flow box layout."""
-        group = Adw.PreferencesGroup()
-        props = section.get("properties", {})
-
-        if title := props.get("title"):
-            group.set_title(GLib.markup_escape_text(str(title)))
+    ) -> list[Gtk.Widget]:
+        """Build a grid section's flow box of cards."""
+        group.set_title(GLib.markup_escape_text(section.title))
+        group.set_description(None)
 
         flow = Gtk.FlowBox()
         flow.set_valign(Gtk.Align.START)
@@ -1207,127 +1918,85 @@ class DuskyControlCenter(Adw.Application):
         flow.set_min_children_per_line(2)
         flow.set_max_children_per_line(3)
 
-        for item in section.get("items", []):
-            item_type = item.get("type", "")
-            item_props = item.get("properties", {})
-            
-            if item_type == ItemType.TOGGLE_CARD:
-                card = rows.GridToggleCard(item_props, item.get("on_toggle"), ctx)
+        for item in section.items:
+            if item.type == ItemType.TOGGLE_CARD:
+                card = rows.GridToggleCard(item, ctx)
             else:
-                card = rows.GridCard(item_props, item.get("on_press"), ctx)
+                card = rows.GridCard(item, ctx)
             
             flow.append(card)
 
-        group.add(flow)
-        return group
+        return [flow]
 
     def _build_standard_section(
-        self, 
-        section: ConfigSection, 
+        self,
+        group: Adw.PreferencesGroup,
+        section: model.SectionModel,
         ctx: RowContext
-    ) -> Adw.PreferencesGroup:
-        """Build a standard preferences group with row items."""
-        group = Adw.PreferencesGroup()
-        props = section.get("properties", {})
-
-        if title := props.get("title"):
-            group.set_title(GLib.markup_escape_text(str(title)))
-        if desc := props.get("description"):
-            group.set_description(GLib.markup_escape_text(str(desc)))
-
-        for item in section.get("items", []):
-            if item.get("type") == ItemType.DIRECTORY_GENERATOR:
-                for gen_item in self._process_directory_generator(item):
-                    group.add(self._build_item_row(gen_item, ctx))
-            else:
-                group.add(self._build_item_row(item, ctx))
-
-        return group
-
-    def _process_directory_generator(self, config: ConfigItem) -> Iterator[ConfigItem]:
-        """Generate items based on directory contents."""
-        props = config.get("properties", {})
-        path_str = props.get("path")
-        if not path_str:
-            return
+    ) -> list[Gtk.Widget]:
+        """Build a standard section's row items."""
+        group.set_title(GLib.markup_escape_text(section.title))
+        group.set_description(
+            GLib.markup_escape_text(section.description) if section.description else None
+        )
 
-        base_path = Path(path_str).expanduser()
-        if not base_path.exists() or not base_path.is_dir():
-            return
+        children: list[Gtk.Widget] = []
+        for item in section.items:
+            if item.type == ItemType.DIRECTORY_GENERATOR:
+                for gen_item in self._expand_generator(item):
+                    children.append(self._build_item_row(gen_item, ctx))
+            else:
+                children.append(self._build_item_row(item, ctx))
 
-        template = config.get("item_template")
-        if not template:
-            return
+        return children
 
-        # List directories
-        try:
-            dirs = sorted([p for p in base_path.iterdir() if p.is_dir()])
-        except OSError:
-            return
+    def _expand_generator(self, item: model.ItemModel) -> tuple[model.ItemModel, ...]:
+        """Compiled items of a directory generator (cached until it changes)."""
+        return self._state.generators.expand(item)
 
-        for d in dirs:
-            item = deepcopy(template)
-            name_pretty = d.name.replace('_', ' ').title()
-            variables = {"name": d.name, "path": str(d), "name_pretty": name_pretty}
-            yield self._inject_variables(item, variables)
-
-    def _inject_variables(self, item: Any, vars: dict[str, str]) -> Any:
-        """Recursively replace variables in strings."""
-        if isinstance(item, str):
-            res = item
-            for k, v in vars.items():
-                res = res.replace(f"{{{k}}}", v)
-            return res
-        elif isinstance(item, list):
-            return [self._inject_variables(x, vars) for x in item]
-        elif isinstance(item, dict):
-            return {k: self._inject_variables(v, vars) for k, v in item.items()}
-        return item
+    def _on_generator_changed(self) -> None:
+        """A generator directory changed: the search index is out of date."""
+        self._state.search_index = None
+        if self._search_entry is not None and (query := self._search_entry.get_text()):
+            self._execute_search(query)
 
     def _build_item_row(
         self, 
-        item: ConfigItem, 
+        item: model.ItemModel, 
         ctx: RowContext
     ) -> Adw.PreferencesRow:
         """
-        Build the appropriate row widget for a config item.
+        Build the appropriate row widget for a compiled config item.
         """
-        item_type = item.get("type", "")
-        props = item.get("properties", {})
-
         try:
-            match item_type:
-                case ItemType.BUTTON:
-                    return rows.ButtonRow(props, item.get("on_press"), ctx)
-                case ItemType.TOGGLE:
-                    return rows.ToggleRow(props, item.get("on_toggle"), ctx)
-                case ItemType.GRID_CARD:
-                    return rows.ButtonRow(props, item.get("on_press"), ctx)
-                case ItemType.TOGGLE_CARD:
-                    return rows.ToggleRow(props, item.get("on_toggle"), ctx)
+            match item.type:
+                case ItemType.BUTTON | ItemType.GRID_CARD:
+                    return rows.ButtonRow(item, ctx)
+                case ItemType.TOGGLE | ItemType.TOGGLE_CARD:
+                    return rows.ToggleRow(item, ctx)
                 case ItemType.LABEL:
-                    return rows.LabelRow(props, item.get("value"), ctx)
+                    return rows.LabelRow(item, ctx)
                 case ItemType.SLIDER:
-                    return rows.SliderRow(props, item.get("on_change"), ctx)
+                    return rows.SliderRow(item, ctx)
                 case ItemType.SELECTION:
-                    return rows.SelectionRow(props, item.get("on_change"), ctx)
+                    return rows.SelectionRow(item, ctx)
                 case ItemType.ENTRY:
-                    return rows.EntryRow(props, item.get("on_action"), ctx)
+                    return rows.EntryRow(item, ctx)
                 case ItemType.NAVIGATION:
-                    return rows.NavigationRow(props, item.get("layout"), ctx)
+                    return rows.NavigationRow(item, ctx)
                 case ItemType.EXPANDER:
-                    return rows.ExpanderRow(props, item.get("items"), ctx)
+                    return rows.ExpanderRow(item, ctx)
                 case ItemType.WARNING_BANNER:
-                    return self._build_warning_banner(props)
+                    return self._build_warning_banner(item.properties)
                 case _:
-                    log.warning("Unknown item type '%s', defaulting to button", item_type)
-                    return rows.ButtonRow(props, item.get("on_press"), ctx)
+                    log.warning("Unknown item type '%s', defaulting to button", item.type)
+                    return rows.ButtonRow(item, ctx)
         except Exception as e:
-            log.error("Failed to build row for type '%s': %s", item_type, e)
+            log.error("Failed to build row for type '%s': %s", item.type, e)
             # Return error placeholder row
-            return self._build_error_row(str(e), props.get("title", "Unknown"))
+            return self._build_error_row(str(e), item.title)
 
-    def _build_warning_banner(self, props: ItemProperties) -> Adw.PreferencesRow:
+    def _build_warning_banner(self, props: Mapping[str, Any]) -> Adw.PreferencesRow:
         """Build a warning banner row."""
         row = Adw.PreferencesRow(css_classes=["action-row"])
 
@@ -1435,7 +2104,7 @@ class DuskyControlCenter(Adw.Application):
 # =============================================================================
 def main() -> int:
     """Application entry point."""
-    app = DuskyControlCenter()
+    app = DuskyControlCenter(_launch_request)
     return app.run(sys.argv)
 
 
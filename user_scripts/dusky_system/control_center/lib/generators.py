@@ -0,0 +1,264 @@
+"""
+Directory generator expansion for the Dusky Control Center.
+
+A `directory_generator` item expands to one compiled item per subdirectory
+of its `path`, built from `item_template` with `{name}`, `{name_pretty}` and
+`{path}` filled in. `sort` orders the entries: `name` (default,
+case-insensitive), `name_desc`, `newest`, `oldest` or `none` (directory
+order).
+
+Expansions are cached per directory and reused until it changes, so page
+builds and search indexing neither list the directory nor rebuild the
+template when nothing happened. A directory monitor marks an entry stale;
+where none is available the directory's mtime is compared instead. Entries
+no expansion used since a `mark` are dropped by `prune`, so generators that
+left the config stop being watched.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import stat
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+from gi.repository import Gio, GLib
+
+from lib.model import ItemModel, compile_item
+
+__all__ = [
+    "GeneratorCache",
+]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+SORT_NAME: Final[str] = "name"
+# Directory entry -> sort key and whether the order is descending
+_SORT_ORDERS: Final[dict[str, tuple[Callable[[os.DirEntry[str]], object], bool]]] = {
+    SORT_NAME: (lambda e: e.name.casefold(), False),
+    "name_desc": (lambda e: e.name.casefold(), True),
+    "newest": (lambda e: e.stat().st_mtime_ns, True),
+    "oldest": (lambda e: e.stat().st_mtime_ns, False),
+}
+SORT_NONE: Final[str] = "none"
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+@dataclass(slots=True)
+class _Expansion:
+    template: Mapping[str, object]
+    items: tuple[ItemModel, ...]
+    mtime_ns: int  # -1: the directory did not exist
+    generation: int
+    monitor: Gio.FileMonitor | None = None
+    stale: bool = False
+
+
+class GeneratorCache:
+    """
+    Expanded generator items keyed by (directory, sort).
+
+    `expand` may run on the reload worker thread; monitors are always
+    attached on the main loop so their events are delivered there.
+    `on_change` is called on the main thread when a watched directory changes.
+    """
+
+    __slots__ = ("_entries", "_generation", "_lock", "_on_change")
+
+    def __init__(self, on_change: Callable[[], None] | None = None) -> None:
+        self._entries: dict[tuple[Path, str], _Expansion] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._on_change = on_change
+
+    def expand(self, item: ItemModel) -> tuple[ItemModel, ...]:
+        """Compiled items of a directory generator."""
+        path_str = str(item.properties.get("path") or "")
+        if not path_str or not item.template:
+            return ()
+        path = Path(path_str).expanduser()
+        sort = str(item.properties.get("sort") or SORT_NAME).lower()
+        key = (path, sort)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.template == item.template
+                and not entry.stale
+                and (entry.monitor is not None or entry.mtime_ns == _mtime_ns(path))
+            ):
+                entry.generation = self._generation
+                return entry.items
+
+        mtime_ns = _mtime_ns(path)
+        items = _expand(path, sort, item.template) if mtime_ns >= 0 else ()
+        with self._lock:
+            old = self._entries.get(key)
+            monitor = old.monitor if old is not None else None
+            self._entries[key] = _Expansion(
+                item.template, items, mtime_ns, self._generation, monitor
+            )
+        if monitor is None:
+            _call_on_main(self._watch, key)
+        log.debug("Expanded %s: %d items", path, len(items))
+        return items
+
+    def mark(self) -> int:
+        """Start a generation; pass the result to `prune` once it is built."""
+        with self._lock:
+            self._generation += 1
+            return self._generation
+
+    def prune(self, generation: int) -> None:
+        """Drop expansions not used since `mark` returned `generation`."""
+        with self._lock:
+            unused = [
+                key for key, entry in self._entries.items()
+                if entry.generation < generation
+            ]
+            dropped = [self._entries.pop(key) for key in unused]
+        for entry in dropped:
+            if entry.monitor is not None:
+                entry.monitor.cancel()
+        if dropped:
+            log.debug("Pruned %d generator expansions", len(dropped))
+
+    def clear(self) -> None:
+        """Drop every expansion and stop watching."""
+        with self._lock:
+            entries, self._entries = self._entries, {}
+        for entry in entries.values():
+            if entry.monitor is not None:
+                entry.monitor.cancel()
+
+    # ─── Directory Monitors ───
+    def _watch(self, key: tuple[Path, str]) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.monitor is not None:
+                return GLib.SOURCE_REMOVE
+        monitor = _create_directory_monitor(key[0])
+        if monitor is None:
+            return GLib.SOURCE_REMOVE  # Validated by mtime instead
+        monitor.connect("changed", self._on_directory_changed, key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.monitor is None:
+                entry.monitor = monitor
+                # Catch a change between the listing and the watch
+                entry.stale = entry.mtime_ns != _mtime_ns(key[0])
+                return GLib.SOURCE_REMOVE
+        monitor.cancel()
+        return GLib.SOURCE_REMOVE
+
+    def _on_directory_changed(
+        self,
+        _monitor: Gio.FileMonitor,
+        _file: Gio.File,
+        _other: Gio.File | None,
+        event: Gio.FileMonitorEvent,
+        key: tuple[Path, str],
+    ) -> None:
+        # Only the set of subdirectories matters, not their contents
+        if event in (
+            Gio.FileMonitorEvent.CHANGED,
+            Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+            Gio.FileMonitorEvent.ATTRIBUTE_CHANGED,
+        ):
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.stale:
+                return
+            entry.stale = True
+        log.debug("Generator directory changed: %s", key[0])
+        if self._on_change is not None:
+            self._on_change()
+
+
+# =============================================================================
+# EXPANSION
+# =============================================================================
+def _expand(
+    path: Path, sort: str, template: Mapping[str, object]
+) -> tuple[ItemModel, ...]:
+    try:
+        with os.scandir(path) as it:
+            dirs = [e for e in it if e.is_dir()]
+        if sort != SORT_NONE:
+            order = _SORT_ORDERS.get(sort)
+            if order is None:
+                log.warning("Unknown generator sort '%s' for %s, using name", sort, path)
+                order = _SORT_ORDERS[SORT_NAME]
+            key, reverse = order
+            dirs.sort(key=key, reverse=reverse)
+    except OSError as e:
+        log.debug("Cannot list %s: %s", path, e)
+        return ()
+
+    items = []
+    for d in dirs:
+        variables = {
+            "name": d.name,
+            "path": d.path,
+            "name_pretty": d.name.replace("_", " ").title(),
+        }
+        expanded = _inject_variables(template, variables)
+        if isinstance(expanded, dict):
+            items.append(compile_item(expanded))
+    return tuple(items)
+
+
+def _inject_variables(value: object, variables: dict[str, str]) -> object:
+    """Recursively replace `{name}` style variables in strings."""
+    if isinstance(value, str):
+        for k, v in variables.items():
+            value = value.replace(f"{{{k}}}", v)
+        return value
+    if isinstance(value, list):
+        return [_inject_variables(x, variables) for x in value]
+    if isinstance(value, Mapping):
+        return {k: _inject_variables(v, variables) for k, v in value.items()}
+    return value
+
+
+# ─── Helpers ───
+def _mtime_ns(path: Path) -> int:
+    """The directory's mtime, or -1 if it is missing or not a directory."""
+    try:
+        info = path.stat()
+    except OSError:
+        return -1
+    return info.st_mtime_ns if stat.S_ISDIR(info.st_mode) else -1
+
+
+def _create_directory_monitor(path: Path) -> Gio.FileMonitor | None:
+    """Watch a directory's entries. None means mtime checks must be used."""
+    try:
+        monitor = Gio.File.new_for_path(str(path)).monitor_directory(
+            Gio.FileMonitorFlags.WATCH_MOVES, None
+        )
+    except GLib.Error as e:
+        log.debug("Cannot watch %s: %s", path, e.message)
+        return None
+    # GIO silently degrades to stat() polling when no kernel backend is usable
+    if monitor.__gtype__.name == "GPollFileMonitor":
+        monitor.cancel()
+        return None
+    return monitor
+
+
+def _call_on_main(func: Callable[..., bool], *args: object) -> None:
+    if threading.current_thread() is threading.main_thread():
+        func(*args)
+    else:
+        GLib.idle_add(func, *args)
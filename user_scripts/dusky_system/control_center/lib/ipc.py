@@ -0,0 +1,207 @@
+"""
+Client fast path for the Dusky Control Center daemon.
+
+A second launch normally pays for pycache setup, `lib.utility`, `yaml`, the
+preflight check and the `gi`/Gtk/Adw imports before GApplication uniqueness
+forwards the activation. The running daemon therefore also listens on a Unix
+socket in `$XDG_RUNTIME_DIR`; a launcher that reaches it sends one request
+line and exits. This module must stay free of `gi` and `yaml` imports.
+
+Protocol: the client sends one JSON line `{"action": ..., "argument": ...}`
+and the daemon answers `ok` once the request is queued on the main loop.
+"""
+from __future__ import annotations
+
+import errno
+import json
+import logging
+import os
+import socket
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+__all__ = [
+    "Request",
+    "bind_server",
+    "close_server",
+    "parse_args",
+    "read_request",
+    "send",
+    "socket_path",
+]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+SOCKET_NAME: Final[str] = "duskycc.sock"
+CLIENT_TIMEOUT: Final[float] = 0.5  # Seconds; a wedged daemon falls back to a full launch
+SERVER_READ_TIMEOUT: Final[float] = 0.2
+MAX_REQUEST_BYTES: Final[int] = 4096
+REPLY_OK: Final[bytes] = b"ok\n"
+
+ACTION_PRESENT: Final[str] = "present"
+ACTION_PAGE: Final[str] = "page"
+ACTION_SEARCH: Final[str] = "search"
+_OPTION_ACTIONS: Final[dict[str, str]] = {
+    "--page": ACTION_PAGE,
+    "--search": ACTION_SEARCH,
+}
+
+
+# =============================================================================
+# REQUESTS
+# =============================================================================
+@dataclass(frozen=True, slots=True)
+class Request:
+    """Present the window, optionally on a page (id or title) or a search."""
+
+    action: str = ACTION_PRESENT
+    argument: str = ""
+
+    def encode(self) -> bytes:
+        return json.dumps({"action": self.action, "argument": self.argument}).encode() + b"\n"
+
+    @classmethod
+    def decode(cls, data: bytes) -> Request | None:
+        try:
+            fields = json.loads(data)
+        except (ValueError, UnicodeDecodeError):
+            return None
+        if not isinstance(fields, dict):
+            return None
+        action = fields.get("action")
+        argument = fields.get("argument", "")
+        if action not in (ACTION_PRESENT, ACTION_PAGE, ACTION_SEARCH):
+            return None
+        if not isinstance(argument, str):
+            return None
+        return cls(action, argument)
+
+
+def parse_args(args: list[str]) -> tuple[Request, list[str]]:
+    """
+    Extract `--page ID` and `--search QUERY` (also `--opt=value`).
+    Returns the request and the arguments left for GApplication.
+    """
+    request = Request()
+    remaining: list[str] = []
+    it = iter(args)
+    for arg in it:
+        option, sep, value = arg.partition("=")
+        if option not in _OPTION_ACTIONS:
+            remaining.append(arg)
+            continue
+        if not sep:
+            value = next(it, "")
+        request = Request(_OPTION_ACTIONS[option], value)
+    return request, remaining
+
+
+def socket_path() -> Path:
+    """Per-user socket path (runtime dir, or /tmp keyed by uid)."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "").strip()
+    if runtime_dir:
+        return Path(runtime_dir) / SOCKET_NAME
+    return Path("/tmp") / f"duskycc-{os.getuid()}.sock"
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+def send(request: Request, path: Path | None = None) -> bool:
+    """Deliver a request to the running daemon. False if none answered."""
+    path = path or socket_path()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.connect(str(path))
+            sock.sendall(request.encode())
+            return sock.recv(len(REPLY_OK)) == REPLY_OK
+    except OSError:
+        return False
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+def bind_server(path: Path | None = None) -> socket.socket | None:
+    """
+    Listen on the daemon socket. A stale socket file left by a crashed daemon
+    is replaced; None means another live daemon already owns it.
+    """
+    path = path or socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            _bind_private(sock, path)
+        except OSError as e:
+            if e.errno != errno.EADDRINUSE or _is_listening(path):
+                raise
+            path.unlink(missing_ok=True)
+            _bind_private(sock, path)
+        sock.listen(8)
+        sock.setblocking(False)
+    except OSError as e:
+        log.warning("Launcher socket unavailable (%s): %s", path, e)
+        sock.close()
+        return None
+    return sock
+
+
+def _bind_private(sock: socket.socket, path: Path) -> None:
+    """Bind with the socket file created mode 0600."""
+    old_umask = os.umask(0o177)
+    try:
+        sock.bind(str(path))
+    finally:
+        os.umask(old_umask)
+
+
+def _is_listening(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(CLIENT_TIMEOUT)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def read_request(server: socket.socket) -> Request | None:
+    """Accept one pending client and read its request (acknowledged)."""
+    try:
+        conn, _addr = server.accept()
+    except (BlockingIOError, InterruptedError):
+        return None
+    except OSError as e:
+        log.debug("Launcher socket accept failed: %s", e)
+        return None
+
+    with conn:
+        conn.settimeout(SERVER_READ_TIMEOUT)
+        data = b""
+        try:
+            while b"\n" not in data and len(data) < MAX_REQUEST_BYTES:
+                chunk = conn.recv(MAX_REQUEST_BYTES)
+                if not chunk:
+                    break
+                data += chunk
+            request = Request.decode(data)
+            if request is not None:
+                conn.sendall(REPLY_OK)
+        except OSError as e:
+            log.debug("Launcher request failed: %s", e)
+            return None
+    if request is None:
+        log.warning("Ignoring malformed launcher request: %r", data[:80])
+    return request
+
+
+def close_server(server: socket.socket, path: Path | None = None) -> None:
+    """Stop listening and remove the socket file."""
+    path = path or socket_path()
+    server.close()
+    path.unlink(missing_ok=True)
@@ -0,0 +1,279 @@
+"""
+Compiled configuration model for the Dusky Control Center.
+
+`compile_pages` turns the loaded YAML document into frozen, slotted
+dataclasses once per (re)load: defaults are resolved, numbers and intervals
+parsed, paths expanded and commands stripped. Row widgets read these fields
+directly instead of re-validating raw dicts at construction time.
+
+The frozen fields cannot be reassigned, but the action and source specs
+(`action`, `value`, `state_command`, `value_command`, `template`) stay the
+plain dicts of the document: they are compiled into commands and sources
+when a row resolves them (lib.pipeline, the poll scheduler), not here.
+Command strings are only stripped, not tokenised. `properties` is a
+read-only copy kept for the long tail of rarely used keys such as linked
+`buttons` or banner text. Models compare by value, which the incremental
+reload relies on, but are unhashable.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Final
+
+__all__ = [
+    "DEFAULT_ICON",
+    "IconSpec",
+    "ItemModel",
+    "PageModel",
+    "SectionModel",
+    "compile_item",
+    "compile_pages",
+]
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+DEFAULT_ICON: Final[str] = "utilities-terminal-symbolic"
+
+# Config key holding each item type's action
+_ACTION_KEYS: Final[dict[str, str]] = {
+    "toggle": "on_toggle",
+    "toggle_card": "on_toggle",
+    "slider": "on_change",
+    "selection": "on_change",
+    "entry": "on_action",
+}
+_DEFAULT_TITLES: Final[dict[str, str]] = {
+    "expander": "Expander",
+    "toggle_card": "Toggle",
+}
+_EMPTY: Final[Mapping[str, object]] = MappingProxyType({})
+
+
+# =============================================================================
+# MODEL
+# =============================================================================
+@dataclass(frozen=True, slots=True)
+class IconSpec:
+    """A prefix/card icon: static name, image file or polled command."""
+
+    name: str = DEFAULT_ICON
+    file: Path | None = None  # Expanded path of a `type: file` icon
+    command: str = ""  # `type: exec` icon command
+    interval: int | None = None
+    max_interval: int | None = None
+
+    @property
+    def dynamic(self) -> bool:
+        """Whether the icon is refreshed from its command."""
+        return bool(self.command) and (self.interval or 0) > 0
+
+
+@dataclass(frozen=True, slots=True)
+class ItemModel:
+    """A single widget. Intervals are None when not configured."""
+
+    __hash__ = None  # type: ignore[assignment]  # Holds dicts: compare, never hash
+
+    type: str
+    title: str
+    description: str = ""
+    icon: IconSpec = IconSpec()
+    properties: Mapping[str, object] = field(default_factory=lambda: _EMPTY)
+    action: Mapping[str, object] | None = None
+    value: object = None  # LabelRow ValueConfig
+    interval: int | None = None
+    max_interval: int | None = None
+    style: str = "default"
+    button_text: str | None = None
+    key: str = ""
+    key_inverse: bool = False
+    save_as_int: bool = False
+    state_command: object = None  # str or source mapping
+    value_command: object = None  # str or source mapping
+    options: tuple[str, ...] = ()
+    options_command: str = ""
+    minimum: float = 0.0
+    maximum: float = 100.0
+    step: float = 1.0
+    default: float = 0.0
+    debounce: bool = True
+    text_file: str = ""  # button_text_file
+    badge_file: str = ""
+    children: tuple[ItemModel, ...] = ()  # Expander items
+    layout: tuple[SectionModel, ...] = ()  # Navigation subpage
+    template: Mapping[str, object] | None = None  # Directory generator
+
+
+@dataclass(frozen=True, slots=True)
+class SectionModel:
+    """A preferences group; `item` is set for single-item implicit sections."""
+
+    __hash__ = None  # type: ignore[assignment]
+
+    type: str
+    title: str = ""
+    description: str = ""
+    items: tuple[ItemModel, ...] = ()
+    item: ItemModel | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PageModel:
+    """A sidebar page."""
+
+    __hash__ = None  # type: ignore[assignment]
+
+    title: str
+    id: str = ""
+    icon: str = ""  # Empty: the sidebar's default icon
+    layout: tuple[SectionModel, ...] = ()
+
+
+# =============================================================================
+# COMPILATION
+# =============================================================================
+def compile_pages(config: Mapping[str, object]) -> tuple[PageModel, ...]:
+    """Compile every page of a loaded config document."""
+    pages = config.get("pages")
+    if not isinstance(pages, list):
+        return ()
+    return tuple(
+        PageModel(
+            title=str(page.get("title", "Untitled")),
+            id=str(page.get("id", "")),
+            icon=str(page.get("icon") or ""),
+            layout=compile_layout(page.get("layout")),
+        )
+        for page in pages
+        if isinstance(page, dict)
+    )
+
+
+def compile_layout(layout: object) -> tuple[SectionModel, ...]:
+    """Compile a list of sections (a page or subpage body)."""
+    if not isinstance(layout, list):
+        return ()
+    return tuple(
+        _compile_section(section) for section in layout if isinstance(section, dict)
+    )
+
+
+def _compile_section(section: Mapping[str, object]) -> SectionModel:
+    props = _mapping(section.get("properties"))
+    section_type = str(section.get("type", "section"))
+    if "items" not in section and section_type != "grid_section":
+        # Single-item implicit section: the section itself is the item
+        return SectionModel(type=section_type, item=compile_item(section))
+    return SectionModel(
+        type=section_type,
+        title=str(props.get("title") or ""),
+        description=str(props.get("description") or ""),
+        items=_compile_items(section.get("items")),
+    )
+
+
+def _compile_items(items: object) -> tuple[ItemModel, ...]:
+    if not isinstance(items, list):
+        return ()
+    return tuple(compile_item(item) for item in items if isinstance(item, dict))
+
+
+def compile_item(item: Mapping[str, object]) -> ItemModel:
+    """Compile one item config (also used for generated and search items)."""
+    item_type = str(item.get("type", "")).lower()
+    props = _mapping(item.get("properties"))
+    minimum = _as_float(props.get("min"), 0.0)
+    step = _as_float(props.get("step"), 1.0)
+    text = props.get("button_text")
+    options = props.get("options")
+    action = item.get(_ACTION_KEYS.get(item_type, "on_press"))
+
+    return ItemModel(
+        type=item_type,
+        title=str(props.get("title", _DEFAULT_TITLES.get(item_type, "Unnamed"))),
+        description=str(props.get("description") or ""),
+        icon=_compile_icon(props.get("icon", DEFAULT_ICON)),
+        properties=MappingProxyType(dict(props)) if props else _EMPTY,
+        action=action if isinstance(action, dict) else None,
+        value=item.get("value"),
+        interval=_as_int(props.get("min_interval", props.get("interval"))),
+        max_interval=_as_int(props.get("max_interval")),
+        style=str(props.get("style", "default")).lower(),
+        button_text=None if text is None else str(text),
+        key=str(props.get("key") or "").strip(),
+        key_inverse=bool(props.get("key_inverse", False)),
+        save_as_int=bool(props.get("save_as_int", False)),
+        state_command=_command(props.get("state_command")),
+        value_command=_command(props.get("value_command")),
+        options=tuple(str(o) for o in options) if isinstance(options, list) else (),
+        options_command=str(props.get("options_command") or "").strip(),
+        minimum=minimum,
+        maximum=_as_float(props.get("max"), 100.0),
+        step=step if step > 1e-9 else 1.0,
+        default=_as_float(props.get("default"), minimum),
+        debounce=bool(props.get("debounce", True)),
+        text_file=str(props.get("button_text_file") or ""),
+        badge_file=str(props.get("badge_file") or ""),
+        children=_compile_items(item.get("items")),
+        layout=compile_layout(item.get("layout")),
+        template=_mapping(item.get("item_template")) or None,
+    )
+
+
+def _compile_icon(icon: object) -> IconSpec:
+    if isinstance(icon, str):
+        return IconSpec(name=icon or DEFAULT_ICON)
+    if not isinstance(icon, dict):
+        return IconSpec()
+
+    name = str(icon.get("name", DEFAULT_ICON))
+    match icon.get("type"):
+        case "file":
+            path = icon.get("path")
+            return IconSpec(name=name, file=Path(str(path)).expanduser() if path else None)
+        case "exec":
+            return IconSpec(
+                name=name,
+                command=str(icon.get("command") or "").strip(),
+                interval=_as_int(icon.get("min_interval", icon.get("interval"))),
+                max_interval=_as_int(icon.get("max_interval")),
+            )
+    return IconSpec(name=name)
+
+
+# ─── Coercion Helpers ───
+def _mapping(value: object) -> Mapping[str, object]:
+    return value if isinstance(value, dict) else _EMPTY
+
+
+def _command(value: object) -> object:
+    """Strip command strings; source mappings pass through; empty is None."""
+    if isinstance(value, str):
+        return value.strip() or None
+    return value if isinstance(value, dict) else None
+
+
+def _as_int(value: object) -> int | None:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return None
+
+
+def _as_float(value: object, default: float) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return default
@@ -0,0 +1,639 @@
+"""
+In-process evaluation of trivial shell pipelines for the Dusky Control Center.
+
+Pollers run commands such as `prog args | grep X | awk '{print $2}' | tr -d %`
+every few seconds. Through `sh -c` each tick forks the shell plus one process
+per stage. This module compiles such commands once into a `Pipeline` that
+execs only the first program (argv, no shell) and applies the text filters
+in Python.
+
+Supported filters (stdin only, no file operands):
+- grep  [-v -i -q -c -x -o -F -E] [-e] PATTERN
+- awk   [-F SEP] '[/ERE/] {print $N[, $M * K ...]}'
+- sed   [-E] [-e] 's/RE/REPL/[gI][; ...]'
+- tr    -d SET | SET1 SET2
+- head / tail  [-n N | -N]
+
+A leading `cat FILE` is read directly. Anything outside this subset
+(redirections, expansions, globbing, control operators, backslashes, ...)
+makes `compile_command` return None and the caller falls back to `sh -c`.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import shlex
+import subprocess
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Final, Protocol
+
+__all__ = [
+    "EXIT_NOT_FOUND",
+    "Pipeline",
+    "compile_command",
+]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+# Characters that require a real shell when they appear unquoted
+_SHELL_ONLY_CHARS: Final[frozenset[str]] = frozenset("&;<>()`$\\*?[]{}~#!\n")
+
+# Characters that trigger expansion inside double quotes
+_DOUBLE_QUOTE_EXPANSIONS: Final[frozenset[str]] = frozenset("$`\\")
+
+# Builtins and keywords whose behaviour an argv exec would not reproduce
+_SHELL_BUILTINS: Final[frozenset[str]] = frozenset({
+    ".", ":", "alias", "bg", "break", "builtin", "case", "cd", "command",
+    "continue", "do", "done", "echo", "elif", "else", "esac", "eval", "exec",
+    "exit", "export", "fg", "fi", "for", "function", "getopts", "hash", "if",
+    "jobs", "local", "printf", "read", "readonly", "return", "set", "shift",
+    "source", "then", "times", "trap", "type", "ulimit", "umask", "unalias",
+    "unset", "until", "wait", "while",
+})
+
+_ASSIGNMENT_PATTERN: Final[re.Pattern[str]] = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+_AWK_PROGRAM_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"^\s*(?:/(?P<regex>[^/]*)/)?\s*(?:\{\s*print(?P<args>(?:\s[^{};]*)?)\s*;?\s*\})?\s*$"
+)
+_AWK_FIELD_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"^\$(?P<field>\d+|NF)(?:\s*(?P<op>[-+*/])\s*(?P<operand>\d+(?:\.\d+)?))?$"
+)
+_AWK_NUMBER_PREFIX: Final[re.Pattern[str]] = re.compile(
+    r"^\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+)
+_COUNT_PATTERN: Final[re.Pattern[str]] = re.compile(r"^\d+$")
+
+EXIT_NOT_FOUND: Final[int] = 127
+EXIT_NOT_EXECUTABLE: Final[int] = 126
+
+
+# =============================================================================
+# FILTERS
+# =============================================================================
+class _Filter(Protocol):
+    def apply(self, text: str) -> tuple[str, int]:
+        """Transform stdin text into (stdout text, exit status)."""
+        ...
+
+
+def _lines(text: str) -> list[str]:
+    """Split stream text into lines without terminators."""
+    return text.splitlines()
+
+
+def _join(lines: list[str]) -> str:
+    """Join lines back into newline-terminated stream text."""
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _translate_regex(pattern: str, extended: bool) -> str | None:
+    """
+    Translate a grep/sed regex into Python syntax. Only the common subset is
+    accepted; backslash escapes and POSIX classes fall back to the shell.
+    """
+    if "\\" in pattern or "[:" in pattern or "[=" in pattern or "[." in pattern:
+        return None
+    if extended:
+        return pattern
+
+    out: list[str] = []
+    last = len(pattern) - 1
+    for i, ch in enumerate(pattern):
+        if ch in "+?|(){}":
+            # Literal in BRE, special in Python
+            out.append("\\" + ch)
+        elif ch == "*" and i == 0:
+            out.append("\\*")
+        elif ch == "^" and i > 0 and pattern[i - 1] != "[":
+            out.append("\\^")
+        elif ch == "$" and i != last:
+            out.append("\\$")
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _compile_regex(pattern: str, extended: bool, flags: int = 0) -> re.Pattern[str] | None:
+    translated = _translate_regex(pattern, extended)
+    if translated is None:
+        return None
+    try:
+        return re.compile(translated, flags)
+    except re.error:
+        return None
+
+
+def _split_short_options(
+    args: list[str], with_value: str = ""
+) -> tuple[list[tuple[str, str]], list[str]] | None:
+    """
+    Parse bundled short options (`-vi`, `-n5`, `-n 5`). Returns the options as
+    (flag, value) pairs and the remaining operands, or None on long options.
+    """
+    options: list[tuple[str, str]] = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--":
+            i += 1
+            break
+        if not arg.startswith("-") or arg == "-":
+            break
+        if arg.startswith("--"):
+            return None
+        j = 1
+        while j < len(arg):
+            flag = arg[j]
+            if flag in with_value:
+                value = arg[j + 1:]
+                if not value:
+                    i += 1
+                    if i >= len(args):
+                        return None
+                    value = args[i]
+                options.append((flag, value))
+                break
+            options.append((flag, ""))
+            j += 1
+        i += 1
+    return options, args[i:]
+
+
+@dataclass(frozen=True, slots=True)
+class _Grep:
+    pattern: re.Pattern[str]
+    invert: bool
+    quiet: bool
+    count: bool
+    only_matching: bool
+    whole_line: bool
+
+    def _matches(self, line: str) -> bool:
+        if self.whole_line:
+            return self.pattern.fullmatch(line) is not None
+        return self.pattern.search(line) is not None
+
+    def apply(self, text: str) -> tuple[str, int]:
+        selected = [line for line in _lines(text) if self._matches(line) != self.invert]
+        status = 0 if selected else 1
+        if self.quiet:
+            return "", status
+        if self.count:
+            return f"{len(selected)}\n", status
+        if self.only_matching:
+            parts = [
+                m.group(0)
+                for line in selected
+                for m in self.pattern.finditer(line)
+                if m.group(0)
+            ]
+            return _join(parts), status
+        return _join(selected), status
+
+
+def _parse_grep(args: list[str]) -> _Grep | None:
+    parsed = _split_short_options(args, with_value="e")
+    if parsed is None:
+        return None
+    options, operands = parsed
+
+    flags = {flag for flag, _ in options}
+    if not flags <= set("viqcxoFEe"):
+        return None
+
+    patterns = [value for flag, value in options if flag == "e"]
+    if not patterns:
+        if not operands:
+            return None
+        patterns, operands = [operands[0]], operands[1:]
+    # File operands mean grep is not reading the pipe
+    if operands or len(patterns) != 1 or not patterns[0]:
+        return None
+    if "o" in flags and "v" in flags:
+        return None
+
+    re_flags = re.IGNORECASE if "i" in flags else 0
+    if "F" in flags:
+        compiled: re.Pattern[str] | None = re.compile(re.escape(patterns[0]), re_flags)
+    else:
+        compiled = _compile_regex(patterns[0], "E" in flags, re_flags)
+    if compiled is None:
+        return None
+
+    return _Grep(
+        pattern=compiled,
+        invert="v" in flags,
+        quiet="q" in flags,
+        count="c" in flags,
+        only_matching="o" in flags,
+        whole_line="x" in flags,
+    )
+
+
+def _awk_number(value: str) -> float:
+    """awk string-to-number conversion: the leading numeric prefix, else 0."""
+    m = _AWK_NUMBER_PREFIX.match(value)
+    return float(m.group(0)) if m else 0.0
+
+
+def _awk_format(value: float) -> str:
+    """Format a number the way awk prints it (integers exact, else %.6g)."""
+    if value.is_integer() and abs(value) < 1e16:
+        return str(int(value))
+    return f"{value:.6g}"
+
+
+@dataclass(frozen=True, slots=True)
+class _AwkField:
+    index: int  # -1 selects $NF
+    op: str
+    operand: float
+
+    def evaluate(self, line: str, fields: list[str]) -> str:
+        if self.index == 0:
+            value = line
+        else:
+            index = len(fields) if self.index < 0 else self.index
+            value = fields[index - 1] if 0 < index <= len(fields) else ""
+        if not self.op:
+            return value
+
+        number = _awk_number(value)
+        match self.op:
+            case "*":
+                number *= self.operand
+            case "/":
+                number /= self.operand
+            case "+":
+                number += self.operand
+            case "-":
+                number -= self.operand
+        return _awk_format(number)
+
+
+@dataclass(frozen=True, slots=True)
+class _Awk:
+    separator: re.Pattern[str] | None  # None means default whitespace splitting
+    condition: re.Pattern[str] | None
+    fields: tuple[_AwkField, ...]
+
+    def apply(self, text: str) -> tuple[str, int]:
+        out: list[str] = []
+        for line in _lines(text):
+            if self.condition is not None and not self.condition.search(line):
+                continue
+            if self.separator is None:
+                fields = line.split()
+            else:
+                fields = self.separator.split(line) if line else []
+            out.append(" ".join(f.evaluate(line, fields) for f in self.fields))
+        return _join(out), 0
+
+
+def _parse_awk(args: list[str]) -> _Awk | None:
+    parsed = _split_short_options(args, with_value="F")
+    if parsed is None:
+        return None
+    options, operands = parsed
+    if len(operands) != 1 or any(flag != "F" for flag, _ in options):
+        return None
+
+    separator: re.Pattern[str] | None = None
+    for _, sep in options:
+        if not sep or "\\" in sep:
+            return None
+        if sep == " ":
+            separator = None
+        elif len(sep) == 1:
+            separator = re.compile(re.escape(sep))
+        else:
+            separator = _compile_regex(sep, extended=True)
+            if separator is None:
+                return None
+
+    m = _AWK_PROGRAM_PATTERN.match(operands[0])
+    if m is None or (m.group("regex") is None and m.group("args") is None):
+        return None
+
+    condition: re.Pattern[str] | None = None
+    if (regex := m.group("regex")) is not None:
+        condition = _compile_regex(regex, extended=True)
+        if condition is None:
+            return None
+
+    fields: list[_AwkField] = []
+    raw_args = (m.group("args") or "").strip()
+    for raw in raw_args.split(",") if raw_args else ["$0"]:
+        fm = _AWK_FIELD_PATTERN.match(raw.strip())
+        if fm is None:
+            return None
+        operand = float(fm.group("operand") or 0)
+        if fm.group("op") == "/" and operand == 0:
+            return None
+        field = fm.group("field")
+        fields.append(_AwkField(
+            index=-1 if field == "NF" else int(field),
+            op=fm.group("op") or "",
+            operand=operand,
+        ))
+
+    return _Awk(separator=separator, condition=condition, fields=tuple(fields))
+
+
+@dataclass(frozen=True, slots=True)
+class _SedSubstitution:
+    pattern: re.Pattern[str]
+    replacement: tuple[str, ...]  # Literal pieces joined by the whole match (`&`)
+    count: int  # 0 replaces every match
+
+    def apply_line(self, line: str) -> str:
+        return self.pattern.sub(
+            lambda m: m.group(0).join(self.replacement), line, count=self.count
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _Sed:
+    substitutions: tuple[_SedSubstitution, ...]
+
+    def apply(self, text: str) -> tuple[str, int]:
+        out: list[str] = []
+        for line in text.splitlines(keepends=True):
+            body = line.rstrip("\n")
+            for sub in self.substitutions:
+                body = sub.apply_line(body)
+            out.append(body + line[len(line.rstrip("\n")):])
+        return "".join(out), 0
+
+
+def _parse_sed_script(script: str, extended: bool) -> list[_SedSubstitution] | None:
+    subs: list[_SedSubstitution] = []
+    i, n = 0, len(script)
+    while i < n:
+        if script[i] in " \t;":
+            i += 1
+            continue
+        if script[i] != "s" or i + 1 >= n:
+            return None
+        delim = script[i + 1]
+        if delim.isalnum() or delim in " \\\n;":
+            return None
+        pieces = script[i + 2:].split(delim, 2)
+        if len(pieces) != 3:
+            return None
+        regex, replacement, rest = pieces
+
+        flags_end = 0
+        while flags_end < len(rest) and rest[flags_end] not in "; \t":
+            flags_end += 1
+        flags = rest[:flags_end]
+        if not set(flags) <= set("gI") or "\\" in replacement:
+            return None
+
+        pattern = _compile_regex(regex, extended, re.IGNORECASE if "I" in flags else 0)
+        if pattern is None:
+            return None
+        subs.append(_SedSubstitution(
+            pattern=pattern,
+            replacement=tuple(replacement.split("&")),
+            count=0 if "g" in flags else 1,
+        ))
+        i += 2 + len(regex) + 1 + len(replacement) + 1 + flags_end
+    return subs
+
+
+def _parse_sed(args: list[str]) -> _Sed | None:
+    parsed = _split_short_options(args, with_value="e")
+    if parsed is None:
+        return None
+    options, operands = parsed
+    if any(flag not in "eEr" for flag, _ in options):
+        return None
+
+    scripts = [value for flag, value in options if flag == "e"]
+    if not scripts:
+        if not operands:
+            return None
+        scripts, operands = [operands[0]], operands[1:]
+    if operands:
+        return None
+
+    extended = any(flag in "Er" for flag, _ in options)
+    subs: list[_SedSubstitution] = []
+    for script in scripts:
+        parsed_subs = _parse_sed_script(script, extended)
+        if parsed_subs is None:
+            return None
+        subs.extend(parsed_subs)
+    return _Sed(tuple(subs)) if subs else None
+
+
+def _expand_tr_set(spec: str) -> str | None:
+    """Expand `a-z` style ranges; classes and escapes fall back to the shell."""
+    if not spec or "[" in spec or "\\" in spec:
+        return None
+    out: list[str] = []
+    i = 0
+    while i < len(spec):
+        if i + 2 < len(spec) and spec[i + 1] == "-":
+            start, end = ord(spec[i]), ord(spec[i + 2])
+            if start > end:
+                return None
+            out.extend(chr(c) for c in range(start, end + 1))
+            i += 3
+        else:
+            out.append(spec[i])
+            i += 1
+    return "".join(out)
+
+
+@dataclass(frozen=True, slots=True)
+class _Tr:
+    table: dict[int, int | None]
+
+    def apply(self, text: str) -> tuple[str, int]:
+        return text.translate(self.table), 0
+
+
+def _parse_tr(args: list[str]) -> _Tr | None:
+    if len(args) == 2 and args[0] == "-d":
+        chars = _expand_tr_set(args[1])
+        if chars is None:
+            return None
+        return _Tr({ord(c): None for c in chars})
+
+    if len(args) == 2 and not args[0].startswith("-"):
+        src, dst = _expand_tr_set(args[0]), _expand_tr_set(args[1])
+        if src is None or dst is None:
+            return None
+        # GNU tr pads the second set with its last character
+        dst = dst.ljust(len(src), dst[-1])
+        table: dict[int, int | None] = {}
+        for s, d in zip(src, dst):
+            table[ord(s)] = ord(d)
+        return _Tr(table)
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class _Head:
+    count: int
+    from_end: bool
+
+    def apply(self, text: str) -> tuple[str, int]:
+        lines = text.splitlines(keepends=True)
+        if self.from_end:
+            lines = lines[-self.count:] if self.count else []
+        else:
+            lines = lines[:self.count]
+        return "".join(lines), 0
+
+
+def _parse_line_count(args: list[str], from_end: bool) -> _Head | None:
+    if not args:
+        return _Head(10, from_end)
+    if len(args) == 1 and args[0].startswith("-") and _COUNT_PATTERN.match(args[0][1:]):
+        return _Head(int(args[0][1:]), from_end)
+
+    parsed = _split_short_options(args, with_value="n")
+    if parsed is None:
+        return None
+    options, operands = parsed
+    if operands or len(options) != 1 or not _COUNT_PATTERN.match(options[0][1]):
+        return None
+    return _Head(int(options[0][1]), from_end)
+
+
+_FILTER_PARSERS: Final[dict[str, Callable[[list[str]], _Filter | None]]] = {
+    "grep": _parse_grep,
+    "awk": _parse_awk,
+    "sed": _parse_sed,
+    "tr": _parse_tr,
+    "head": lambda args: _parse_line_count(args, from_end=False),
+    "tail": lambda args: _parse_line_count(args, from_end=True),
+}
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+@dataclass(frozen=True, slots=True)
+class Pipeline:
+    """A compiled command: one exec'd program (or file read) plus filters."""
+
+    argv: tuple[str, ...]
+    source_file: Path | None
+    filters: tuple[_Filter, ...]
+
+    def run(self, timeout: float) -> subprocess.CompletedProcess[str]:
+        """
+        Execute the pipeline. Mirrors `subprocess.run(..., shell=True)`: the
+        exit status is that of the last stage, and a missing program yields
+        127 rather than an exception. Raises `subprocess.TimeoutExpired`.
+        """
+        if self.source_file is not None:
+            try:
+                stdout, stderr = self.source_file.read_text(encoding="utf-8"), ""
+                status = 0
+            except OSError as e:
+                stdout, stderr = "", f"cat: {self.source_file}: {e.strerror}\n"
+                status = 1
+        else:
+            try:
+                res = subprocess.run(
+                    self.argv, capture_output=True, text=True, timeout=timeout
+                )
+                stdout, stderr, status = res.stdout, res.stderr, res.returncode
+            except FileNotFoundError:
+                stdout, stderr = "", f"sh: 1: {self.argv[0]}: not found\n"
+                status = EXIT_NOT_FOUND
+            except PermissionError:
+                stdout, stderr = "", f"sh: 1: {self.argv[0]}: Permission denied\n"
+                status = EXIT_NOT_EXECUTABLE
+
+        return self.finish(stdout, stderr, status)
+
+    def finish(self, stdout: str, stderr: str, status: int) -> subprocess.CompletedProcess[str]:
+        """
+        Apply the filters to the output of the first program. Used directly
+        by callers that run `argv` themselves (e.g. asynchronously).
+        """
+        for stage in self.filters:
+            stdout, status = stage.apply(stdout)
+        return subprocess.CompletedProcess(self.argv, status, stdout, stderr)
+
+
+def _split_stages(command: str) -> list[str] | None:
+    """
+    Split a command on unquoted `|`. Returns None if it uses any syntax that
+    needs a real shell (expansions, redirections, control operators, ...).
+    """
+    stages: list[str] = []
+    buf: list[str] = []
+    quote = ""
+    for ch in command:
+        if quote == "'":
+            if ch == "'":
+                quote = ""
+        elif quote == '"':
+            if ch in _DOUBLE_QUOTE_EXPANSIONS:
+                return None
+            if ch == '"':
+                quote = ""
+        elif ch in "'\"":
+            quote = ch
+        elif ch == "|":
+            stages.append("".join(buf))
+            buf.clear()
+            continue
+        elif ch in _SHELL_ONLY_CHARS:
+            return None
+        buf.append(ch)
+
+    if quote:
+        return None
+    stages.append("".join(buf))
+    return stages
+
+
+@lru_cache(maxsize=256)
+def compile_command(command: str) -> Pipeline | None:
+    """
+    Compile a shell command into a `Pipeline`, or None if it must run under
+    `sh -c`. Results are cached, so each distinct command is parsed once.
+    """
+    stages = _split_stages(command)
+    if stages is None:
+        return None
+
+    try:
+        argvs = [shlex.split(stage) for stage in stages]
+    except ValueError:
+        return None
+    if any(not argv for argv in argvs):
+        return None
+
+    head, *rest = argvs
+    if head[0] in _SHELL_BUILTINS or _ASSIGNMENT_PATTERN.match(head[0]):
+        return None
+
+    filters: list[_Filter] = []
+    for argv in rest:
+        parser = _FILTER_PARSERS.get(argv[0])
+        parsed = parser(argv[1:]) if parser else None
+        if parsed is None:
+            return None
+        filters.append(parsed)
+
+    source_file: Path | None = None
+    if head[0] == "cat" and len(head) == 2 and not head[1].startswith("-"):
+        source_file = Path(head[1])
+
+    log.debug("Compiled %r into %d in-process filter(s)", command, len(filters))
+    return Pipeline(argv=tuple(head), source_file=source_file, filters=tuple(filters))
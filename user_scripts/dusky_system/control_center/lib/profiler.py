@@ -0,0 +1,196 @@
+"""
+Startup phase profiler for the Dusky Control Center.
+
+Enabled with `--profile-startup[=PATH]` (add `--profile-startup-memory` for
+tracemalloc deltas, which slow startup noticeably). Phases are timed with
+`time.perf_counter_ns` and written as a Chrome trace (`chrome://tracing`,
+Perfetto) whose JSON also carries a flat per-phase summary for CI checks,
+plus the build time of every page finished while profiling.
+
+When disabled every call is a cheap no-op, so instrumentation can stay in
+place permanently.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+__all__ = [
+    "PROFILER",
+    "StartupProfiler",
+]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+FLAG_PROFILE: Final[str] = "--profile-startup"
+FLAG_MEMORY: Final[str] = "--profile-startup-memory"
+DEFAULT_REPORT_NAME: Final[str] = "startup-profile.json"
+
+
+# =============================================================================
+# PROFILER
+# =============================================================================
+@dataclass(slots=True)
+class _Span:
+    name: str
+    start_ns: int
+    end_ns: int
+    depth: int
+    args: dict[str, object]
+    build: bool = False  # Summed work of a sliced build, see `add_build`
+
+
+class StartupProfiler:
+    """Collects nested timing spans until the report is written."""
+
+    __slots__ = ("enabled", "report_path", "_origin_ns", "_spans", "_depth")
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.report_path: Path | None = None
+        self._origin_ns = time.perf_counter_ns()
+        self._spans: list[_Span] = []
+        self._depth = 0
+
+    def configure(self, argv: list[str], origin_ns: int | None = None) -> list[str]:
+        """
+        Enable profiling if the flags are present; returns argv without them
+        (GApplication rejects options it does not know).
+        """
+        remaining: list[str] = []
+        for arg in argv:
+            if arg == FLAG_MEMORY:
+                self.enabled = True
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+            elif arg == FLAG_PROFILE or arg.startswith(FLAG_PROFILE + "="):
+                self.enabled = True
+                _flag, _sep, path = arg.partition("=")
+                if path:
+                    self.report_path = Path(path).expanduser()
+            else:
+                remaining.append(arg)
+        if origin_ns is not None:
+            self._origin_ns = origin_ns
+        return remaining
+
+    @contextmanager
+    def span(self, name: str, **args: object) -> Iterator[None]:
+        """Time the enclosed block as one phase."""
+        if not self.enabled:
+            yield
+            return
+        memory = tracemalloc.is_tracing()
+        if memory:
+            before, _peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        start = time.perf_counter_ns()
+        self._depth += 1
+        depth = self._depth
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            end = time.perf_counter_ns()
+            if memory:
+                after, peak = tracemalloc.get_traced_memory()
+                args["alloc_kb"] = round((after - before) / 1024, 1)
+                args["peak_kb"] = round((peak - before) / 1024, 1)
+            self._spans.append(_Span(name, start, end, depth, args))
+
+    def add(self, name: str, start_ns: int, end_ns: int, **args: object) -> None:
+        """Record a phase measured before the profiler was importable."""
+        if self.enabled:
+            self._spans.append(_Span(name, start_ns, end_ns, self._depth + 1, args))
+
+    def add_build(self, name: str, build_ns: int, **args: object) -> None:
+        """
+        Record work done in slices (a page built across idle callbacks) as
+        one span of its summed duration, ending now.
+        """
+        if self.enabled:
+            end = time.perf_counter_ns()
+            self._spans.append(
+                _Span(name, end - build_ns, end, self._depth + 1, args, build=True)
+            )
+
+    def finish(self, default_dir: Path) -> Path | None:
+        """Write the report and stop profiling. Returns the report path."""
+        if not self.enabled:
+            return None
+        self.enabled = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+        total_ms = (time.perf_counter_ns() - self._origin_ns) / 1e6
+        self._log_summary(total_ms)
+        path = self.report_path or default_dir / DEFAULT_REPORT_NAME
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self._report(total_ms), indent=1), encoding="utf-8")
+        except OSError as e:
+            log.error("Could not write startup profile %s: %s", path, e)
+            return None
+        log.info("Startup profile written to %s", path)
+        return path
+
+    def _report(self, total_ms: float) -> dict[str, object]:
+        pid = os.getpid()
+        events: list[dict[str, object]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+             "args": {"name": "dusky-control-center"}},
+        ]
+        for span in sorted(self._spans, key=lambda s: (s.start_ns, s.depth)):
+            events.append({
+                "name": span.name,
+                "cat": "startup",
+                "ph": "X",
+                "pid": pid,
+                "tid": 0,
+                "ts": (span.start_ns - self._origin_ns) / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "args": span.args,
+            })
+        # Top-level phases only, so CI can compare numbers without a trace viewer
+        phases = {
+            s.name: round((s.end_ns - s.start_ns) / 1e6, 3)
+            for s in self._spans if s.depth <= 1 and not s.build
+        }
+        builds = {
+            s.name: round((s.end_ns - s.start_ns) / 1e6, 3)
+            for s in self._spans if s.build
+        }
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "total_ms": round(total_ms, 3),
+                "phases_ms": phases,
+                "builds_ms": builds,
+                "python": sys.version.split()[0],
+            },
+        }
+
+    def _log_summary(self, total_ms: float) -> None:
+        log.info("Startup profile: %.1f ms total", total_ms)
+        for span in sorted(self._spans, key=lambda s: s.start_ns):
+            indent = "  " * max(0, span.depth - 1)
+            log.info(
+                "  %s%-*s %8.2f ms", indent, 32 - len(indent), span.name,
+                (span.end_ns - span.start_ns) / 1e6,
+            )
+
+
+PROFILER: Final[StartupProfiler] = StartupProfiler()
@@ -3,7 +3,18 @@ Row widget definitions for the Dusky Control Center.
 
 Optimized for:
 - Stability: Thread Guards prevent race conditions and UI freezes.
-- Efficiency: Lazy thread pooling with proper lifecycle management.
+- Efficiency: Lazy priority thread pool; visible-page fetches never queue
+  behind off-screen work.
+- Efficiency: Polled commands are spawned from the GLib main loop
+  (Gio.Subprocess + child watch), so running children occupy no threads;
+  a spawn gate admits them with the executor's priority classes and caps.
+- Efficiency: One timer wheel drives every poller; identical commands are
+  fetched once per interval and fanned out to all subscribed widgets.
+- Efficiency: Subpages are cached per root page (LRU), so re-entering a
+  submenu is instant and shows the last known values.
+- Efficiency: Search results are recycled list rows that never poll; their
+  switches, buttons and sliders run the item's action and follow the last
+  value fetched for the real rows via the state store.
 - Type Safety: Strict TypedDict definitions and runtime-checkable Protocols.
 
 GTK4/Libadwaita compatible with proper lifecycle management via `do_unroot`.
@@ -12,11 +23,17 @@ from __future__ import annotations
 
 import atexit
 import logging
+import os
+import re
+import selectors
 import shlex
+import signal
 import subprocess
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
+from enum import IntEnum
 from functools import lru_cache
 from pathlib import Path
 from typing import (
@@ -24,6 +41,7 @@ from typing import (
     Any,
     Callable,
     Final,
+    NamedTuple,
     NotRequired,
     Protocol,
     TypeAlias,
@@ -36,12 +54,17 @@ import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Adw, GLib, Gtk, Pango, GObject
+from gi.repository import Adw, Gio, GLib, Gtk, Pango, GObject
 
 import lib.utility as utility
+from lib.model import IconSpec, ItemModel
+from lib.pipeline import EXIT_NOT_FOUND, Pipeline, compile_command
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Hashable, Iterator, Mapping, Sequence
+
+    from lib.model import SectionModel
+    from lib.search import SearchEntry
 
 log = logging.getLogger(__name__)
 
@@ -49,7 +72,6 @@ log = logging.getLogger(__name__)
 # =============================================================================
 # CONSTANTS
 # =============================================================================
-DEFAULT_ICON: Final[str] = "utilities-terminal-symbolic"
 DEFAULT_INTERVAL_SECONDS: Final[int] = 5
 MONITOR_INTERVAL_SECONDS: Final[int] = 2
 MIN_STEP_VALUE: Final[float] = 1e-9
@@ -58,7 +80,17 @@ SUBPROCESS_TIMEOUT_SHORT: Final[int] = 2
 SUBPROCESS_TIMEOUT_LONG: Final[int] = 5
 ICON_PIXEL_SIZE: Final[int] = 28  # Aggressively reduced for compact cards
 LABEL_MAX_WIDTH_CHARS: Final[int] = 16
-EXECUTOR_MAX_WORKERS: Final[int] = 4
+EXECUTOR_MAX_WORKERS: Final[int] = 6
+POLL_WHEEL_SLOTS: Final[int] = 64
+EVENT_COALESCE_MS: Final[int] = 100
+POLL_BACKOFF_FACTOR: Final[int] = 2
+POLL_BACKOFF_MAX_MULTIPLIER: Final[int] = 8  # Default ceiling relative to the interval
+POLL_BACKOFF_CEILING_SECONDS: Final[int] = 60
+STREAM_RESTART_MIN_SECONDS: Final[int] = 2
+STREAM_RESTART_MAX_SECONDS: Final[int] = 60
+STREAM_LINE_MAX_BYTES: Final[int] = 64 * 1024
+COMMAND_OUTPUT_MAX_BYTES: Final[int] = 256 * 1024  # Per stream of a polled command
+SUBPAGE_CACHE_SIZE: Final[int] = 8  # Built subpages kept per root page
 
 LABEL_PLACEHOLDER: Final[str] = "..."
 LABEL_NA: Final[str] = "N/A"
@@ -71,55 +103,306 @@ TRUE_VALUES: Final[frozenset[str]] = frozenset(
     {"enabled", "yes", "true", "1", "on", "active", "set", "running", "open", "high"}
 )
 
+# Pseudo and network filesystems where inotify misses changes; these are polled
+UNWATCHABLE_FS_TYPES: Final[frozenset[str]] = frozenset({
+    "proc", "sysfs", "devtmpfs", "debugfs", "tracefs", "securityfs", "configfs",
+    "cgroup", "cgroup2", "nfs", "nfs4", "cifs", "smb3", "smbfs", "9p",
+    "virtiofs", "fuse.sshfs", "fuse.rclone",
+})
+
 
 # =============================================================================
-# LAZY THREAD POOL (Singleton with Proper Cleanup)
+# PRIORITY THREAD POOL (Singleton with Proper Cleanup)
 # =============================================================================
-class _ExecutorManager:
+class TaskPriority(IntEnum):
+    """Scheduling classes, most urgent first."""
+
+    VISIBLE = 0  # Refresh of something on screen right now
+    FIRST_PAINT = 1  # Initial fetch of a freshly built widget
+    BACKGROUND = 2  # Off-screen polls, events and housekeeping
+    PREFETCH = 3  # Speculative work for pages not shown yet
+
+
+# Concurrency cap per class. Off-screen classes together never take more than
+# EXECUTOR_MAX_WORKERS - EXECUTOR_VISIBLE_RESERVED workers, so visible fetches
+# can always start without waiting behind them.
+EXECUTOR_CLASS_CAPS: Final[dict[TaskPriority, int]] = {
+    TaskPriority.VISIBLE: EXECUTOR_MAX_WORKERS,
+    TaskPriority.FIRST_PAINT: 2,
+    TaskPriority.BACKGROUND: 1,
+    TaskPriority.PREFETCH: 1,
+}
+
+
+@dataclass(slots=True)
+class _QueuedTask:
+    func: Callable[[], None]
+    priority: TaskPriority
+    enqueued_at: float
+    deadline: float | None
+    on_drop: Callable[[], None] | None
+
+
+@dataclass(slots=True)
+class _ClassCounters:
+    submitted: int = 0
+    completed: int = 0
+    dropped: int = 0
+    max_depth: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class ExecutorClassStats(NamedTuple):
+    """Queue depth and latency counters of one priority class."""
+
+    queued: int
+    running: int
+    submitted: int
+    completed: int
+    dropped: int
+    max_depth: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class PriorityExecutor:
     """
-    Manages a singleton ThreadPoolExecutor with lazy initialization
-    and graceful shutdown on interpreter exit.
+    Bounded worker pool with priority classes and per-class concurrency caps.
+
+    Workers always take the most urgent runnable task. Tasks queued with a
+    deadline (periodic polls) are dropped instead of run once it has passed,
+    since a newer poll supersedes them. Workers are started lazily and block
+    on a condition variable while idle, so an idle pool costs no wakeups.
     """
 
-    __slots__ = ("_executor", "_lock", "_is_shutdown")
-    _instance: _ExecutorManager | None = None
+    __slots__ = (
+        "_cond", "_queues", "_running", "_counters", "_threads", "_idle", "_is_shutdown"
+    )
+    _instance: PriorityExecutor | None = None
 
-    def __new__(cls) -> _ExecutorManager:
+    def __new__(cls) -> PriorityExecutor:
         if cls._instance is None:
             instance = super().__new__(cls)
-            instance._executor = None
-            instance._lock = threading.Lock()
+            instance._cond = threading.Condition()
+            instance._queues = {p: deque() for p in TaskPriority}
+            instance._running = dict.fromkeys(TaskPriority, 0)
+            instance._counters = {p: _ClassCounters() for p in TaskPriority}
+            instance._threads = []
+            instance._idle = 0
             instance._is_shutdown = False
             atexit.register(instance.shutdown)
             cls._instance = instance
         return cls._instance
 
-    def get(self) -> ThreadPoolExecutor:
-        """Get or lazily create the thread pool executor."""
-        # Double-checked locking pattern
-        if self._executor is None or self._is_shutdown:
-            with self._lock:
-                if self._executor is None or self._is_shutdown:
-                    self._is_shutdown = False
-                    self._executor = ThreadPoolExecutor(
-                        max_workers=EXECUTOR_MAX_WORKERS,
-                        thread_name_prefix="dusky-row-",
-                    )
-        return self._executor
+    def submit(
+        self,
+        func: Callable[[], None],
+        priority: TaskPriority = TaskPriority.BACKGROUND,
+        *,
+        deadline: float | None = None,
+        on_drop: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Queue a task. `deadline` is a `time.monotonic()` value after which the
+        task is dropped if it has not started; `on_drop` then runs instead.
+        Raises RuntimeError after shutdown.
+        """
+        with self._cond:
+            if self._is_shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            queue = self._queues[priority]
+            queue.append(_QueuedTask(func, priority, time.monotonic(), deadline, on_drop))
+            counters = self._counters[priority]
+            counters.submitted += 1
+            counters.max_depth = max(counters.max_depth, len(queue))
+            if self._idle == 0 and len(self._threads) < EXECUTOR_MAX_WORKERS:
+                self._spawn_worker()
+            self._cond.notify_all()
+
+    def stats(self) -> dict[TaskPriority, ExecutorClassStats]:
+        """Snapshot of the per-class counters."""
+        with self._cond:
+            return {
+                p: ExecutorClassStats(
+                    queued=len(self._queues[p]),
+                    running=self._running[p],
+                    submitted=c.submitted,
+                    completed=c.completed,
+                    dropped=c.dropped,
+                    max_depth=c.max_depth,
+                    avg_wait_ms=c.total_wait * 1000 / c.completed if c.completed else 0.0,
+                    max_wait_ms=c.max_wait * 1000,
+                )
+                for p, c in self._counters.items()
+            }
 
     def shutdown(self) -> None:
-        """Shut down the executor, cancelling pending futures."""
-        with self._lock:
-            if self._executor is not None and not self._is_shutdown:
-                log.debug("Shutting down row widget thread pool.")
-                self._is_shutdown = True
-                self._executor.shutdown(wait=False, cancel_futures=True)
-                self._executor = None
+        """Stop the workers and discard queued tasks."""
+        with self._cond:
+            if self._is_shutdown:
+                return
+            log.debug("Shutting down row widget thread pool.")
+            self._is_shutdown = True
+            for queue in self._queues.values():
+                queue.clear()
+            self._cond.notify_all()
+
+    def _spawn_worker(self) -> None:
+        """Start one more worker. Caller holds the lock."""
+        thread = threading.Thread(
+            target=self._worker_loop,
+            name=f"dusky-row-{len(self._threads)}",
+            daemon=True,
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _take_task(self, dropped: list[_QueuedTask]) -> _QueuedTask | None:
+        """
+        Pop the most urgent task whose class is below its cap, moving expired
+        tasks into `dropped`. Caller holds the lock.
+        """
+        now = time.monotonic()
+        for priority, queue in self._queues.items():
+            while queue and queue[0].deadline is not None and queue[0].deadline < now:
+                dropped.append(queue.popleft())
+                self._counters[priority].dropped += 1
+            if queue and self._running[priority] < EXECUTOR_CLASS_CAPS[priority]:
+                return queue.popleft()
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            dropped: list[_QueuedTask] = []
+            with self._cond:
+                task = self._take_task(dropped)
+                while task is None and not dropped:
+                    if self._is_shutdown:
+                        return
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                    task = self._take_task(dropped)
+                if task is not None:
+                    self._running[task.priority] += 1
+
+            for stale in dropped:
+                if stale.on_drop is not None:
+                    self._run_safely(stale.on_drop)
+            if task is None:
+                continue
+
+            started = time.monotonic()
+            self._run_safely(task.func)
+
+            with self._cond:
+                self._running[task.priority] -= 1
+                counters = self._counters[task.priority]
+                counters.completed += 1
+                wait = started - task.enqueued_at
+                counters.total_wait += wait
+                counters.max_wait = max(counters.max_wait, wait)
+                # A capped class may be runnable again
+                self._cond.notify_all()
+
+    @staticmethod
+    def _run_safely(func: Callable[[], None]) -> None:
+        try:
+            func()
+        except Exception as e:
+            log.error("Background task failed: %s", e)
 
 
-def _get_executor() -> ThreadPoolExecutor:
+def _get_executor() -> PriorityExecutor:
     """Module-level accessor for the singleton executor."""
-    return _ExecutorManager().get()
+    return PriorityExecutor()
+
+
+def get_executor_stats() -> dict[TaskPriority, ExecutorClassStats]:
+    """Per-priority queue depth and latency counters of the row executor."""
+    return _get_executor().stats()
+
+
+class SpawnGate:
+    """
+    Admission control for commands spawned from the main loop. They occupy
+    no worker, so the executor cannot bound them. The gate applies the
+    executor's priority classes and caps (EXECUTOR_CLASS_CAPS, at most
+    EXECUTOR_MAX_WORKERS children in total), so a burst of off-screen polls
+    cannot delay the spawns of the visible page.
+    Must only be used from the main GTK thread.
+    """
+
+    __slots__ = ("_queues", "_running")
+    _instance: SpawnGate | None = None
+
+    def __new__(cls) -> SpawnGate:
+        if cls._instance is None:
+            instance = super().__new__(cls)
+            instance._queues = {p: deque() for p in TaskPriority}
+            instance._running = dict.fromkeys(TaskPriority, 0)
+            cls._instance = instance
+        return cls._instance
+
+    def submit(
+        self,
+        start: Callable[[Callable[[], None]], None],
+        priority: TaskPriority,
+        *,
+        deadline: float | None = None,
+        on_drop: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Queue `start(release)`; it must call `release` once its child is done.
+        `deadline` and `on_drop` behave as in `PriorityExecutor.submit`.
+        """
+
+        def run() -> None:
+            released = False
+
+            def release() -> None:
+                nonlocal released
+                if not released:
+                    released = True
+                    self._running[priority] -= 1
+                    self._pump()
+
+            try:
+                start(release)
+            except Exception as e:
+                log.error("Spawn failed: %s", e)
+                release()
+
+        self._queues[priority].append(
+            _QueuedTask(run, priority, time.monotonic(), deadline, on_drop)
+        )
+        self._pump()
+
+    def _pump(self) -> None:
+        """Start the most urgent queued spawns that fit under the caps."""
+        now = time.monotonic()
+        for priority, queue in self._queues.items():
+            while queue:
+                task = queue[0]
+                if task.deadline is not None and task.deadline < now:
+                    queue.popleft()
+                    if task.on_drop is not None:
+                        task.on_drop()
+                    continue
+                if (
+                    self._running[priority] >= EXECUTOR_CLASS_CAPS[priority]
+                    or sum(self._running.values()) >= EXECUTOR_MAX_WORKERS
+                ):
+                    break
+                queue.popleft()
+                self._running[priority] += 1
+                task.func()
+
+
+def _get_spawn_gate() -> SpawnGate:
+    """Module-level accessor for the singleton spawn gate."""
+    return SpawnGate()
 
 
 # =============================================================================
@@ -129,6 +412,8 @@ class IconConfigExec(TypedDict):
     type: str  # Literal["exec"]
     command: str
     interval: int
+    min_interval: NotRequired[int]  # Alias of interval
+    max_interval: NotRequired[int]  # Backoff ceiling while the output is unchanged
     name: NotRequired[str]
 
 
@@ -183,8 +468,27 @@ class ValueConfigSystem(TypedDict):
     key: str
 
 
+class ValueConfigProvider(TypedDict):
+    type: str  # Literal["provider"]
+    name: str  # e.g. memory.used, backlight.percent, thermal.zone0
+
+
+class ValueConfigStream(TypedDict):
+    type: str  # Literal["stream"]
+    command: str  # Long-lived event command, e.g. `pactl subscribe`
+    match: NotRequired[str]  # Regex selecting relevant lines
+    # Re-run per event; else the line is the value
+    query: NotRequired[str | ValueConfigProvider]
+
+
 ValueConfig: TypeAlias = (
-    str | ValueConfigExec | ValueConfigStatic | ValueConfigFile | ValueConfigSystem
+    str
+    | ValueConfigExec
+    | ValueConfigStatic
+    | ValueConfigFile
+    | ValueConfigSystem
+    | ValueConfigProvider
+    | ValueConfigStream
 )
 
 
@@ -198,11 +502,13 @@ class RowProperties(TypedDict, total=False):
     button_text_map: dict[str, str]
     style_map: dict[str, str]
     interval: int
+    min_interval: int  # Alias of interval
+    max_interval: int  # Backoff ceiling while the value is unchanged
     key: str
     key_inverse: bool
     save_as_int: bool
-    state_command: str
-    value_command: str  # ADDED: Command to fetch slider value
+    state_command: str | ValueConfigProvider | ValueConfigStream
+    value_command: str | ValueConfigProvider | ValueConfigStream  # ADDED: Command to fetch slider value
     min: float
     max: float
     step: float
@@ -223,6 +529,7 @@ class RowContext(TypedDict, total=False):
     nav_view: Adw.NavigationView | None
     builder_func: Callable[..., Adw.NavigationPage] | None
     path: NotRequired[list[str]] # Path context for breadcrumbs
+    subpages: NotRequired[SubpageCache | None]
 
 
 @dataclass(slots=True)
@@ -231,31 +538,25 @@ class WidgetState:
 
     lock: threading.Lock = field(default_factory=threading.Lock)
     is_destroyed: bool = False
-    icon_source_id: int = 0
-    monitor_source_id: int = 0
-    update_source_id: int = 0
     debounce_source_id: int = 0
-    is_icon_updating: bool = False
-    is_monitoring: bool = False
-    is_value_updating: bool = False
+    subscriptions: list[PollSubscription] = field(default_factory=list)
 
-    def mark_destroyed_and_get_sources(self) -> tuple[int, int, int, int]:
+    def mark_destroyed_and_get_sources(self) -> tuple[int, ...]:
         """Atomically marks destroyed and returns all source IDs for cleanup."""
         with self.lock:
             self.is_destroyed = True
-            sources = (
-                self.icon_source_id,
-                self.monitor_source_id,
-                self.update_source_id,
-                self.debounce_source_id,
-            )
+            sources = (self.debounce_source_id,)
             # Clear them to prevent accidental reuse
-            self.icon_source_id = 0
-            self.monitor_source_id = 0
-            self.update_source_id = 0
             self.debounce_source_id = 0
             return sources
 
+    def take_subscriptions(self) -> list[PollSubscription]:
+        """Atomically detach all poll subscriptions for cancellation."""
+        with self.lock:
+            subs = self.subscriptions
+            self.subscriptions = []
+            return subs
+
 
 # =============================================================================
 # PROTOCOLS FOR MIXINS (Runtime Checkable)
@@ -269,48 +570,12 @@ class DynamicIconHost(Protocol):
 @runtime_checkable
 class StateMonitorHost(Protocol):
     _state: WidgetState
-    properties: RowProperties
-    key_inverse: bool
+    item: ItemModel
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
-def _safe_int(value: object, default: int) -> int:
-    """Safely convert a value to int, returning default on failure."""
-    if isinstance(value, int):
-        return value
-    if isinstance(value, str):
-        try:
-            return int(value)
-        except ValueError:
-            pass
-    return default
-
-
-def _safe_float(value: object, default: float) -> float:
-    """Safely convert a value to float, returning default on failure."""
-    if isinstance(value, (int, float)):
-        return float(value)
-    if isinstance(value, str):
-        try:
-            return float(value)
-        except ValueError:
-            pass
-    return default
-
-
-def _is_dynamic_icon(icon_config: object) -> bool:
-    """Check if an icon configuration requires periodic updates."""
-    if not isinstance(icon_config, dict):
-        return False
-    return (
-        icon_config.get("type") == "exec"
-        and _safe_int(icon_config.get("interval"), 0) > 0
-        and bool(icon_config.get("command", ""))
-    )
-
-
 def _perform_redirect(
     page_id: str,
     config: Mapping[str, object],
@@ -329,19 +594,77 @@ def _perform_redirect(
             return
 
 
+def _run_press_action(act: object, title: str, context: RowContext) -> None:
+    """Run a button's `exec` or `redirect` action."""
+    if not isinstance(act, dict):
+        return
+    t = act.get("type")
+    if t == "exec":
+        cmd = act.get("command", "")
+        if isinstance(cmd, str) and cmd.strip():
+            term = bool(act.get("terminal", False))
+            success = utility.execute_command(cmd.strip(), title, term)
+            msg = f"{'▶ Launched' if success else '✖ Failed'}: {title}"
+            utility.toast(context.get("toast_overlay"), msg, 2 if success else 4)
+    elif t == "redirect":
+        if pid := act.get("page"):
+            _perform_redirect(
+                str(pid), context.get("config") or {}, context.get("sidebar")
+            )
+
+
+def _run_toggle_action(item: ItemModel, state: bool) -> None:
+    """Run a toggle's `enabled`/`disabled` command and save its settings key."""
+    if isinstance(item.action, dict):
+        if act := item.action.get("enabled" if state else "disabled"):
+            if isinstance(act, dict) and (cmd := act.get("command")):
+                utility.execute_command(
+                    str(cmd).strip(), "Toggle", bool(act.get("terminal", False))
+                )
+
+    if item.key:
+        utility.save_setting(item.key, state ^ item.key_inverse, as_int=item.save_as_int)
+
+
+def _run_slider_action(act: object, value: float) -> None:
+    """Run a slider's `exec` action with `{value}` filled in."""
+    if not isinstance(act, dict) or act.get("type") != "exec":
+        return
+    if cmd := act.get("command"):
+        final_cmd = str(cmd).replace("{value}", str(int(value)))
+
+        # OPTIMIZATION: Fast Path Execution for Background Commands
+        if act.get("terminal", False):
+            utility.execute_command(final_cmd, "Slider", True)
+        else:
+            subprocess.Popen(
+                final_cmd,
+                shell=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+
+
+def _snap_value(value: float, item: ItemModel) -> float:
+    """Round a slider value to its step and clamp it to the range."""
+    snapped = round(value / item.step) * item.step
+    return max(item.minimum, min(snapped, item.maximum))
+
+
 @lru_cache(maxsize=128)
 def _expand_path(path: str) -> Path:
     """Expand user path with caching for repeated accesses."""
     return Path(path).expanduser()
 
 
-def _resolve_static_icon_name(icon_config: object) -> str:
-    """Resolve an icon configuration to a static icon name string."""
-    if isinstance(icon_config, str):
-        return icon_config or DEFAULT_ICON
-    if isinstance(icon_config, dict):
-        return str(icon_config.get("name", DEFAULT_ICON))
-    return DEFAULT_ICON
+def _create_prefix_icon(icon: IconSpec) -> Gtk.Image:
+    """Create a row's prefix icon: the image file if it exists, else the name."""
+    if icon.file is not None and icon.file.exists():
+        img = Gtk.Image.new_from_file(str(icon.file))
+    else:
+        img = Gtk.Image.new_from_icon_name(icon.name)
+    img.add_css_class("action-row-prefix-icon")
+    return img
 
 
 def _safe_source_remove(source_id: int) -> None:
@@ -357,13 +680,51 @@ def _batch_source_remove(*source_ids: int) -> None:
         _safe_source_remove(sid)
 
 
-def _submit_task_safe(func: Callable[[], None], state: WidgetState) -> bool:
+def _release_state(state: WidgetState) -> None:
+    """Mark a widget destroyed, remove its sources and cancel its subscriptions."""
+    _batch_source_remove(*state.mark_destroyed_and_get_sources())
+    for sub in state.take_subscriptions():
+        sub.cancel()
+
+
+def _boost_polling(state: WidgetState) -> None:
+    """Snap a widget's sources back to their fastest interval after user input."""
+    with state.lock:
+        subs = tuple(state.subscriptions)
+    for sub in subs:
+        sub.boost()
+
+
+def _pause_polling(state: WidgetState) -> None:
+    """Detach a hidden widget from its sources; unshared ones stop entirely."""
+    with state.lock:
+        subs = tuple(state.subscriptions)
+    for sub in subs:
+        sub.pause()
+
+
+def _resume_polling(state: WidgetState) -> None:
+    """Reattach a revealed widget to its sources and fetch them now."""
+    with state.lock:
+        subs = tuple(state.subscriptions)
+    for sub in subs:
+        sub.resume()
+
+
+def _submit_task_safe(
+    func: Callable[[], None],
+    state: WidgetState | None = None,
+    priority: TaskPriority = TaskPriority.BACKGROUND,
+    *,
+    deadline: float | None = None,
+    on_drop: Callable[[], None] | None = None,
+) -> bool:
     """
     Submit a task to the executor, handling shutdown gracefully.
     Returns True if submitted, False otherwise.
     """
     try:
-        _get_executor().submit(func)
+        _get_executor().submit(func, priority, deadline=deadline, on_drop=on_drop)
         return True
     except RuntimeError:
         # Executor is shut down (app is exiting)
@@ -373,93 +734,1569 @@ def _submit_task_safe(func: Callable[[], None], state: WidgetState) -> bool:
         return False
 
 
+# Nesting depth of `prefetching()` blocks
+_prefetch_depth = 0
+
+
+@contextmanager
+def prefetching() -> Iterator[None]:
+    """
+    Mark rows built inside the block as off-screen: their initial fetches
+    queue as PREFETCH, behind the first paint of the visible page.
+    """
+    global _prefetch_depth
+    _prefetch_depth += 1
+    try:
+        yield
+    finally:
+        _prefetch_depth -= 1
+
+
+def _first_fetch_priority() -> TaskPriority:
+    """Priority of a freshly built widget's initial fetch."""
+    return TaskPriority.PREFETCH if _prefetch_depth else TaskPriority.FIRST_PAINT
+
+
 # =============================================================================
-# MIXIN: DYNAMIC ICON UPDATES
+# SHARED POLL SCHEDULER (Timer Wheel)
 # =============================================================================
-class DynamicIconMixin:
+@dataclass(slots=True, frozen=True)
+class PollResult:
+    """Outcome of a single source fetch, fanned out to every subscriber."""
+
+    stdout: str = ""
+    stderr: str = ""
+    returncode: int = 0
+    timed_out: bool = False
+    failed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out and not self.failed
+
+
+PollFetcher: TypeAlias = Callable[[], PollResult]
+PollCallback: TypeAlias = Callable[[PollResult], None]
+# Starts a fetch on the main loop and calls back exactly once, on the main loop
+PollSpawner: TypeAlias = Callable[[PollCallback], None]
+
+
+class StreamSpec(NamedTuple):
+    """A long-lived event command and the filter applied to its lines."""
+
+    command: str
+    pattern: re.Pattern[str] | None = None
+
+
+class PollStats(NamedTuple):
+    """Periodic fetches performed versus what fixed intervals would have cost."""
+
+    polls: int
+    fixed_polls: float
+
+    @property
+    def saved_ratio(self) -> float:
+        """Fraction of fixed-interval fetches avoided by adaptive backoff."""
+        if self.fixed_polls <= 0:
+            return 0.0
+        return 1.0 - self.polls / self.fixed_polls
+
+
+class PollSourceSpec(NamedTuple):
+    """Identity and fetch function of a pollable source."""
+
+    key: Hashable
+    # Blocking fetch run on the executor. None for spawned sources and for
+    # stream sources whose lines are the value themselves
+    fetch: PollFetcher | None
+    # File-backed sources are refreshed by inotify instead of the timer wheel
+    watch_path: Path | None = None
+    # Stream-backed sources are refreshed on each matching output line
+    stream: StreamSpec | None = None
+    # Non-blocking fetch driven by the main loop; preferred over `fetch`
+    spawn: PollSpawner | None = None
+
+
+class _PollSource:
+    """A unique source shared by every subscription with the same key."""
+
+    __slots__ = (
+        "key", "fetch", "spawn", "subscribers", "interval", "base_interval", "max_interval",
+        "due_tick", "in_flight", "last_result",
+        "watch_path", "monitor", "monitor_handler", "stream", "stream_listener",
+        "coalesce_id", "trailing", "stale",
+    )
+
+    def __init__(self, spec: PollSourceSpec) -> None:
+        self.key = spec.key
+        self.fetch = spec.fetch
+        self.spawn = spec.spawn
+        self.subscribers: list[PollSubscription] = []
+        # Current (backed-off) interval within [base_interval, max_interval]
+        self.interval = 0
+        self.base_interval = 0
+        self.max_interval = 0
+        self.due_tick = -1  # -1 means "not on the wheel"
+        self.in_flight = False
+        self.last_result: PollResult | None = None
+        self.watch_path = spec.watch_path
+        self.monitor: Gio.FileMonitor | None = None
+        self.monitor_handler = 0
+        self.stream = spec.stream
+        self.stream_listener: _StreamListener | None = None
+        self.coalesce_id = 0
+        self.trailing = False
+        self.stale = False
+
+    def is_event_driven(self) -> bool:
+        """Whether a live file monitor or stream currently triggers refreshes."""
+        if self.monitor is not None:
+            return True
+        return self.stream_listener is not None and self.stream_listener.running
+
+    def can_fetch(self) -> bool:
+        return self.fetch is not None or self.spawn is not None
+
+    def wanted_interval(self) -> int:
+        """The shortest positive interval requested by any subscriber."""
+        if self.is_event_driven() or not self.can_fetch():
+            return 0  # Event-driven; the wheel is only a fallback
+        return min((s.interval for s in self.subscribers if s.interval > 0), default=0)
+
+    def wanted_ceiling(self, base: int) -> int:
+        """The backoff ceiling: the lowest `max_interval` of periodic subscribers."""
+        ceiling = min(
+            (s.max_interval for s in self.subscribers if s.interval > 0), default=base
+        )
+        return max(ceiling, base)
+
+    def has_active_subscriber(self) -> bool:
+        return any(s.is_active() for s in self.subscribers)
+
+
+class PollSubscription:
+    """Handle returned by `PollScheduler.subscribe`. Cancel it on teardown."""
+
+    __slots__ = (
+        "_scheduler", "_spec", "_source", "callback", "interval", "max_interval",
+        "_is_active",
+    )
+
+    def __init__(
+        self,
+        scheduler: PollScheduler,
+        spec: PollSourceSpec,
+        callback: PollCallback,
+        interval: int,
+        max_interval: int,
+        is_active: Callable[[], bool] | None,
+    ) -> None:
+        self._scheduler = scheduler
+        self._spec: PollSourceSpec | None = spec
+        self._source: _PollSource | None = None
+        self.callback = callback
+        self.interval = interval
+        self.max_interval = max_interval
+        self._is_active = is_active
+
+    def is_active(self) -> bool:
+        """Whether the subscriber currently wants periodic updates (e.g. is mapped)."""
+        if self._is_active is None:
+            return True
+        try:
+            return bool(self._is_active())
+        except Exception:
+            return False
+
+    def refresh(self) -> None:
+        """Request an out-of-band fetch of the underlying source."""
+        if self._source is not None:
+            self._scheduler._dispatch(self._source, TaskPriority.VISIBLE)
+
+    def boost(self) -> None:
+        """Reset the source's backoff, e.g. right after the user acted on it."""
+        if self._source is not None:
+            self._scheduler._boost(self._source)
+
+    def pause(self) -> None:
+        """Leave the source until `resume`; it stops if nobody else uses it."""
+        source, self._source = self._source, None
+        if source is not None:
+            self._scheduler._unsubscribe(source, self)
+
+    def resume(self) -> None:
+        """Rejoin the source after `pause` and fetch it now."""
+        if self._source is None and self._spec is not None:
+            self._scheduler._attach(self, TaskPriority.VISIBLE)
+
+    def cancel(self) -> None:
+        """Detach from the source for good. Safe to call more than once."""
+        self._spec = None
+        self.pause()
+
+
+class PollScheduler:
     """
-    Mixin providing dynamic icon updates via periodic command execution.
-    Includes state guards to prevent thread stacking.
+    Drives every periodic source from a single hashed timer wheel.
+
+    Sources are keyed by identity (e.g. the command string), so a command that
+    appears on several pages is fetched once per interval no matter how many
+    widgets subscribe, and the result is fanned out to all of them.
+    File-backed sources are refreshed from inotify events rather than the
+    wheel. While suspended the wheel holds no GLib source at all, so a
+    hidden daemon has zero wakeups.
+
+    Intervals are adaptive: every unchanged result doubles a source's
+    interval up to its ceiling, and any change, user interaction or window
+    activation snaps it back to the configured minimum.
+    Must only be used from the main GTK thread; fetches run on the executor.
     """
 
-    _state: WidgetState
-    icon_widget: Gtk.Image
+    __slots__ = (
+        "_sources", "_wheel", "_tick", "_tick_source_id", "_suspended",
+        "_polls", "_fixed_polls",
+    )
+    _instance: PollScheduler | None = None
 
-    def _start_icon_update_loop(self, icon_config: dict[str, object]) -> None:
-        """Initialize the icon polling loop."""
-        interval = _safe_int(icon_config.get("interval"), DEFAULT_INTERVAL_SECONDS)
-        command = icon_config.get("command")
+    def __new__(cls) -> PollScheduler:
+        if cls._instance is None:
+            instance = super().__new__(cls)
+            instance._sources = {}
+            instance._wheel = [set() for _ in range(POLL_WHEEL_SLOTS)]
+            instance._tick = 0
+            instance._tick_source_id = 0
+            instance._suspended = False
+            instance._polls = 0
+            instance._fixed_polls = 0.0
+            cls._instance = instance
+        return cls._instance
 
-        if not isinstance(command, str) or not command.strip():
+    def subscribe(
+        self,
+        spec: PollSourceSpec,
+        callback: PollCallback,
+        *,
+        interval: int = 0,
+        max_interval: int = 0,
+        is_active: Callable[[], bool] | None = None,
+        immediate: bool = True,
+    ) -> PollSubscription:
+        """
+        Register a callback for a source. An interval of 0 means one-shot;
+        unchanged results back the interval off towards `max_interval`.
+        The last known result, if any, is delivered synchronously.
+        """
+        sub = PollSubscription(
+            self, spec, callback, interval, max(max_interval, interval), is_active
+        )
+        self._attach(sub, _first_fetch_priority() if immediate else None)
+        return sub
+
+    def _attach(self, sub: PollSubscription, priority: TaskPriority | None) -> None:
+        """Add a subscription to its source, creating the source if needed."""
+        spec = sub._spec
+        assert spec is not None
+        source = self._sources.get(spec.key)
+        if source is None:
+            source = _PollSource(spec)
+            # A rebuilt page shows the last known value until its first fetch
+            source.last_result = _get_state_store().get(spec.key)
+            self._sources[spec.key] = source
+            if spec.watch_path is not None:
+                self._start_watch(source)
+            if spec.stream is not None:
+                self._start_stream(source)
+
+        sub._source = source
+        source.subscribers.append(sub)
+        self._reschedule(source)
+
+        if source.last_result is not None:
+            self._notify(sub, source.last_result)
+        if priority is not None:
+            self._dispatch(source, priority)
+
+    def _unsubscribe(self, source: _PollSource, sub: PollSubscription) -> None:
+        with suppress(ValueError):
+            source.subscribers.remove(sub)
+        if source.subscribers:
+            self._reschedule(source)
+            return
+        self._unschedule(source)
+        self._stop_watch(source)
+        self._stop_stream(source)
+        _safe_source_remove(source.coalesce_id)
+        source.coalesce_id = 0
+        if self._sources.get(source.key) is source:
+            del self._sources[source.key]
+
+    # ─── Suspend / Resume ────────────────────────────────────────────────────
+    def suspend(self) -> None:
+        """
+        Detach the wheel's timer source and stop the stream processes.
+        Subscriptions stay registered.
+        """
+        if self._suspended:
+            return
+        self._suspended = True
+        _safe_source_remove(self._tick_source_id)
+        self._tick_source_id = 0
+        _get_stream_hub().pause()
+
+    def resume(self) -> None:
+        """Re-arm the wheel, restart streams and refresh visible sources once."""
+        if not self._suspended:
             return
+        self._suspended = False
+        _get_stream_hub().resume()
+        self.boost_all()
+        if any(self._wheel):
+            self._arm()
+        # Deferred so widgets mapped by the window presentation count as visible
+        GLib.idle_add(self._refresh_active)
+
+    def stats(self) -> PollStats:
+        """Adaptive polling savings since startup."""
+        return PollStats(self._polls, self._fixed_polls)
+
+    # ─── Adaptive intervals ──────────────────────────────────────────────────
+    def boost_all(self) -> None:
+        """Snap every source back to its fastest interval (window activation)."""
+        for source in tuple(self._sources.values()):
+            self._boost(source)
+
+    def _boost(self, source: _PollSource) -> None:
+        if source.interval > source.base_interval > 0:
+            self._set_interval(source, source.base_interval)
+
+    def _adapt(self, source: _PollSource, changed: bool) -> None:
+        """Back off while results repeat; snap back as soon as one differs."""
+        if source.base_interval <= 0:
+            return
+        if changed:
+            target = source.base_interval
+        else:
+            target = min(source.interval * POLL_BACKOFF_FACTOR, source.max_interval)
+        if target != source.interval:
+            self._set_interval(source, target)
+
+    def _set_interval(self, source: _PollSource, interval: int) -> None:
+        source.interval = interval
+        if source.due_tick >= 0:
+            self._unschedule(source)
+            self._place(source, self._tick + interval)
+
+    def _refresh_active(self) -> bool:
+        for source in tuple(self._sources.values()):
+            if source.stale or source.has_active_subscriber():
+                self._dispatch(source)
+        return GLib.SOURCE_REMOVE
 
-        cmd = command.strip()
-        self._schedule_icon_fetch(cmd)
+    # ─── File watching ───────────────────────────────────────────────────────
+    def _start_watch(self, source: _PollSource) -> None:
+        """Attach an inotify monitor; on failure the source stays polled."""
+        if source.watch_path is None:
+            return
+        monitor = _create_file_monitor(source.watch_path)
+        if monitor is None:
+            return
+        source.monitor = monitor
+        source.monitor_handler = monitor.connect(
+            "changed", self._on_file_changed, source
+        )
 
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return
-            self._state.icon_source_id = GLib.timeout_add_seconds(
-                interval, self._icon_update_tick, cmd
+    def _stop_watch(self, source: _PollSource) -> None:
+        if source.monitor is not None:
+            with suppress(Exception):
+                source.monitor.disconnect(source.monitor_handler)
+                source.monitor.cancel()
+        source.monitor = None
+        source.monitor_handler = 0
+
+    def _on_file_changed(
+        self,
+        _monitor: Gio.FileMonitor,
+        _file: Gio.File,
+        _other: Gio.File | None,
+        event: Gio.FileMonitorEvent,
+        source: _PollSource,
+    ) -> None:
+        if event != Gio.FileMonitorEvent.ATTRIBUTE_CHANGED:
+            self._trigger(source)
+
+    # ─── Streams ─────────────────────────────────────────────────────────────
+    def _start_stream(self, source: _PollSource) -> None:
+        """Listen to the shared stream process; it falls back to polling if it dies."""
+        if source.stream is None:
+            return
+        source.stream_listener = _get_stream_hub().listen(
+            source.stream.command,
+            lambda line: self._on_stream_line(source, line),
+            lambda _running: self._reschedule(source),
+        )
+
+    def _stop_stream(self, source: _PollSource) -> None:
+        listener, source.stream_listener = source.stream_listener, None
+        if listener is not None:
+            listener.close()
+
+    def _on_stream_line(self, source: _PollSource, line: str) -> None:
+        stream = source.stream
+        if stream is None or (stream.pattern is not None and not stream.pattern.search(line)):
+            return
+        if self._suspended:
+            # Lines buffered before the pause; re-fetched on resume
+            source.stale = True
+            return
+        if not source.can_fetch():
+            # The line itself is the value: no fetch needed
+            self._deliver(source, PollResult(stdout=line))
+        else:
+            self._trigger(source)
+
+    # ─── Event coalescing ────────────────────────────────────────────────────
+    def _trigger(self, source: _PollSource) -> None:
+        """
+        Refresh a source after an event. The first event fires immediately;
+        further events within the coalescing window collapse into one trailing
+        refresh (e.g. the write, close and rename of one atomic save).
+        """
+        if source.coalesce_id:
+            source.trailing = True
+            return
+        self._refresh_for_event(source)
+        source.coalesce_id = GLib.timeout_add(
+            EVENT_COALESCE_MS, self._on_coalesce_window_end, source
+        )
+
+    def _on_coalesce_window_end(self, source: _PollSource) -> bool:
+        source.coalesce_id = 0
+        if source.trailing:
+            source.trailing = False
+            self._refresh_for_event(source)
+        return GLib.SOURCE_REMOVE
+
+    def _refresh_for_event(self, source: _PollSource) -> None:
+        # Stale sources are re-fetched on resume or when the running fetch ends
+        if self._suspended or source.in_flight:
+            source.stale = True
+        else:
+            self._dispatch(source)
+
+    # ─── Timer wheel ─────────────────────────────────────────────────────────
+    def _reschedule(self, source: _PollSource) -> None:
+        """Place a source on the wheel according to its subscribers' interval."""
+        base = source.wanted_interval()
+        ceiling = source.wanted_ceiling(base)
+        if (
+            base == source.base_interval
+            and ceiling == source.max_interval
+            and source.due_tick >= 0
+        ):
+            return
+        self._unschedule(source)
+        # Subscriber changes restart the backoff from the fast end
+        source.base_interval = source.interval = base
+        source.max_interval = ceiling
+        if base > 0:
+            self._place(source, self._tick + base)
+            self._arm()
+
+    def _place(self, source: _PollSource, due_tick: int) -> None:
+        source.due_tick = due_tick
+        self._wheel[due_tick % POLL_WHEEL_SLOTS].add(source)
+
+    def _unschedule(self, source: _PollSource) -> None:
+        if source.due_tick >= 0:
+            self._wheel[source.due_tick % POLL_WHEEL_SLOTS].discard(source)
+            source.due_tick = -1
+
+    def _arm(self) -> None:
+        if self._tick_source_id == 0 and not self._suspended:
+            self._tick_source_id = GLib.timeout_add_seconds(1, self._on_tick)
+
+    def _on_tick(self) -> bool:
+        """Advance the wheel by one second and dispatch every due source."""
+        self._tick += 1
+        slot = self._wheel[self._tick % POLL_WHEEL_SLOTS]
+        for source in tuple(slot):
+            if source.due_tick > self._tick:
+                continue  # Due in a later revolution of the wheel
+            slot.discard(source)
+            self._place(source, self._tick + source.interval)
+            # Skip fetches nobody can see, but keep the cadence
+            if source.has_active_subscriber():
+                self._polls += 1
+                self._fixed_polls += source.interval / source.base_interval
+                # Superseded by the next tick if it cannot start before then
+                self._dispatch(
+                    source,
+                    TaskPriority.VISIBLE,
+                    deadline=time.monotonic() + source.interval,
+                )
+
+        if any(self._wheel):
+            return GLib.SOURCE_CONTINUE
+        self._tick_source_id = 0
+        return GLib.SOURCE_REMOVE
+
+    # ─── Fetch & fan-out ─────────────────────────────────────────────────────
+    def _dispatch(
+        self,
+        source: _PollSource,
+        priority: TaskPriority | None = None,
+        *,
+        deadline: float | None = None,
+    ) -> None:
+        """
+        Fetch a source in the background unless a fetch is already running.
+        Without an explicit priority, sources nobody can see run as background.
+        """
+        if source.in_flight or not source.can_fetch():
+            return
+        if priority is None:
+            priority = (
+                TaskPriority.VISIBLE
+                if source.has_active_subscriber()
+                else TaskPriority.BACKGROUND
+            )
+        if source.spawn is not None:
+            # Runs on the main loop and completes there: no thread, no idle hop
+            spawn = source.spawn
+            source.in_flight = True
+            source.stale = False
+
+            def _start(release: Callable[[], None]) -> None:
+                def _done(result: PollResult) -> None:
+                    release()
+                    self._deliver(source, result)
+
+                spawn(_done)
+
+            _get_spawn_gate().submit(
+                _start,
+                priority,
+                deadline=deadline,
+                on_drop=lambda: self._on_fetch_dropped(source),
             )
+            return
+        fetch = source.fetch
+        assert fetch is not None
+        source.in_flight = True
+        source.stale = False
+
+        def _worker() -> None:
+            try:
+                result = fetch()
+            except Exception as e:
+                log.debug("Poll source %r failed: %s", source.key, e)
+                result = PollResult(failed=True)
+            GLib.idle_add(self._deliver, source, result)
+
+        def _dropped() -> None:
+            GLib.idle_add(self._on_fetch_dropped, source)
+
+        if not _submit_task_safe(
+            _worker, priority=priority, deadline=deadline, on_drop=_dropped
+        ):
+            source.in_flight = False
+
+    def _on_fetch_dropped(self, source: _PollSource) -> bool:
+        source.in_flight = False
+        if source.stale and source.subscribers and not self._suspended:
+            self._dispatch(source)
+        return GLib.SOURCE_REMOVE
+
+    def _deliver(self, source: _PollSource, result: PollResult) -> bool:
+        source.in_flight = False
+        previous, source.last_result = source.last_result, result
+        self._adapt(source, changed=result != previous)
+        for sub in tuple(source.subscribers):
+            self._notify(sub, result)
+        _get_state_store().publish(source.key, result)
+        if source.stale and source.subscribers and not self._suspended:
+            self._dispatch(source)  # An event arrived during the fetch
+        return GLib.SOURCE_REMOVE
+
+    @staticmethod
+    def _notify(sub: PollSubscription | StateWatch, result: PollResult) -> None:
+        try:
+            sub.callback(result)
+        except Exception as e:
+            log.error("Poll subscriber failed: %s", e)
+
+
+# =============================================================================
+# SHARED STATE STORE
+# =============================================================================
+class StateWatch:
+    """Handle returned by `StateStore.watch`. Cancel it on unbind."""
+
+    __slots__ = ("_store", "key", "callback")
+
+    def __init__(self, store: StateStore, key: Hashable, callback: PollCallback) -> None:
+        self._store: StateStore | None = store
+        self.key = key
+        self.callback = callback
+
+    def cancel(self) -> None:
+        """Stop receiving results. Safe to call more than once."""
+        store, self._store = self._store, None
+        if store is not None:
+            store._unwatch(self)
+
+
+class StateStore:
+    """
+    Last known result of every poll source, keyed like the scheduler and
+    kept after the source's widgets are gone.
+
+    Watchers are passive: they never create a source or trigger a fetch, so
+    a search result shows what the rows on the real pages last fetched and
+    follows their updates without spawning anything itself.
+    Must only be used from the main GTK thread.
+    """
+
+    __slots__ = ("_results", "_watches")
+    _instance: StateStore | None = None
+
+    def __new__(cls) -> StateStore:
+        if cls._instance is None:
+            instance = super().__new__(cls)
+            instance._results = {}
+            instance._watches = {}
+            cls._instance = instance
+        return cls._instance
 
-    def _icon_update_tick(self, command: str) -> bool:
-        """GLib timeout callback for periodic icon updates."""
-        # Optimization: Skip updates if widget is not visible
-        if isinstance(self, Gtk.Widget) and not self.get_mapped():
+    def get(self, key: Hashable) -> PollResult | None:
+        return self._results.get(key)
+
+    def publish(self, key: Hashable, result: PollResult) -> None:
+        self._results[key] = result
+        for watch in tuple(self._watches.get(key, ())):
+            PollScheduler._notify(watch, result)
+
+    def watch(self, key: Hashable, callback: PollCallback) -> StateWatch:
+        """Follow a source. The last known result, if any, is delivered synchronously."""
+        watch = StateWatch(self, key, callback)
+        self._watches.setdefault(key, []).append(watch)
+        if (result := self._results.get(key)) is not None:
+            PollScheduler._notify(watch, result)
+        return watch
+
+    def _unwatch(self, watch: StateWatch) -> None:
+        watches = self._watches.get(watch.key)
+        if watches is None:
+            return
+        with suppress(ValueError):
+            watches.remove(watch)
+        if not watches:
+            del self._watches[watch.key]
+
+
+def _get_state_store() -> StateStore:
+    """Module-level accessor for the singleton state store."""
+    return StateStore()
+
+
+# =============================================================================
+# ASYNC PROCESS RUNNER (GLib Child Watch)
+# =============================================================================
+_timeout_lock: Final = threading.Lock()
+_timeout_counts: dict[str, int] = {}
+
+
+def _record_timeout(command: str) -> None:
+    """Count a timed-out command for diagnostics."""
+    with _timeout_lock:
+        count = _timeout_counts.get(command, 0) + 1
+        _timeout_counts[command] = count
+    log.debug("Command timed out (%d times so far): %s", count, command[:60])
+
+
+def get_timeout_counts() -> dict[str, int]:
+    """Timeouts per command since startup, most frequent first."""
+    with _timeout_lock:
+        return dict(sorted(_timeout_counts.items(), key=lambda kv: kv[1], reverse=True))
+
+
+def _kill_process_group(pid: int) -> None:
+    """SIGKILL every process in the group led by `pid` (its own session)."""
+    with suppress(ProcessLookupError, PermissionError):
+        os.killpg(pid, signal.SIGKILL)
+
+
+class _AsyncProcess:
+    """State of one child started by `_spawn_process`."""
+
+    __slots__ = (
+        "command", "proc", "pipeline", "on_done", "max_bytes", "output", "truncated",
+        "watch_ids", "open_pipes", "status", "timeout_id", "timed_out", "done",
+    )
+
+    def __init__(
+        self,
+        command: str,
+        proc: subprocess.Popen[bytes],
+        pipeline: Pipeline | None,
+        on_done: PollCallback,
+        max_bytes: int,
+    ) -> None:
+        self.command = command
+        self.proc = proc
+        self.pipeline = pipeline
+        self.on_done = on_done
+        self.max_bytes = max_bytes
+        # Captured stdout and stderr
+        self.output = (bytearray(), bytearray())
+        self.truncated = False
+        self.watch_ids: list[int] = []
+        self.open_pipes: set[int] = set()
+        self.status: int | None = None
+        self.timeout_id = 0
+        self.timed_out = False
+        self.done = False
+
+
+def _spawn_process(
+    argv: Sequence[str],
+    timeout: int,
+    on_done: PollCallback,
+    pipeline: Pipeline | None = None,
+    *,
+    max_bytes: int = COMMAND_OUTPUT_MAX_BYTES,
+) -> None:
+    """
+    Run `argv` without occupying any thread. The child leads its own session,
+    so a timeout kills the whole process tree (e.g. every stage of an
+    `sh -c` pipeline), not just the shell. GLib reaps it through a child
+    watch, the main loop drains its pipes (keeping at most `max_bytes` of
+    each) and the timeout is a main-loop timer. `on_done` is called exactly
+    once, on the main loop. A compiled pipeline's filters are applied to the
+    output.
+    """
+    command = shlex.join(argv)
+    try:
+        proc = subprocess.Popen(
+            list(argv),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+    except OSError as e:
+        # Direct exec failing is what `sh` reports as "not found"
+        if pipeline is not None:
+            result = _completed_result(
+                pipeline.finish("", f"{argv[0]}: {e.strerror}\n", EXIT_NOT_FOUND)
+            )
+        else:
+            log.debug("Failed to spawn %s: %s", argv[0], e)
+            result = PollResult(failed=True)
+        GLib.idle_add(_complete_spawn, on_done, result)
+        return
+
+    run = _AsyncProcess(command, proc, pipeline, on_done, max_bytes)
+    condition = GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR
+    for index, stream in enumerate((proc.stdout, proc.stderr)):
+        assert stream is not None
+        fd = stream.fileno()
+        os.set_blocking(fd, False)
+        run.open_pipes.add(index)
+        run.watch_ids.append(GLib.io_add_watch(
+            fd, GLib.PRIORITY_DEFAULT, condition, _on_child_output, run, index
+        ))
+    GLib.child_watch_add(GLib.PRIORITY_DEFAULT, proc.pid, _on_child_exit, run)
+    run.timeout_id = GLib.timeout_add_seconds(timeout, _on_spawn_timeout, run)
+
+
+def _complete_spawn(on_done: PollCallback, result: PollResult) -> bool:
+    on_done(result)
+    return GLib.SOURCE_REMOVE
+
+
+def _on_child_output(
+    fd: int, _condition: GLib.IOCondition, run: _AsyncProcess, index: int
+) -> bool:
+    try:
+        chunk = os.read(fd, STREAM_LINE_MAX_BYTES)
+    except BlockingIOError:
+        return GLib.SOURCE_CONTINUE
+    except OSError:
+        chunk = b""
+
+    if not chunk:
+        run.open_pipes.discard(index)
+        # GLib drops the source on SOURCE_REMOVE; never remove it twice
+        run.watch_ids[index] = 0
+        _maybe_finish_spawn(run)
+        return GLib.SOURCE_REMOVE
+
+    # Keep draining past the cap so the child never blocks on a full pipe
+    buf = run.output[index]
+    room = run.max_bytes - len(buf)
+    if room > 0:
+        buf += chunk[:room]
+    if len(chunk) > room:
+        run.truncated = True
+    return GLib.SOURCE_CONTINUE
+
+
+def _on_child_exit(_pid: int, wait_status: int, run: _AsyncProcess) -> None:
+    code = os.waitstatus_to_exitcode(wait_status)
+    # Same convention as the shell for signalled children
+    run.status = code if code >= 0 else 128 - code
+    # GLib reaped the child; stop Popen from trying to reap it again
+    run.proc.returncode = run.status
+    _maybe_finish_spawn(run)
+
+
+def _on_spawn_timeout(run: _AsyncProcess) -> bool:
+    run.timeout_id = 0
+    run.timed_out = True
+    _record_timeout(run.command)
+    _kill_process_group(run.proc.pid)
+    # A child that left the group may still hold the pipes: stop reading now
+    run.open_pipes.clear()
+    _maybe_finish_spawn(run)
+    return GLib.SOURCE_REMOVE
+
+
+def _maybe_finish_spawn(run: _AsyncProcess) -> None:
+    """Deliver the result once the child is reaped and its pipes are drained."""
+    if run.done or run.status is None or run.open_pipes:
+        return
+    run.done = True
+    _batch_source_remove(run.timeout_id, *run.watch_ids)
+    for stream in (run.proc.stdout, run.proc.stderr):
+        if stream is not None:
+            with suppress(OSError):
+                stream.close()
+
+    if run.timed_out:
+        run.on_done(PollResult(timed_out=True))
+        return
+    if run.truncated:
+        log.debug("Output capped at %d bytes: %s", run.max_bytes, run.command[:60])
+
+    stdout, stderr = (bytes(buf).decode("utf-8", errors="replace") for buf in run.output)
+    if run.pipeline is not None:
+        run.on_done(_completed_result(run.pipeline.finish(stdout, stderr, run.status)))
+    else:
+        run.on_done(PollResult(stdout=stdout, stderr=stderr, returncode=run.status))
+
+
+def _completed_result(res: subprocess.CompletedProcess[str]) -> PollResult:
+    return PollResult(stdout=res.stdout, stderr=res.stderr, returncode=res.returncode)
+
+
+# =============================================================================
+# STREAM SOURCES (Long-lived Event Commands)
+# =============================================================================
+class _StreamListener:
+    """One consumer of a shared stream process."""
+
+    __slots__ = ("_hub", "_process", "on_line", "on_state")
+
+    def __init__(
+        self,
+        hub: StreamHub,
+        process: _StreamProcess,
+        on_line: Callable[[str], None],
+        on_state: Callable[[bool], None],
+    ) -> None:
+        self._hub = hub
+        self._process: _StreamProcess | None = process
+        self.on_line = on_line
+        self.on_state = on_state
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.proc is not None
+
+    def close(self) -> None:
+        """Stop listening; the process exits once nobody listens."""
+        process, self._process = self._process, None
+        if process is not None:
+            self._hub._unlisten(process, self)
+
+
+class _StreamProcess:
+    """A long-lived command whose stdout lines are fanned out to listeners."""
+
+    __slots__ = (
+        "command", "proc", "watch_id", "buffer", "listeners",
+        "restart_id", "restart_delay", "started_at",
+    )
+
+    def __init__(self, command: str) -> None:
+        self.command = command
+        self.proc: subprocess.Popen[bytes] | None = None
+        self.watch_id = 0
+        self.buffer = b""
+        self.listeners: list[_StreamListener] = []
+        self.restart_id = 0
+        self.restart_delay = STREAM_RESTART_MIN_SECONDS
+        self.started_at = 0.0
+
+
+class StreamHub:
+    """
+    Runs each long-lived event command (`pactl subscribe`, `nmcli monitor`,
+    `udevadm monitor`, ...) exactly once, however many sources listen to it.
+    Output is read non-blocking from the GLib main loop, so an idle stream
+    costs no thread and no wakeups. Dead streams are restarted with backoff.
+    While paused (window hidden) no stream process runs at all.
+    Must only be used from the main GTK thread.
+    """
+
+    __slots__ = ("_processes", "_paused")
+    _instance: StreamHub | None = None
+
+    def __new__(cls) -> StreamHub:
+        if cls._instance is None:
+            instance = super().__new__(cls)
+            instance._processes = {}
+            instance._paused = False
+            atexit.register(instance.shutdown)
+            cls._instance = instance
+        return cls._instance
+
+    def listen(
+        self,
+        command: str,
+        on_line: Callable[[str], None],
+        on_state: Callable[[bool], None],
+    ) -> _StreamListener:
+        """Attach to the process for `command`, spawning it on first use."""
+        process = self._processes.get(command)
+        if process is None:
+            process = _StreamProcess(command)
+            self._processes[command] = process
+        listener = _StreamListener(self, process, on_line, on_state)
+        process.listeners.append(listener)
+        if process.proc is None and process.restart_id == 0 and not self._paused:
+            self._spawn(process)
+        return listener
+
+    def pause(self) -> None:
+        """Stop every stream process; listeners stay attached."""
+        if self._paused:
+            return
+        self._paused = True
+        for process in tuple(self._processes.values()):
+            running = process.proc is not None
+            self._stop(process)
+            if running:
+                self._notify_state(process, False)
+
+    def resume(self) -> None:
+        """Restart the stream processes stopped by `pause`."""
+        if not self._paused:
+            return
+        self._paused = False
+        for process in tuple(self._processes.values()):
+            # A pause is not a failure: start over with the shortest backoff
+            process.restart_delay = STREAM_RESTART_MIN_SECONDS
+            if process.listeners and process.proc is None:
+                self._spawn(process)
+
+    def _unlisten(self, process: _StreamProcess, listener: _StreamListener) -> None:
+        with suppress(ValueError):
+            process.listeners.remove(listener)
+        if process.listeners:
+            return
+        self._stop(process)
+        if self._processes.get(process.command) is process:
+            del self._processes[process.command]
+
+    def shutdown(self) -> None:
+        """Terminate every stream process (registered with atexit)."""
+        for process in tuple(self._processes.values()):
+            self._stop(process, wait=True)
+        self._processes.clear()
+
+    def _spawn(self, process: _StreamProcess) -> None:
+        process.restart_id = 0
+        try:
+            proc = subprocess.Popen(
+                ["sh", "-c", process.command],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+                close_fds=True,
+            )
+        except OSError as e:
+            log.warning("Stream command failed to start: %s (%s)", process.command, e)
+            self._schedule_restart(process)
+            return
+
+        assert proc.stdout is not None
+        fd = proc.stdout.fileno()
+        os.set_blocking(fd, False)
+        process.proc = proc
+        process.buffer = b""
+        process.started_at = time.monotonic()
+        process.watch_id = GLib.io_add_watch(
+            fd,
+            GLib.PRIORITY_DEFAULT,
+            GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR,
+            self._on_readable,
+            process,
+        )
+        self._notify_state(process, True)
+
+    def _on_readable(
+        self, fd: int, _condition: GLib.IOCondition, process: _StreamProcess
+    ) -> bool:
+        try:
+            chunk = os.read(fd, STREAM_LINE_MAX_BYTES)
+        except BlockingIOError:
             return GLib.SOURCE_CONTINUE
+        except OSError:
+            chunk = b""
+
+        if not chunk:
+            # EOF: the command exited (or closed stdout)
+            process.watch_id = 0
+            log.debug("Stream ended: %s", process.command)
+            self._stop(process)
+            self._notify_state(process, False)
+            self._schedule_restart(process)
+            return GLib.SOURCE_REMOVE
 
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return GLib.SOURCE_REMOVE
-            # State Guard: Prevent spawning overlapping fetches
-            if self._state.is_icon_updating:
-                return GLib.SOURCE_CONTINUE
-            self._state.is_icon_updating = True
+        *lines, process.buffer = (process.buffer + chunk).split(b"\n")
+        if len(process.buffer) > STREAM_LINE_MAX_BYTES:
+            process.buffer = b""  # Runaway line without a newline
 
-        self._schedule_icon_fetch(command)
+        for raw in lines:
+            line = raw.decode("utf-8", errors="replace").rstrip("\r")
+            for listener in tuple(process.listeners):
+                try:
+                    listener.on_line(line)
+                except Exception as e:
+                    log.error("Stream listener failed: %s", e)
         return GLib.SOURCE_CONTINUE
 
-    def _schedule_icon_fetch(self, command: str) -> None:
-        """Submit icon fetch to the background executor."""
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return
+    def _stop(self, process: _StreamProcess, *, wait: bool = False) -> None:
+        _batch_source_remove(process.watch_id, process.restart_id)
+        process.watch_id = 0
+        process.restart_id = 0
+        proc, process.proc = process.proc, None
+        if proc is None:
+            return
+        # Reaping may block briefly, so keep it off the main loop when possible
+        if wait or not _submit_task_safe(lambda: _terminate_process_group(proc)):
+            _terminate_process_group(proc)
+
+    def _schedule_restart(self, process: _StreamProcess) -> None:
+        if not process.listeners or process.restart_id or self._paused:
+            return
+        # A stream that ran for a while earns a fast restart again
+        if time.monotonic() - process.started_at > STREAM_RESTART_MAX_SECONDS:
+            process.restart_delay = STREAM_RESTART_MIN_SECONDS
+        delay = process.restart_delay
+        process.restart_delay = min(delay * 2, STREAM_RESTART_MAX_SECONDS)
+        process.restart_id = GLib.timeout_add_seconds(delay, self._on_restart, process)
+
+    def _on_restart(self, process: _StreamProcess) -> bool:
+        process.restart_id = 0
+        if process.listeners and process.proc is None and not self._paused:
+            self._spawn(process)
+        return GLib.SOURCE_REMOVE
+
+    @staticmethod
+    def _notify_state(process: _StreamProcess, running: bool) -> None:
+        for listener in tuple(process.listeners):
+            try:
+                listener.on_state(running)
+            except Exception as e:
+                log.error("Stream listener failed: %s", e)
+
+
+def _get_stream_hub() -> StreamHub:
+    """Module-level accessor for the singleton stream hub."""
+    return StreamHub()
+
+
+def _terminate_process_group(proc: subprocess.Popen[bytes]) -> None:
+    """SIGTERM a session leader's group, escalate to SIGKILL, then reap it."""
+    with suppress(ProcessLookupError, PermissionError):
+        os.killpg(proc.pid, signal.SIGTERM)
+    try:
+        proc.wait(timeout=SUBPROCESS_TIMEOUT_SHORT)
+    except subprocess.TimeoutExpired:
+        with suppress(ProcessLookupError, PermissionError):
+            os.killpg(proc.pid, signal.SIGKILL)
+        with suppress(subprocess.TimeoutExpired):
+            proc.wait(timeout=SUBPROCESS_TIMEOUT_SHORT)
+    if proc.stdout is not None:
+        with suppress(OSError):
+            proc.stdout.close()
+
+
+def _get_scheduler() -> PollScheduler:
+    """Module-level accessor for the singleton poll scheduler."""
+    return PollScheduler()
+
+
+def suspend_pollers() -> None:
+    """Stop all periodic polling, e.g. while the window is hidden."""
+    _get_scheduler().suspend()
 
-        # Use safe submitter
-        if not _submit_task_safe(lambda: self._fetch_icon_async(command), self._state):
-            # If submission failed (shutdown), clear the flag
-            with self._state.lock:
-                self._state.is_icon_updating = False
 
-    def _fetch_icon_async(self, command: str) -> None:
-        """Execute icon command in a background thread."""
-        new_icon: str | None = None
+def resume_pollers() -> None:
+    """Restart periodic polling and refresh what is visible immediately."""
+    _get_scheduler().resume()
+
+
+def boost_pollers() -> None:
+    """Reset every adaptive interval to its minimum, e.g. on window activation."""
+    _get_scheduler().boost_all()
+
+
+def get_poll_stats() -> PollStats:
+    """Periodic fetches performed versus fixed-interval polling."""
+    return _get_scheduler().stats()
+
+
+def _poll_intervals(
+    minimum: int | None, maximum: int | None, default: int
+) -> tuple[int, int]:
+    """
+    Resolve compiled `(min, max)` poll intervals; unset values take `default`
+    and the backoff ceiling. A minimum of 0 disables polling.
+    """
+    if minimum is None:
+        minimum = default
+    if minimum <= 0:
+        return 0, 0
+    if maximum is None:
+        maximum = min(minimum * POLL_BACKOFF_MAX_MULTIPLIER, POLL_BACKOFF_CEILING_SECONDS)
+    return minimum, max(maximum, minimum)
+
+
+def _run_shell_command(
+    command: str,
+    timeout: int,
+    pipeline: Pipeline | None = None,
+    *,
+    max_bytes: int = COMMAND_OUTPUT_MAX_BYTES,
+) -> PollResult:
+    """
+    Run a shell command and capture its output, blocking the calling thread.
+    A compiled pipeline runs in-process instead of forking `sh` and one helper
+    per stage. The shell leads its own session so a timeout kills every
+    stage, not just `sh`; output beyond `max_bytes` per stream is dropped.
+    """
+    try:
+        if pipeline is not None:
+            return _completed_result(pipeline.run(timeout))
+        proc = subprocess.Popen(
+            command,
+            shell=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+    except subprocess.TimeoutExpired:
+        _record_timeout(command)
+        return PollResult(timed_out=True)
+    except (OSError, subprocess.SubprocessError):
+        return PollResult(failed=True)
+
+    try:
+        out, err = _communicate_capped(proc, timeout, max_bytes)
+    except subprocess.TimeoutExpired:
+        _record_timeout(command)
+        _kill_process_group(proc.pid)
+        # Reap the shell; pipes held by escaped children are abandoned
+        with suppress(subprocess.TimeoutExpired):
+            proc.wait(timeout=SUBPROCESS_TIMEOUT_SHORT)
+        for stream in (proc.stdout, proc.stderr):
+            if stream is not None:
+                with suppress(OSError):
+                    stream.close()
+        return PollResult(timed_out=True)
+
+    return PollResult(
+        stdout=out.decode("utf-8", errors="replace"),
+        stderr=err.decode("utf-8", errors="replace"),
+        returncode=proc.returncode,
+    )
+
+
+def _communicate_capped(
+    proc: subprocess.Popen[bytes], timeout: int, max_bytes: int
+) -> tuple[bytes, bytes]:
+    """
+    Like `communicate`, but at most `max_bytes` of each stream is buffered;
+    the rest is read and discarded so the child never blocks on a full pipe.
+    Raises `subprocess.TimeoutExpired` when `timeout` seconds pass first.
+    """
+    deadline = time.monotonic() + timeout
+    output = (bytearray(), bytearray())
+    with selectors.DefaultSelector() as selector:
+        for index, stream in enumerate((proc.stdout, proc.stderr)):
+            if stream is not None:
+                selector.register(stream, selectors.EVENT_READ, index)
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+            for key, _events in selector.select(remaining):
+                chunk = os.read(key.fd, STREAM_LINE_MAX_BYTES)
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+                    continue
+                buf = output[key.data]
+                if (room := max_bytes - len(buf)) > 0:
+                    buf += chunk[:room]
+    proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+    return bytes(output[0]), bytes(output[1])
+
+
+def _read_file_result(path: Path) -> PollResult:
+    """Read a text file; a missing or unreadable file yields returncode 1."""
+    try:
+        return PollResult(stdout=path.read_text(encoding="utf-8"))
+    except OSError:
+        return PollResult(returncode=1)
+
+
+@lru_cache(maxsize=1)
+def _mount_table() -> tuple[tuple[str, str], ...]:
+    """(mount point, fs type) pairs, longest mount point first."""
+    mounts: list[tuple[str, str]] = []
+    try:
+        for line in Path("/proc/self/mounts").read_text(encoding="utf-8").splitlines():
+            parts = line.split()
+            if len(parts) >= 3:
+                mounts.append((parts[1].replace("\\040", " "), parts[2]))
+    except OSError:
+        pass
+    return tuple(sorted(mounts, key=lambda m: len(m[0]), reverse=True))
+
+
+def _is_watchable_path(path: Path) -> bool:
+    """Whether inotify reliably reports changes for files under this path."""
+    try:
+        target = str(path.parent.resolve(strict=True))
+    except OSError:
+        return False  # Missing parent: GLib would poll for it anyway
+    for mount_point, fs_type in _mount_table():
+        if target == mount_point or target.startswith(mount_point.rstrip("/") + "/"):
+            return fs_type not in UNWATCHABLE_FS_TYPES
+    return True
+
+
+def _create_file_monitor(path: Path) -> Gio.FileMonitor | None:
+    """Watch a file via inotify. None means the caller must poll instead."""
+    if not _is_watchable_path(path):
+        return None
+    try:
+        monitor = Gio.File.new_for_path(str(path)).monitor_file(
+            Gio.FileMonitorFlags.NONE, None
+        )
+    except GLib.Error as e:
+        log.debug("Cannot watch %s, falling back to polling: %s", path, e.message)
+        return None
+    # GIO silently degrades to stat() polling when no kernel backend is usable
+    if monitor.__gtype__.name == "GPollFileMonitor":
+        monitor.cancel()
+        return None
+    monitor.set_rate_limit(EVENT_COALESCE_MS)
+    return monitor
+
+
+def _command_source(command: str, timeout: int = SUBPROCESS_TIMEOUT_SHORT) -> PollSourceSpec:
+    """
+    Source spec for a shell command, keyed by the command string and timeout
+    (a label and a state poller running the same command must not share one
+    timeout). The command is compiled once here; unsupported syntax keeps
+    running under `sh -c`. Processes are spawned from the main loop; only a
+    compiled `cat FILE` pipeline, which needs no process at all, is read on
+    the executor.
+    """
+    key = ("exec", command, timeout)
+    pipeline = compile_command(command)
+    if pipeline is not None and pipeline.source_file is not None:
+        return PollSourceSpec(key, lambda: _run_shell_command(command, timeout, pipeline))
+
+    argv = pipeline.argv if pipeline is not None else ("sh", "-c", command)
+    return PollSourceSpec(
+        key,
+        None,
+        spawn=lambda on_done: _spawn_process(argv, timeout, on_done, pipeline),
+    )
+
+
+def _file_source(path: str) -> PollSourceSpec:
+    """Source spec for a text file, keyed by its expanded path."""
+    expanded = _expand_path(path)
+    return PollSourceSpec(
+        ("file", expanded), lambda: _read_file_result(expanded), expanded
+    )
+
+
+def _provider_source(name: str) -> PollSourceSpec | None:
+    """Source spec for an in-process /proc or /sys value provider."""
+    if not name:
+        return None
+
+    def fetch() -> PollResult:
+        value = utility.get_provider_value(name)
+        return PollResult(returncode=1) if value is None else PollResult(stdout=value)
+
+    return PollSourceSpec(("provider", name), fetch)
+
+
+def _stream_source(config: Mapping[str, object], timeout: int) -> PollSourceSpec | None:
+    """
+    Source spec for `type: stream`: a long-lived `command` whose lines
+    (optionally filtered by the `match` regex) either re-run the cheap `query`
+    (a command or source mapping) or, without one, are the value themselves.
+    """
+    command = str(config.get("command", "")).strip()
+    if not command:
+        return None
+
+    match_expr = str(config.get("match", "") or "")
+    pattern: re.Pattern[str] | None = None
+    if match_expr:
         try:
-            with self._state.lock:
-                if self._state.is_destroyed:
-                    return
+            pattern = re.compile(match_expr)
+        except re.error as e:
+            log.warning("Invalid stream match %r (%s); matching literally", match_expr, e)
+            pattern = re.compile(re.escape(match_expr))
+
+    # The query may be a command string or any other source mapping
+    query = _resolve_source(config.get("query"), timeout)
+    return PollSourceSpec(
+        ("stream", command, match_expr, query.key if query else None),
+        query.fetch if query else None,
+        stream=StreamSpec(command, pattern),
+        spawn=query.spawn if query else None,
+    )
+
+
+def _resolve_source(config: object, timeout: int) -> PollSourceSpec | None:
+    """
+    Map a value/state source to a shared source spec. Accepts a shell
+    command string or a dict with `type: exec | file | system | stream`.
+    """
+    if isinstance(config, str):
+        cmd = config.strip()
+        if not cmd:
+            return None
+        # Optimization: bypass subprocess for simple `cat` commands
+        if cmd.startswith("cat "):
+            try:
+                parts = shlex.split(cmd)
+                if len(parts) == 2:
+                    return _file_source(parts[1])
+            except ValueError:
+                pass
+        return _command_source(cmd, timeout)
+
+    if not isinstance(config, dict):
+        return None
+
+    match config.get("type"):
+        case "exec":
+            return _resolve_source(str(config.get("command", "")), timeout)
+        case "file":
+            path = str(config.get("path", "")).strip()
+            return _file_source(path) if path else None
+        case "system":
+            key = str(config.get("key", ""))
+            return PollSourceSpec(
+                ("system", key),
+                lambda: PollResult(stdout=utility.get_system_value(key) or LABEL_NA),
+            )
+        case "provider":
+            return _provider_source(str(config.get("name", "")))
+        case "stream":
+            return _stream_source(config, timeout)
+    return None
+
+
+def _setting_source(key: str, inverse: bool) -> PollSourceSpec:
+    """Source spec for a boolean settings key, reported as 'true'/'false'."""
+
+    def _fetch() -> PollResult:
+        value = utility.load_setting(key, default=False, is_inversed=inverse)
+        return PollResult(stdout="true" if value else "false")
+
+    return PollSourceSpec(
+        ("setting", key, inverse), _fetch, utility.get_setting_path(key)
+    )
+
+
+def _state_source(item: ItemModel) -> PollSourceSpec | None:
+    """Map a toggle's `state_command` or `key` to a shared source."""
+    if spec := _resolve_source(item.state_command, SUBPROCESS_TIMEOUT_SHORT):
+        return spec
+    if item.key:
+        return _setting_source(item.key, item.key_inverse)
+    return None
+
+
+def _label_source(val: ValueConfig) -> PollSourceSpec | None:
+    """Map a dynamic label ValueConfig to a shared source; None if static."""
+    # A bare string is static text here, not a command
+    if not isinstance(val, dict):
+        return None
+    return _resolve_source(val, SUBPROCESS_TIMEOUT_LONG)
+
+
+def _static_text(val: ValueConfig) -> str:
+    """Resolve a ValueConfig that needs no fetching to its text."""
+    if isinstance(val, str):
+        return val
+    if isinstance(val, dict) and val.get("type") == "static":
+        return str(val.get("text", LABEL_NA))
+    return LABEL_NA
+
+
+# ─── Result Translation (shared by rows and search results) ───
+def _state_from_result(result: PollResult) -> bool | None:
+    """Toggle state of a result; None when the fetch failed."""
+    if result.timed_out or result.failed:
+        return None
+    return result.stdout.strip().lower() in TRUE_VALUES
+
+
+def _number_from_result(result: PollResult) -> float | None:
+    if not result.ok:
+        return None
+    try:
+        return float(result.stdout.strip())
+    except ValueError:
+        return None
+
+
+def _label_from_result(result: PollResult) -> str:
+    if result.timed_out:
+        return LABEL_TIMEOUT
+    if result.failed:
+        return LABEL_ERROR
+    return result.stdout.strip() or LABEL_NA
+
+
+def _subscribe_source(
+    state: WidgetState,
+    widget: Gtk.Widget,
+    spec: PollSourceSpec,
+    callback: PollCallback,
+    interval: int,
+    max_interval: int = 0,
+    *,
+    immediate: bool = True,
+) -> PollSubscription | None:
+    """
+    Subscribe a widget to a shared source. Periodic fetches only run while
+    the widget is mapped; the subscription is cancelled by `_release_state`.
+    """
+    with state.lock:
+        if state.is_destroyed:
+            return None
+
+    sub = _get_scheduler().subscribe(
+        spec,
+        callback,
+        interval=interval,
+        max_interval=max_interval,
+        is_active=widget.get_mapped,
+        immediate=immediate,
+    )
+    with state.lock:
+        if not state.is_destroyed:
+            state.subscriptions.append(sub)
+            return sub
+    sub.cancel()
+    return None
+
+
+# =============================================================================
+# SUBPAGE CACHE
+# =============================================================================
+class SubpageCache:
+    """
+    LRU of built subpages for one root NavigationView, keyed by config path.
+    Cached pages are permanently added to the view, so popping one keeps its
+    rows and their last values alive; unmapped rows do not poll. Evicted pages
+    are removed from the view and clean up through `do_unroot`.
+
+    Each entry remembers the item that built it: a hot reload may replace
+    that item, and a recycled `id()` must not hand out a stale page.
+    """
+
+    __slots__ = ("_nav_view", "_pages", "_capacity")
+
+    def __init__(
+        self, nav_view: Adw.NavigationView, capacity: int = SUBPAGE_CACHE_SIZE
+    ) -> None:
+        self._nav_view = nav_view
+        self._pages: OrderedDict[Hashable, tuple[object, Adw.NavigationPage]] = (
+            OrderedDict()
+        )
+        self._capacity = max(1, capacity)
+
+    def get(self, key: Hashable, owner: object) -> Adw.NavigationPage | None:
+        entry = self._pages.get(key)
+        if entry is None or entry[0] is not owner:
+            return None
+        self._pages.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, owner: object, page: Adw.NavigationPage) -> None:
+        if (replaced := self._pages.pop(key, None)) is not None:
+            self._nav_view.remove(replaced[1])
+        self._nav_view.add(page)
+        self._pages[key] = (owner, page)
+        while len(self._pages) > self._capacity:
+            _key, (_owner, stale) = self._pages.popitem(last=False)
+            # Deferred by the view until the page is popped if it is on the stack
+            self._nav_view.remove(stale)
+
+
+# =============================================================================
+# MIXIN: DYNAMIC ICON UPDATES
+# =============================================================================
+class DynamicIconMixin:
+    """
+    Mixin providing dynamic icon updates via a shared polled command.
+    Identical icon commands across widgets are fetched once per interval.
+    """
+
+    _state: WidgetState
+    icon_widget: Gtk.Image
+
+    def _start_icon_update_loop(self, icon: IconSpec) -> None:
+        """Subscribe the icon to its command source."""
+        if not icon.dynamic:
+            return
+        interval, max_interval = _poll_intervals(
+            icon.interval, icon.max_interval, DEFAULT_INTERVAL_SECONDS
+        )
 
-            # Subprocess runs OUTSIDE the lock to prevent blocking
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=SUBPROCESS_TIMEOUT_SHORT,
-            )
-            new_icon = result.stdout.strip()
-        except subprocess.TimeoutExpired:
-            log.debug("Icon command timed out: %s...", command[:20])
-        except subprocess.SubprocessError:
-            pass
-        finally:
-            with self._state.lock:
-                self._state.is_icon_updating = False
+        _subscribe_source(
+            self._state,
+            self,
+            _command_source(icon.command, SUBPROCESS_TIMEOUT_SHORT),
+            self._on_icon_result,
+            interval,
+            max_interval,
+        )
 
-        if new_icon:
-            # Schedule UI update on main thread
-            GLib.idle_add(self._apply_icon_update, new_icon)
+    def _on_icon_result(self, result: PollResult) -> None:
+        """Shared-source callback for icon command output."""
+        if new_icon := result.stdout.strip():
+            self._apply_icon_update(new_icon)
 
     def _apply_icon_update(self, new_icon: str) -> bool:
         """Apply icon update on main thread."""
@@ -477,86 +2314,44 @@ class DynamicIconMixin:
 # =============================================================================
 class StateMonitorMixin:
     """
-    Mixin providing external state monitoring via periodic polling.
+    Mixin providing external state monitoring via the shared poll scheduler.
     Used by toggle widgets to sync with system state.
     """
 
     _state: WidgetState
-    properties: RowProperties
-    key_inverse: bool
+    item: ItemModel
 
     def _start_state_monitor(self) -> None:
-        """Initialize state monitoring loop if configured."""
-        has_key = bool(self.properties.get("key", ""))
-        has_state_cmd = bool(self.properties.get("state_command", ""))
-        if not has_key and not has_state_cmd:
-            return
-
-        interval = _safe_int(
-            self.properties.get("interval"), MONITOR_INTERVAL_SECONDS
+        """Subscribe to the state source if configured."""
+        interval, max_interval = _poll_intervals(
+            self.item.interval, self.item.max_interval, MONITOR_INTERVAL_SECONDS
         )
         if interval <= 0:
             return
 
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return
-            self._state.monitor_source_id = GLib.timeout_add_seconds(
-                interval, self._monitor_state_tick
-            )
-
-    def _monitor_state_tick(self) -> bool:
-        """GLib timeout callback for periodic state checks."""
-        if isinstance(self, Gtk.Widget) and not self.get_mapped():
-            return GLib.SOURCE_CONTINUE
-
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return GLib.SOURCE_REMOVE
-            if self._state.is_monitoring:
-                return GLib.SOURCE_CONTINUE
-            self._state.is_monitoring = True
-
-        if not _submit_task_safe(self._check_state_async, self._state):
-            with self._state.lock:
-                self._state.is_monitoring = False
+        spec = self._resolve_state_source()
+        if spec is None:
+            return
 
-        return GLib.SOURCE_CONTINUE
+        # Settings keys are loaded synchronously at construction time
+        _subscribe_source(
+            self._state,
+            self,
+            spec,
+            self._on_state_result,
+            interval,
+            max_interval,
+            immediate=spec.key[0] != "setting",
+        )
 
-    def _check_state_async(self) -> None:
-        """Check external state in a background thread."""
-        new_state: bool | None = None
-        try:
-            with self._state.lock:
-                if self._state.is_destroyed:
-                    return
-
-            state_cmd = self.properties.get("state_command", "")
-            if isinstance(state_cmd, str) and state_cmd.strip():
-                result = subprocess.run(
-                    state_cmd.strip(),
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=SUBPROCESS_TIMEOUT_SHORT,
-                )
-                new_state = result.stdout.strip().lower() in TRUE_VALUES
-            else:
-                key = self.properties.get("key", "")
-                if isinstance(key, str) and key.strip():
-                    val = utility.load_setting(
-                        key.strip(), default=False, is_inversed=self.key_inverse
-                    )
-                    if isinstance(val, bool):
-                        new_state = val
-        except (subprocess.TimeoutExpired, OSError, subprocess.SubprocessError):
-            pass
-        finally:
-            with self._state.lock:
-                self._state.is_monitoring = False
+    def _resolve_state_source(self) -> PollSourceSpec | None:
+        """Map `state_command` or `key` to a shared source."""
+        return _state_source(self.item)
 
-        if new_state is not None:
-            GLib.idle_add(self._apply_state_update, new_state)
+    def _on_state_result(self, result: PollResult) -> None:
+        """Shared-source callback translating output to a boolean state."""
+        if (state := _state_from_result(result)) is not None:
+            self._apply_state_update(state)
 
     def _apply_state_update(self, new_state: bool) -> bool:
         """Apply state update on main thread. Must be overridden."""
@@ -568,85 +2363,34 @@ class StateMonitorMixin:
 # =============================================================================
 class SliderMonitorMixin:
     """
-    Mixin providing numeric value monitoring via periodic polling.
+    Mixin providing numeric value monitoring via the shared poll scheduler.
     Used by sliders to sync with system state on load and periodically.
     """
 
     _state: WidgetState
-    properties: RowProperties
+    item: ItemModel
 
     def _start_value_monitor(self) -> None:
-        """Initialize value monitoring loop if configured."""
-        if not self.properties.get("value_command"):
+        """Subscribe to the value command if configured."""
+        spec = _resolve_source(self.item.value_command, SUBPROCESS_TIMEOUT_SHORT)
+        if spec is None:
             return
 
-        interval = _safe_int(
-            self.properties.get("interval"), MONITOR_INTERVAL_SECONDS
+        interval, max_interval = _poll_intervals(
+            self.item.interval, self.item.max_interval, MONITOR_INTERVAL_SECONDS
         )
         if interval <= 0:
             return
 
-        # Perform initial fetch immediately
-        self._check_value_tick()
-
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return
-            # We reuse monitor_source_id as this widget won't use StateMonitorMixin
-            self._state.monitor_source_id = GLib.timeout_add_seconds(
-                interval, self._check_value_tick
-            )
-
-    def _check_value_tick(self) -> bool:
-        """GLib timeout callback for periodic value checks."""
-        if isinstance(self, Gtk.Widget) and not self.get_mapped():
-            return GLib.SOURCE_CONTINUE
-
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return GLib.SOURCE_REMOVE
-            if self._state.is_monitoring:
-                return GLib.SOURCE_CONTINUE
-            self._state.is_monitoring = True
-
-        if not _submit_task_safe(self._check_value_async, self._state):
-            with self._state.lock:
-                self._state.is_monitoring = False
-
-        return GLib.SOURCE_CONTINUE
-
-    def _check_value_async(self) -> None:
-        """Fetch numeric value in a background thread."""
-        new_value: float | None = None
-        try:
-            with self._state.lock:
-                if self._state.is_destroyed:
-                    return
-
-            cmd = self.properties.get("value_command", "")
-            if isinstance(cmd, str) and cmd.strip():
-                result = subprocess.run(
-                    cmd.strip(),
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=SUBPROCESS_TIMEOUT_SHORT,
-                )
-                if result.returncode == 0:
-                    # Attempt to parse the first numeric value found
-                    val_str = result.stdout.strip()
-                    try:
-                        new_value = float(val_str)
-                    except ValueError:
-                        pass
-        except (subprocess.TimeoutExpired, OSError, subprocess.SubprocessError):
-            pass
-        finally:
-            with self._state.lock:
-                self._state.is_monitoring = False
+        # The subscription performs the initial fetch immediately
+        _subscribe_source(
+            self._state, self, spec, self._on_value_result, interval, max_interval
+        )
 
-        if new_value is not None:
-            GLib.idle_add(self._apply_value_update, new_value)
+    def _on_value_result(self, result: PollResult) -> None:
+        """Shared-source callback parsing the numeric value."""
+        if (new_value := _number_from_result(result)) is not None:
+            self._apply_value_update(new_value)
 
     def _apply_value_update(self, new_value: float) -> bool:
         """Apply value update on main thread. Must be overridden."""
@@ -661,18 +2405,14 @@ class BaseActionRow(DynamicIconMixin, Adw.ActionRow):
 
     __gtype_name__ = "DuskyBaseActionRow"
 
-    def __init__(
-        self,
-        properties: RowProperties,
-        on_action: ActionConfig | None = None,
-        context: RowContext | None = None,
-    ) -> None:
+    def __init__(self, item: ItemModel, context: RowContext | None = None) -> None:
         super().__init__()
         self.add_css_class("action-row")
 
         self._state = WidgetState()
-        self.properties = properties
-        self.on_action: ActionConfig = on_action or {}
+        self.item = item
+        self.properties = item.properties
+        self.on_action: ActionConfig = item.action or {}
         self.context: RowContext = context or {}
         self.config: dict[str, object] = self.context.get("config") or {}
         self.sidebar: Gtk.ListBox | None = self.context.get("sidebar")
@@ -680,32 +2420,13 @@ class BaseActionRow(DynamicIconMixin, Adw.ActionRow):
         self.nav_view: Adw.NavigationView | None = self.context.get("nav_view")
         self.builder_func = self.context.get("builder_func")
 
-        title = str(properties.get("title", "Unnamed"))
-        self.set_title(GLib.markup_escape_text(title))
-        if sub := properties.get("description", ""):
-            self.set_subtitle(GLib.markup_escape_text(str(sub)))
+        self.set_title(GLib.markup_escape_text(item.title))
+        if item.description:
+            self.set_subtitle(GLib.markup_escape_text(item.description))
 
-        icon_config = properties.get("icon", DEFAULT_ICON)
-        self.icon_widget = self._create_icon_widget(icon_config)
+        self.icon_widget = _create_prefix_icon(item.icon)
         self.add_prefix(self.icon_widget)
-
-        if _is_dynamic_icon(icon_config) and isinstance(icon_config, dict):
-            self._start_icon_update_loop(icon_config)
-
-    def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        """Create the prefix icon widget based on configuration."""
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
+        self._start_icon_update_loop(item.icon)
 
     def do_unroot(self) -> None:
         """GTK4 lifecycle hook: clean up when widget is removed from tree."""
@@ -715,8 +2436,7 @@ class BaseActionRow(DynamicIconMixin, Adw.ActionRow):
     def _perform_cleanup(self) -> None:
         """Centralized cleanup for all timers and background tasks."""
         # Atomic retrieval of source IDs guarantees we don't miss any
-        sources = self._state.mark_destroyed_and_get_sources()
-        _batch_source_remove(*sources)
+        _release_state(self._state)
 
 
 # =============================================================================
@@ -727,16 +2447,11 @@ class ButtonRow(BaseActionRow):
 
     __gtype_name__ = "DuskyButtonRow"
 
-    def __init__(
-        self,
-        properties: RowProperties,
-        on_press: ActionConfig | None = None,
-        context: RowContext | None = None,
-    ) -> None:
-        super().__init__(properties, on_press, context)
+    def __init__(self, item: ItemModel, context: RowContext | None = None) -> None:
+        super().__init__(item, context)
 
         # Check for multiple buttons (Linked Group)
-        multi_buttons = properties.get("buttons")
+        multi_buttons = item.properties.get("buttons")
         
         if multi_buttons and isinstance(multi_buttons, list):
             box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
@@ -764,18 +2479,18 @@ class ButtonRow(BaseActionRow):
             self.add_suffix(box)
         else:
             # Standard single button logic
-            self.btn = Gtk.Button(label=str(properties.get("button_text", "Run")))
+            self.btn = Gtk.Button(label=item.button_text or "Run")
             self.btn.set_valign(Gtk.Align.CENTER)
             self.btn.add_css_class("run-btn")
             
-            self.base_style = str(properties.get("style", "default")).lower()
+            self.base_style = item.style
             self._apply_base_style(self.base_style)
             
             # Dynamic State (Text & Color) - Watches a file for status mapping
-            self.text_file = properties.get("button_text_file")
+            self.text_file = item.text_file
             if self.text_file:
-                self.text_map = properties.get("button_text_map", {})
-                self.style_map = properties.get("style_map", {})
+                self.text_map = item.properties.get("button_text_map", {})
+                self.style_map = item.properties.get("style_map", {})
                 self._start_dynamic_poll()
 
             self.btn.connect("clicked", self._on_button_clicked)
@@ -791,16 +2506,21 @@ class ButtonRow(BaseActionRow):
             case _: self.btn.add_css_class("default-action")
 
     def _start_dynamic_poll(self) -> None:
-        self._update_dynamic_state()
-        with self._state.lock:
-            if not self._state.is_destroyed:
-                self._state.update_source_id = GLib.timeout_add_seconds(2, self._update_dynamic_state)
+        _subscribe_source(
+            self._state,
+            self,
+            _file_source(self.text_file),
+            self._on_text_file_result,
+            MONITOR_INTERVAL_SECONDS,
+        )
+
+    def _on_text_file_result(self, result: PollResult) -> None:
+        """Shared-source callback; the file is read off the main thread."""
+        if result.ok:
+            self._update_dynamic_state(result.stdout.strip())
 
-    def _update_dynamic_state(self) -> bool:
+    def _update_dynamic_state(self, val: str) -> None:
         try:
-            path = Path(self.text_file).expanduser()
-            if not path.exists(): return True
-            val = path.read_text().strip()
             # Update Label
             new_label = self.text_map.get(val, self.text_map.get("default", self.btn.get_label()))
             if self.btn.get_label() != new_label: self.btn.set_label(new_label)
@@ -808,7 +2528,6 @@ class ButtonRow(BaseActionRow):
             new_style = self.style_map.get(val, self.style_map.get("default", self.base_style))
             self._apply_base_style(new_style)
         except Exception: pass
-        return True
 
     def _on_button_clicked(self, _button: Gtk.Button) -> None:
         """Handle standard button click."""
@@ -822,20 +2541,8 @@ class ButtonRow(BaseActionRow):
     def _trigger_action(self, act: Any) -> None:
         """Execute action from config dict."""
         if not isinstance(act, dict): return
-        t = act.get("type")
-        if t == "exec":
-            cmd = act.get("command", "")
-            if isinstance(cmd, str) and cmd.strip():
-                title = str(self.properties.get("title", "Command"))
-                term = bool(act.get("terminal", False))
-                success = utility.execute_command(cmd.strip(), title, term)
-                msg = f"{'▶ Launched' if success else '✖ Failed'}: {title}"
-                utility.toast(
-                    self.toast_overlay, msg, 2 if success else 4
-                )
-        elif t == "redirect":
-            if pid := act.get("page"):
-                _perform_redirect(str(pid), self.config, self.sidebar)
+        _boost_polling(self._state)
+        _run_press_action(act, self.item.title, self.context)
 
 
 class ToggleRow(StateMonitorMixin, BaseActionRow):
@@ -843,16 +2550,8 @@ class ToggleRow(StateMonitorMixin, BaseActionRow):
 
     __gtype_name__ = "DuskyToggleRow"
 
-    def __init__(
-        self,
-        properties: RowProperties,
-        on_toggle: ActionConfig | None = None,
-        context: RowContext | None = None,
-    ) -> None:
-        super().__init__(properties, on_toggle, context)
-
-        self.save_as_int = bool(properties.get("save_as_int", False))
-        self.key_inverse = bool(properties.get("key_inverse", False))
+    def __init__(self, item: ItemModel, context: RowContext | None = None) -> None:
+        super().__init__(item, context)
 
         # Atomic event flag to identify programmatic updates
         self._programmatic_update_event = threading.Event()
@@ -860,9 +2559,9 @@ class ToggleRow(StateMonitorMixin, BaseActionRow):
         self.toggle_switch = Gtk.Switch()
         self.toggle_switch.set_valign(Gtk.Align.CENTER)
 
-        if key := properties.get("key"):
+        if item.key:
             val = utility.load_setting(
-                str(key).strip(), default=False, is_inversed=self.key_inverse
+                item.key, default=False, is_inversed=item.key_inverse
             )
             if isinstance(val, bool):
                 self.toggle_switch.set_active(val)
@@ -897,19 +2596,8 @@ class ToggleRow(StateMonitorMixin, BaseActionRow):
         if self._programmatic_update_event.is_set():
             return False
 
-        if isinstance(self.on_action, dict):
-            action_key = "enabled" if state else "disabled"
-            if action := self.on_action.get(action_key):
-                if isinstance(action, dict) and (cmd := action.get("command")):
-                    utility.execute_command(
-                        str(cmd).strip(), "Toggle", bool(action.get("terminal", False))
-                    )
-
-        if key := self.properties.get("key"):
-            utility.save_setting(
-                str(key).strip(), state ^ self.key_inverse, as_int=self.save_as_int
-            )
-
+        _boost_polling(self._state)
+        _run_toggle_action(self.item, state)
         return False
 
 
@@ -918,15 +2606,12 @@ class LabelRow(BaseActionRow):
 
     __gtype_name__ = "DuskyLabelRow"
 
-    def __init__(
-        self,
-        properties: RowProperties,
-        value: ValueConfig | None = None,
-        context: RowContext | None = None,
-    ) -> None:
-        super().__init__(properties, None, context)
+    def __init__(self, item: ItemModel, context: RowContext | None = None) -> None:
+        super().__init__(item, context)
 
-        self.value_config: ValueConfig = value if value is not None else LABEL_NA
+        self.value_config: ValueConfig = (
+            item.value if item.value is not None else LABEL_NA  # type: ignore[assignment]
+        )
 
         self.value_label = Gtk.Label(label=LABEL_PLACEHOLDER, css_classes=["dim-label"])
         self.value_label.set_valign(Gtk.Align.CENTER)
@@ -935,52 +2620,20 @@ class LabelRow(BaseActionRow):
         self.value_label.set_ellipsize(Pango.EllipsizeMode.END)
         self.add_suffix(self.value_label)
 
-        self._trigger_update()
-
-        interval = _safe_int(properties.get("interval"), 0)
-        if interval > 0:
-            with self._state.lock:
-                if not self._state.is_destroyed:
-                    self._state.update_source_id = GLib.timeout_add_seconds(
-                        interval, self._on_timeout
-                    )
-
-    def _on_timeout(self) -> bool:
-        """GLib timeout callback for periodic value refresh."""
-        if isinstance(self, Gtk.Widget) and not self.get_mapped():
-            return GLib.SOURCE_CONTINUE
-
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return GLib.SOURCE_REMOVE
-
-        self._trigger_update()
-        return GLib.SOURCE_CONTINUE
-
-    def _trigger_update(self) -> None:
-        """Initiate a background value fetch."""
-        with self._state.lock:
-            if self._state.is_value_updating or self._state.is_destroyed:
-                return
-            self._state.is_value_updating = True
-
-        if not _submit_task_safe(self._load_value_async, self._state):
-            with self._state.lock:
-                self._state.is_value_updating = False
+        spec = _label_source(self.value_config)
+        if spec is None:
+            self._update_label(_static_text(self.value_config))
+            return
 
-    def _load_value_async(self) -> None:
-        """Fetch the value text in a background thread."""
-        result = LABEL_NA
-        try:
-            with self._state.lock:
-                if self._state.is_destroyed:
-                    return
-            result = self._get_value_text(self.value_config)
-        finally:
-            with self._state.lock:
-                self._state.is_value_updating = False
+        # An interval of 0 subscribes for the initial fetch only
+        interval, max_interval = _poll_intervals(item.interval, item.max_interval, 0)
+        _subscribe_source(
+            self._state, self, spec, self._on_value_result, interval, max_interval
+        )
 
-        GLib.idle_add(self._update_label, result)
+    def _on_value_result(self, result: PollResult) -> None:
+        """Shared-source callback formatting the fetched value."""
+        self._update_label(_label_from_result(result))
 
     def _update_label(self, text: str) -> bool:
         """Update the label text on the main thread."""
@@ -994,83 +2647,19 @@ class LabelRow(BaseActionRow):
 
         return GLib.SOURCE_REMOVE
 
-    def _get_value_text(self, val: ValueConfig) -> str:
-        """Resolve a ValueConfig to its string representation."""
-        if isinstance(val, str):
-            return val
-        if not isinstance(val, dict):
-            return LABEL_NA
-
-        match val.get("type"):
-            case "exec":
-                return self._exec_cmd(str(val.get("command", "")))
-            case "static":
-                return str(val.get("text", LABEL_NA))
-            case "file":
-                return self._read_file(str(val.get("path", "")))
-            case "system":
-                result = utility.get_system_value(str(val.get("key", "")))
-                return str(result) if result else LABEL_NA
-
-        return LABEL_NA
-
-    def _exec_cmd(self, cmd: str) -> str:
-        """Execute a command and return its stdout."""
-        cmd = cmd.strip()
-        if not cmd:
-            return LABEL_NA
-
-        # Optimization: bypass subprocess for simple `cat` commands
-        if cmd.startswith("cat "):
-            try:
-                parts = shlex.split(cmd)
-                if len(parts) == 2:
-                    return self._read_file(parts[1])
-            except ValueError:
-                pass
-
-        try:
-            res = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=SUBPROCESS_TIMEOUT_LONG,
-            )
-            return res.stdout.strip() or LABEL_NA
-        except subprocess.TimeoutExpired:
-            return LABEL_TIMEOUT
-        except subprocess.SubprocessError:
-            return LABEL_ERROR
-
-    def _read_file(self, path: str) -> str:
-        """Read and return the contents of a file."""
-        if not path.strip():
-            return LABEL_NA
-        try:
-            return _expand_path(path.strip()).read_text(encoding="utf-8").strip()
-        except OSError:
-            return LABEL_NA
-
 
 class SliderRow(SliderMonitorMixin, BaseActionRow):
     """Action row with a slider suffix for continuous value adjustment."""
 
     __gtype_name__ = "DuskySliderRow"
 
-    def __init__(
-        self,
-        properties: RowProperties,
-        on_change: ActionConfig | None = None,
-        context: RowContext | None = None,
-    ) -> None:
-        super().__init__(properties, on_change, context)
+    def __init__(self, item: ItemModel, context: RowContext | None = None) -> None:
+        super().__init__(item, context)
 
-        self.min_val = _safe_float(properties.get("min"), 0.0)
-        self.max_val = _safe_float(properties.get("max"), 100.0)
-        step = _safe_float(properties.get("step"), 1.0)
-        self.step_val = step if step > MIN_STEP_VALUE else 1.0
-        self.debounce_enabled = bool(properties.get("debounce", True))
+        self.min_val = item.minimum
+        self.max_val = item.maximum
+        self.step_val = item.step
+        self.debounce_enabled = item.debounce
 
         # FIXED: Use RLock to prevent re-entrancy deadlock during signal emission
         self._slider_lock = threading.RLock()
@@ -1078,9 +2667,8 @@ class SliderRow(SliderMonitorMixin, BaseActionRow):
         self._last_snapped: float | None = None
         self._pending_value: float | None = None
 
-        default_val = _safe_float(properties.get("default"), self.min_val)
         adj = Gtk.Adjustment(
-            value=default_val,
+            value=item.default,
             lower=self.min_val,
             upper=self.max_val,
             step_increment=self.step_val,
@@ -1133,8 +2721,7 @@ class SliderRow(SliderMonitorMixin, BaseActionRow):
                 return
 
             val = scale.get_value()
-            snapped = round(val / self.step_val) * self.step_val
-            snapped = max(self.min_val, min(snapped, self.max_val))
+            snapped = _snap_value(val, self.item)
 
             if (
                 self._last_snapped is not None
@@ -1183,22 +2770,8 @@ class SliderRow(SliderMonitorMixin, BaseActionRow):
         if value is None:
             return GLib.SOURCE_REMOVE
 
-        if isinstance(self.on_action, dict) and self.on_action.get("type") == "exec":
-            if cmd := self.on_action.get("command"):
-                final_cmd = str(cmd).replace("{value}", str(int(value)))
-
-                # OPTIMIZATION: Fast Path Execution for Background Commands
-                is_terminal = bool(self.on_action.get("terminal", False))
-                if is_terminal:
-                    utility.execute_command(final_cmd, "Slider", True)
-                else:
-                    subprocess.Popen(
-                        final_cmd,
-                        shell=True,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
-
+        _boost_polling(self._state)
+        _run_slider_action(self.on_action, value)
         return GLib.SOURCE_REMOVE
 
 
@@ -1207,40 +2780,33 @@ class SelectionRow(DynamicIconMixin, Adw.ComboRow):
 
     __gtype_name__ = "DuskySelectionRow"
 
-    def __init__(
-        self,
-        properties: RowProperties,
-        on_change: ActionConfig | None = None,
-        context: RowContext | None = None,
-    ) -> None:
+    def __init__(self, item: ItemModel, context: RowContext | None = None) -> None:
         super().__init__()
         self.add_css_class("action-row")
 
         self._state = WidgetState()
-        self.properties = properties
-        self.on_action: ActionConfig = on_change or {}
+        self.item = item
+        self.properties = item.properties
+        self.on_action: ActionConfig = item.action or {}
         self.context: RowContext = context or {}
         self.toast_overlay: Adw.ToastOverlay | None = self.context.get("toast_overlay")
         
         self._programmatic_update = False
         self._initial_fetch_done = False
+        self._selection_sub: PollSubscription | None = None
 
         # Title & Subtitle
-        title = str(properties.get("title", "Unnamed"))
-        self.set_title(GLib.markup_escape_text(title))
-        if sub := properties.get("description", ""):
-            self.set_subtitle(GLib.markup_escape_text(str(sub)))
+        self.set_title(GLib.markup_escape_text(item.title))
+        if item.description:
+            self.set_subtitle(GLib.markup_escape_text(item.description))
 
         # Icon Setup
-        icon_config = properties.get("icon", DEFAULT_ICON)
-        self.icon_widget = self._create_icon_widget(icon_config)
+        self.icon_widget = _create_prefix_icon(item.icon)
         self.add_prefix(self.icon_widget)
 
         # Options Setup - Initialize empty, then populate
-        self.options_list: list[str] = []
-        raw_options = properties.get("options", [])
-        if isinstance(raw_options, list) and raw_options:
-            self.options_list = [str(x) for x in raw_options]
+        self.options_list: list[str] = list(item.options)
+        if self.options_list:
             self.set_model(Gtk.StringList.new(self.options_list))
 
         # Signal Connections
@@ -1249,31 +2815,17 @@ class SelectionRow(DynamicIconMixin, Adw.ComboRow):
         self.connect("map", self._on_map)
 
         # Start Monitors
-        if _is_dynamic_icon(icon_config) and isinstance(icon_config, dict):
-            self._start_icon_update_loop(icon_config)
+        self._start_icon_update_loop(item.icon)
 
         # Handle dynamic options command
-        if properties.get("options_command"):
-            _submit_task_safe(self._fetch_options_async, self._state)
+        if item.options_command:
+            _submit_task_safe(
+                self._fetch_options_async, self._state, _first_fetch_priority()
+            )
 
-        if properties.get("value_command"):
+        if item.value_command:
             self._start_selection_monitor()
 
-    def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        """Create the prefix icon widget based on configuration."""
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
-
     @contextmanager
     def _suppress_change_signal(self):
         """Context manager to safely toggle the programmatic update flag."""
@@ -1285,24 +2837,17 @@ class SelectionRow(DynamicIconMixin, Adw.ComboRow):
 
     def _fetch_options_async(self) -> None:
         """Fetch options list from a command in the background."""
-        cmd = self.properties.get("options_command", "")
+        cmd = self.item.options_command
         if not cmd:
             return
 
-        try:
-            res = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=SUBPROCESS_TIMEOUT_LONG
-            )
-            if res.returncode == 0:
-                lines = [line.strip() for line in res.stdout.splitlines() if line.strip()]
-                if lines:
-                    GLib.idle_add(self._update_options_ui, lines)
-        except Exception as e:
-            log.error(f"Options fetch failed: {e}")
+        res = _run_shell_command(cmd, SUBPROCESS_TIMEOUT_LONG)
+        if res.timed_out or res.failed:
+            log.error(f"Options fetch failed: {cmd}")
+        elif res.returncode == 0:
+            lines = [line.strip() for line in res.stdout.splitlines() if line.strip()]
+            if lines:
+                GLib.idle_add(self._update_options_ui, lines)
 
     def _update_options_ui(self, new_options: list[str]) -> bool:
         """Update the dropdown model with new options."""
@@ -1317,66 +2862,54 @@ class SelectionRow(DynamicIconMixin, Adw.ComboRow):
             with self._suppress_change_signal():
                 self.set_model(Gtk.StringList.new(self.options_list))
                 # Trigger immediate re-check of value to restore correct selection
-                _submit_task_safe(self._fetch_selection_async, self._state)
+                self._refresh_selection()
 
         return GLib.SOURCE_REMOVE
 
     def _start_selection_monitor(self) -> None:
-        """Initialize the selection polling loop."""
-        interval = _safe_int(self.properties.get("interval"), DEFAULT_INTERVAL_SECONDS)
+        """Subscribe to the shared value command source."""
+        spec = _resolve_source(self.item.value_command, SUBPROCESS_TIMEOUT_SHORT)
+        if spec is None:
+            return
 
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return
-            self._state.monitor_source_id = GLib.timeout_add_seconds(
-                interval, self._check_selection_tick
-            )
+        interval, max_interval = _poll_intervals(
+            self.item.interval, self.item.max_interval, DEFAULT_INTERVAL_SECONDS
+        )
+        # The initial fetch happens on map
+        self._selection_sub = _subscribe_source(
+            self._state,
+            self,
+            spec,
+            self._on_selection_result,
+            interval,
+            max_interval,
+            immediate=False,
+        )
+
+    def _refresh_selection(self) -> None:
+        """Request an out-of-band fetch of the current selection."""
+        if self._selection_sub is not None:
+            self._selection_sub.refresh()
 
     def _on_map(self, _widget: Gtk.Widget) -> None:
         """Trigger an update whenever the widget becomes visible."""
-        _submit_task_safe(self._fetch_selection_async, self._state)
-        if self.properties.get("options_command"):
-             _submit_task_safe(self._fetch_options_async, self._state)
-
-    def _check_selection_tick(self) -> bool:
-        """GLib timeout to schedule background fetch."""
-        if not self.get_mapped():
-            return GLib.SOURCE_CONTINUE
-
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return GLib.SOURCE_REMOVE
-
-        _submit_task_safe(self._fetch_selection_async, self._state)
-        return GLib.SOURCE_CONTINUE
-
-    def _fetch_selection_async(self) -> None:
-        """Fetch current status string in background."""
-        cmd = self.properties.get("value_command", "")
-        if not cmd:
-            return
-        
-        try:
-            # Run command with explicit shell execution
-            res = subprocess.run(
-                cmd, 
-                shell=True, 
-                capture_output=True, 
-                text=True, 
-                timeout=SUBPROCESS_TIMEOUT_SHORT
-            )
-            
-            if res.returncode == 0:
-                value = res.stdout.strip()
-                if value:
-                    GLib.idle_add(self._update_selection_ui, value)
-            else:
-                log.warning(f"Selection command failed: {cmd}\nStderr: {res.stderr.strip()}")
-
-        except subprocess.TimeoutExpired:
+        self._refresh_selection()
+        if self.item.options_command:
+             _submit_task_safe(
+                 self._fetch_options_async, self._state, TaskPriority.VISIBLE
+             )
+
+    def _on_selection_result(self, result: PollResult) -> None:
+        """Shared-source callback for the current status string."""
+        cmd = self.item.value_command
+        if result.timed_out:
             log.warning(f"Selection command timed out: {cmd}")
-        except Exception as e:
-            log.error(f"Selection monitor error: {e}")
+        elif result.failed:
+            log.error(f"Selection monitor error: {cmd}")
+        elif result.returncode != 0:
+            log.warning(f"Selection command failed: {cmd}\nStderr: {result.stderr.strip()}")
+        elif value := result.stdout.strip():
+            self._update_selection_ui(value)
 
     def _update_selection_ui(self, value: str) -> bool:
         """Update the dropdown selection on main thread."""
@@ -1386,8 +2919,10 @@ class SelectionRow(DynamicIconMixin, Adw.ComboRow):
 
         if value not in self.options_list:
             # If value isn't in options, we might need to refresh options
-            if self.properties.get("options_command"):
-                 _submit_task_safe(self._fetch_options_async, self._state)
+            if self.item.options_command:
+                 _submit_task_safe(
+                     self._fetch_options_async, self._state, TaskPriority.VISIBLE
+                 )
             return GLib.SOURCE_REMOVE
 
         idx = self.options_list.index(value)
@@ -1414,6 +2949,7 @@ class SelectionRow(DynamicIconMixin, Adw.ComboRow):
             return
 
         item = model.get_string(idx)
+        _boost_polling(self._state)
 
         if isinstance(self.on_action, dict) and (cmd := self.on_action.get("command")):
             # Security: Quote the value to prevent shell injection from config strings
@@ -1427,8 +2963,7 @@ class SelectionRow(DynamicIconMixin, Adw.ComboRow):
             )
 
     def do_unroot(self) -> None:
-        sources = self._state.mark_destroyed_and_get_sources()
-        _batch_source_remove(*sources)
+        _release_state(self._state)
         Adw.ComboRow.do_unroot(self)
 
 
@@ -1437,55 +2972,32 @@ class EntryRow(DynamicIconMixin, Adw.EntryRow):
 
     __gtype_name__ = "DuskyEntryRow"
 
-    def __init__(
-        self,
-        properties: RowProperties,
-        on_action: ActionConfig | None = None,
-        context: RowContext | None = None,
-    ) -> None:
+    def __init__(self, item: ItemModel, context: RowContext | None = None) -> None:
         super().__init__()
         self.add_css_class("action-row")
 
         self._state = WidgetState()
-        self.properties = properties
-        self.on_action: ActionConfig = on_action or {}
+        self.item = item
+        self.properties = item.properties
+        self.on_action: ActionConfig = item.action or {}
         self.context: RowContext = context or {}
         self.toast_overlay: Adw.ToastOverlay | None = self.context.get("toast_overlay")
 
-        title = str(properties.get("title", "Unnamed"))
-        self.set_title(GLib.markup_escape_text(title))
+        self.set_title(GLib.markup_escape_text(item.title))
 
-        icon_config = properties.get("icon", DEFAULT_ICON)
-        self.icon_widget = self._create_icon_widget(icon_config)
+        self.icon_widget = _create_prefix_icon(item.icon)
         self.add_prefix(self.icon_widget)
 
         # Entry Setup
         self.set_show_apply_button(False)  # We use custom button for consistency
-        btn_text = str(properties.get("button_text", "Apply"))
-        btn = Gtk.Button(label=btn_text)
+        btn = Gtk.Button(label=item.button_text or "Apply")
         btn.add_css_class("suggested-action")
         btn.set_valign(Gtk.Align.CENTER)
         btn.connect("clicked", self._on_apply)
         self.add_suffix(btn)
 
         # Start dynamic icon
-        if _is_dynamic_icon(icon_config) and isinstance(icon_config, dict):
-            self._start_icon_update_loop(icon_config)
-
-    def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        """Create the prefix icon widget based on configuration."""
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
+        self._start_icon_update_loop(item.icon)
 
     def _on_apply(self, _btn: Gtk.Button) -> None:
         text = self.get_text()
@@ -1503,8 +3015,7 @@ class EntryRow(DynamicIconMixin, Adw.EntryRow):
             # want to keep it or edit it slightly.
 
     def do_unroot(self) -> None:
-        sources = self._state.mark_destroyed_and_get_sources()
-        _batch_source_remove(*sources)
+        _release_state(self._state)
         Adw.EntryRow.do_unroot(self)
 
 
@@ -1513,34 +3024,41 @@ class NavigationRow(BaseActionRow):
 
     __gtype_name__ = "DuskyNavigationRow"
 
-    def __init__(
-        self,
-        properties: RowProperties,
-        layout_data: list[object] | None = None,
-        context: RowContext | None = None,
-    ) -> None:
-        super().__init__(properties, None, context)
+    def __init__(self, item: ItemModel, context: RowContext | None = None) -> None:
+        super().__init__(item, context)
 
-        self.layout_data: list[object] = layout_data or []
+        self.layout_data: tuple[SectionModel, ...] = item.layout
         self.add_suffix(Gtk.Image.new_from_icon_name("go-next-symbolic"))
         self.set_activatable(True)
         self.connect("activated", self._on_activated)
 
     def _on_activated(self, _row: Adw.ActionRow) -> None:
-        """Handle row activation to push a subpage."""
+        self.open_subpage()
+
+    def open_subpage(self) -> Adw.NavigationPage | None:
+        """Push the subpage, reusing the cached one if it was built before."""
         if self.nav_view and self.builder_func:
-            title = str(self.properties.get("title", "Subpage"))
+            title = self.item.title
             
             # Update path context for the subpage
             current_path = self.context.get("path", [])
             new_path = list(current_path) + [title]
-            
-            new_ctx = self.context.copy()
-            new_ctx["path"] = new_path
-            
-            self.nav_view.push(
-                self.builder_func(title, self.layout_data, new_ctx)
-            )
+
+            # Same-titled siblings are told apart by their item
+            cache = self.context.get("subpages")
+            key = (tuple(new_path), id(self.item))
+            page = cache.get(key, self.item) if cache is not None else None
+
+            if page is None:
+                new_ctx = self.context.copy()
+                new_ctx["path"] = new_path
+                page = self.builder_func(title, self.layout_data, new_ctx)
+                if cache is not None:
+                    cache.put(key, self.item, page)
+
+            self.nav_view.push(page)
+            return page
+        return None
 
 
 class ExpanderRow(DynamicIconMixin, Adw.ExpanderRow):
@@ -1548,97 +3066,92 @@ class ExpanderRow(DynamicIconMixin, Adw.ExpanderRow):
 
     __gtype_name__ = "DuskyExpanderRow"
 
-    def __init__(
-        self,
-        properties: RowProperties,
-        items: list[object] | None = None,
-        context: RowContext | None = None,
-    ) -> None:
+    def __init__(self, item: ItemModel, context: RowContext | None = None) -> None:
         super().__init__()
 
         self._state = WidgetState()
-        self.properties = properties
-        self.items_data: list[object] = items or []
+        self.item = item
+        self.properties = item.properties
         self.context: RowContext = context or {}
         self.toast_overlay: Adw.ToastOverlay | None = self.context.get("toast_overlay")
         self.nav_view: Adw.NavigationView | None = self.context.get("nav_view")
         self.builder_func = self.context.get("builder_func")
 
         # Set title and subtitle
-        title = str(properties.get("title", "Expander"))
-        self.set_title(GLib.markup_escape_text(title))
-        if sub := properties.get("description", ""):
-            self.set_subtitle(GLib.markup_escape_text(str(sub)))
+        self.set_title(GLib.markup_escape_text(item.title))
+        if item.description:
+            self.set_subtitle(GLib.markup_escape_text(item.description))
 
         # Set up icon
-        icon_config = properties.get("icon", DEFAULT_ICON)
-        self.icon_widget = self._create_icon_widget(icon_config)
+        self.icon_widget = _create_prefix_icon(item.icon)
         self.add_prefix(self.icon_widget)
 
-        # Build and add child rows
-        self._build_child_rows()
+        # Child rows (and their pollers) are built on first expansion
+        self._child_rows: list[Adw.PreferencesRow] | None = None
+        self.connect("notify::expanded", self._on_expanded_changed)
 
         # Start dynamic icon updates if configured
-        if _is_dynamic_icon(icon_config) and isinstance(icon_config, dict):
-            self._start_icon_update_loop(icon_config)
-
-    def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        """Create the prefix icon widget based on configuration."""
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
+        self._start_icon_update_loop(item.icon)
+
+    def _on_expanded_changed(self, _row: Adw.ExpanderRow, _pspec: GObject.ParamSpec) -> None:
+        """
+        Build children on first expansion. Collapsing unsubscribes them from
+        their sources; re-expanding subscribes them again and fetches fresh
+        values right away.
+        """
+        if self._child_rows is None:
+            if self.get_expanded():
+                self._build_child_rows()
+            return
+        self._set_children_polling(self.get_expanded())
+
+    def _set_children_polling(self, active: bool) -> None:
+        """Pause or resume the child rows, and those of expanded child expanders."""
+        for row in self._child_rows or ():
+            if isinstance(state := getattr(row, "_state", None), WidgetState):
+                if active:
+                    _resume_polling(state)
+                else:
+                    _pause_polling(state)
+            if isinstance(row, ExpanderRow) and row.get_expanded():
+                row._set_children_polling(active)
 
     def _build_child_rows(self) -> None:
         """Build and add child rows from items data."""
-        for item in self.items_data:
-            if not isinstance(item, dict):
-                continue
-
-            row = self._build_single_row(item)
+        self._child_rows = []
+        for child in self.item.children:
+            row = self._build_single_row(child)
             if row is not None:
                 self.add_row(row)
+                self._child_rows.append(row)
 
-    def _build_single_row(self, item: dict[str, object]) -> Adw.PreferencesRow | None:
-        """Build a single child row from item configuration."""
-        item_type = str(item.get("type", "")).lower()
-        props = item.get("properties", {})
-        if not isinstance(props, dict):
-            props = {}
-
+    def _build_single_row(self, item: ItemModel) -> Adw.PreferencesRow | None:
+        """Build a single child row from its compiled item."""
         try:
-            match item_type:
+            match item.type:
                 case "button":
-                    return ButtonRow(props, item.get("on_press"), self.context)
+                    return ButtonRow(item, self.context)
                 case "toggle":
-                    return ToggleRow(props, item.get("on_toggle"), self.context)
+                    return ToggleRow(item, self.context)
                 case "label":
-                    return LabelRow(props, item.get("value"), self.context)
+                    return LabelRow(item, self.context)
                 case "slider":
-                    return SliderRow(props, item.get("on_change"), self.context)
+                    return SliderRow(item, self.context)
                 case "selection":
-                    return SelectionRow(props, item.get("on_change"), self.context)
+                    return SelectionRow(item, self.context)
                 case "entry":
-                    return EntryRow(props, item.get("on_action"), self.context)
+                    return EntryRow(item, self.context)
                 case "navigation":
-                    return NavigationRow(props, item.get("layout"), self.context)
+                    return NavigationRow(item, self.context)
                 case "expander":
-                    return ExpanderRow(props, item.get("items"), self.context)
+                    return ExpanderRow(item, self.context)
                 case _:
                     log.warning(
-                        "Unknown item type '%s' in expander, skipping", item_type
+                        "Unknown item type '%s' in expander, skipping", item.type
                     )
                     return None
         except Exception as e:
-            log.error("Failed to build child row for type '%s': %s", item_type, e)
+            log.error("Failed to build child row for type '%s': %s", item.type, e)
             return None
 
     def do_unroot(self) -> None:
@@ -1648,8 +3161,7 @@ class ExpanderRow(DynamicIconMixin, Adw.ExpanderRow):
 
     def _perform_cleanup(self) -> None:
         """Centralized cleanup for all timers and background tasks."""
-        sources = self._state.mark_destroyed_and_get_sources()
-        _batch_source_remove(*sources)
+        _release_state(self._state)
 
 
 # =============================================================================
@@ -1660,23 +3172,19 @@ class GridCardBase(Gtk.Button):
 
     __gtype_name__ = "DuskyGridCardBase"
 
-    def __init__(
-        self,
-        properties: RowProperties,
-        on_action: ActionConfig | None = None,
-        context: RowContext | None = None,
-    ) -> None:
+    def __init__(self, item: ItemModel, context: RowContext | None = None) -> None:
         super().__init__()
         self.add_css_class("hero-card")
 
         self._state = WidgetState()
-        self.properties = properties
-        self.on_action: ActionConfig = on_action or {}
+        self.item = item
+        self.properties = item.properties
+        self.on_action: ActionConfig = item.action or {}
         self.context: RowContext = context or {}
         self.toast_overlay: Adw.ToastOverlay | None = self.context.get("toast_overlay")
         self.icon_widget: Gtk.Image | None = None
 
-        match str(properties.get("style", "default")).lower():
+        match item.style:
             case "destructive":
                 self.add_css_class("destructive-card")
             case "suggested":
@@ -1688,8 +3196,7 @@ class GridCardBase(Gtk.Button):
 
     def _perform_cleanup(self) -> None:
         """Mark card as destroyed and clean up sources."""
-        sources = self._state.mark_destroyed_and_get_sources()
-        _batch_source_remove(*sources)
+        _release_state(self._state)
 
     def _build_content(self, icon: str, title: str) -> Gtk.Box:
         """Build the card's vertical box content."""
@@ -1720,25 +3227,16 @@ class GridCard(DynamicIconMixin, GridCardBase):
 
     __gtype_name__ = "DuskyGridCard"
 
-    def __init__(
-        self,
-        properties: RowProperties,
-        on_press: ActionConfig | None = None,
-        context: RowContext | None = None,
-    ) -> None:
-        super().__init__(properties, on_press, context)
+    def __init__(self, item: ItemModel, context: RowContext | None = None) -> None:
+        super().__init__(item, context)
 
-        icon_conf = properties.get("icon", DEFAULT_ICON)
-        box = self._build_content(
-            _resolve_static_icon_name(icon_conf),
-            str(properties.get("title", "Unnamed")),
-        )
+        box = self._build_content(item.icon.name, item.title)
         self.set_child(box)
         self.connect("clicked", self._on_clicked)
 
         # BADGE LOGIC
         self.badge_label: Gtk.Label | None = None
-        if badge_path := properties.get("badge_file"):
+        if item.badge_file:
             # If a badge is requested, wrap the existing content box in an Overlay
             # and place the badge label on top.
             
@@ -1759,48 +3257,25 @@ class GridCard(DynamicIconMixin, GridCardBase):
             self.set_child(overlay)
             
             # Start monitoring the badge file
-            self._start_badge_monitor(str(badge_path))
+            self._start_badge_monitor(item.badge_file)
 
-        if _is_dynamic_icon(icon_conf) and isinstance(icon_conf, dict):
-            self._start_icon_update_loop(icon_conf)
+        self._start_icon_update_loop(item.icon)
 
     def _start_badge_monitor(self, path_str: str) -> None:
-        """Start periodic check of the badge file."""
-        self._check_badge_tick(path_str) # Initial check
-        
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return
-            # Using update_source_id as it's free in this class
-            self._state.update_source_id = GLib.timeout_add_seconds(
-                DEFAULT_INTERVAL_SECONDS, self._check_badge_tick, path_str
-            )
-
-    def _check_badge_tick(self, path_str: str) -> bool:
-        """Timeout callback to schedule background file read."""
-        if not self.get_mapped():
-            return GLib.SOURCE_CONTINUE
-
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return GLib.SOURCE_REMOVE
-        
-        _submit_task_safe(lambda: self._fetch_badge_async(path_str), self._state)
-        return GLib.SOURCE_CONTINUE
+        """Subscribe to the badge file; identical paths share one read."""
+        _subscribe_source(
+            self._state,
+            self,
+            _file_source(path_str),
+            self._on_badge_result,
+            DEFAULT_INTERVAL_SECONDS,
+        )
 
-    def _fetch_badge_async(self, path_str: str) -> None:
-        """Read file in background thread."""
-        count_text: str | None = None
-        try:
-            path = _expand_path(path_str)
-            if path.exists():
-                content = path.read_text(encoding="utf-8").strip()
-                if content.isdigit() and int(content) > 0:
-                    count_text = content
-        except Exception:
-            pass # Fail silently for badge
-        
-        GLib.idle_add(self._update_badge_ui, count_text)
+    def _on_badge_result(self, result: PollResult) -> None:
+        """Shared-source callback for the badge file contents."""
+        content = result.stdout.strip() if result.ok else ""
+        count_text = content if content.isdigit() and int(content) > 0 else None
+        self._update_badge_ui(count_text)
 
     def _update_badge_ui(self, text: str | None) -> bool:
         """Update badge visibility on main thread."""
@@ -1821,6 +3296,7 @@ class GridCard(DynamicIconMixin, GridCardBase):
         """Handle card click: execute or redirect."""
         if not isinstance(self.on_action, dict):
             return
+        _boost_polling(self._state)
 
         match self.on_action.get("type"):
             case "exec":
@@ -1848,40 +3324,27 @@ class GridToggleCard(DynamicIconMixin, StateMonitorMixin, GridCardBase):
 
     __gtype_name__ = "DuskyGridToggleCard"
 
-    def __init__(
-        self,
-        properties: RowProperties,
-        on_toggle: ActionConfig | None = None,
-        context: RowContext | None = None,
-    ) -> None:
-        super().__init__(properties, on_toggle, context)
+    def __init__(self, item: ItemModel, context: RowContext | None = None) -> None:
+        super().__init__(item, context)
 
-        self.save_as_int = bool(properties.get("save_as_int", False))
-        self.key_inverse = bool(properties.get("key_inverse", False))
         self.is_active = False
 
-        icon_conf = properties.get("icon", DEFAULT_ICON)
-        box = self._build_content(
-            _resolve_static_icon_name(icon_conf),
-            str(properties.get("title", "Toggle")),
-        )
+        box = self._build_content(item.icon.name, item.title)
 
         self.status_lbl = Gtk.Label(label=STATE_OFF, css_classes=["hero-subtitle"])
         box.append(self.status_lbl)
         self.set_child(box)
 
-        if key := properties.get("key"):
+        if item.key:
             val = utility.load_setting(
-                str(key).strip(), default=False, is_inversed=self.key_inverse
+                item.key, default=False, is_inversed=item.key_inverse
             )
             if isinstance(val, bool):
                 self._set_visual(val)
 
         self.connect("clicked", self._on_clicked)
         self._start_state_monitor()
-
-        if _is_dynamic_icon(icon_conf) and isinstance(icon_conf, dict):
-            self._start_icon_update_loop(icon_conf)
+        self._start_icon_update_loop(item.icon)
 
     def _apply_state_update(self, new_state: bool) -> bool:
         """Apply monitored state to the toggle card."""
@@ -1907,20 +3370,248 @@ class GridToggleCard(DynamicIconMixin, StateMonitorMixin, GridCardBase):
         """Handle card click to toggle state."""
         new_state = not self.is_active
         self._set_visual(new_state)
+        _boost_polling(self._state)
+        _run_toggle_action(self.item, new_state)
+        return False
 
-        if isinstance(self.on_action, dict):
-            action_key = "enabled" if new_state else "disabled"
-            if act := self.on_action.get(action_key):
-                if isinstance(act, dict) and (cmd := act.get("command")):
-                    utility.execute_command(
-                        str(cmd).strip(),
-                        "Toggle",
-                        bool(act.get("terminal", False)),
+
+# =============================================================================
+# SEARCH RESULTS
+# =============================================================================
+class SearchResult(GObject.Object):
+    """List model item wrapping one search index entry."""
+
+    __gtype_name__ = "DuskySearchResult"
+
+    def __init__(self, entry: SearchEntry) -> None:
+        super().__init__()
+        self.entry = entry
+
+
+class SearchResultRow(Gtk.Box):
+    """
+    Recycled row of the search result list. `bind` swaps its text and icon
+    and shows the suffix of the item's type: a switch, a run button, a slider
+    or a value label. They run the item's action like its real row does.
+    Their state comes from the shared state store. A source the store has
+    never seen is fetched once while the row is bound, and its controls stay
+    insensitive until a value arrives. No poller starts, however fast the
+    query changes.
+    """
+
+    __gtype_name__ = "DuskySearchResultRow"
+
+    def __init__(self) -> None:
+        super().__init__(spacing=12, css_classes=["search-result-row"])
+        self._item: ItemModel | None = None
+        self._context: RowContext = {}
+        self._watch: StateWatch | None = None
+        self._fetch: PollSubscription | None = None
+        # Set while the store drives a suffix, so no action runs
+        self._updating = False
+        self._debounce_id = 0
+        self._pending_value: float | None = None
+
+        self.icon_widget = Gtk.Image(css_classes=["action-row-prefix-icon"])
+        self.title_lbl = Gtk.Label(xalign=0, ellipsize=Pango.EllipsizeMode.END)
+        self.subtitle_lbl = Gtk.Label(
+            xalign=0,
+            ellipsize=Pango.EllipsizeMode.END,
+            css_classes=["dim-label", "caption"],
+        )
+        text = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            valign=Gtk.Align.CENTER,
+            hexpand=True,
+        )
+        text.append(self.title_lbl)
+        text.append(self.subtitle_lbl)
+
+        # ─── Suffixes (one is shown per bound item) ───
+        self.value_lbl = Gtk.Label(
+            css_classes=["dim-label"],
+            max_width_chars=LABEL_MAX_WIDTH_CHARS,
+            ellipsize=Pango.EllipsizeMode.END,
+        )
+        self.toggle_switch = Gtk.Switch(valign=Gtk.Align.CENTER)
+        self.toggle_switch.connect("state-set", self._on_toggle_changed)
+        self.btn = Gtk.Button(valign=Gtk.Align.CENTER, css_classes=["run-btn"])
+        self.btn.connect("clicked", self._on_button_clicked)
+        self.slider = Gtk.Scale(
+            orientation=Gtk.Orientation.HORIZONTAL,
+            valign=Gtk.Align.CENTER,
+            draw_value=False,
+        )
+        self.slider.set_size_request(200, -1)
+        self.slider.connect("value-changed", self._on_value_changed)
+        self._suffixes: tuple[Gtk.Widget, ...] = (
+            self.value_lbl, self.toggle_switch, self.btn, self.slider
+        )
+
+        self.append(self.icon_widget)
+        self.append(text)
+        for suffix in self._suffixes:
+            self.append(suffix)
+        self.append(Gtk.Image.new_from_icon_name("go-next-symbolic"))
+
+    def bind(self, entry: SearchEntry, context: RowContext) -> None:
+        item = entry.item
+        self.title_lbl.set_label(item.title)
+        self.subtitle_lbl.set_label(item.description)
+        self.subtitle_lbl.set_visible(bool(item.description))
+        # Dynamic icons show their static name; the command is never run here
+        if item.icon.file is not None and item.icon.file.exists():
+            self.icon_widget.set_from_file(str(item.icon.file))
+        else:
+            self.icon_widget.set_from_icon_name(item.icon.name)
+        # The subtitle may be ellipsized
+        self.set_tooltip_text(item.description or None)
+
+        self.unbind()
+        self._item = entry.source
+        self._context = context
+        self._show_suffix(entry.source)
+
+    def unbind(self) -> None:
+        """Stop following the bound item; a pending slider value is applied."""
+        if self._watch is not None:
+            self._watch.cancel()
+            self._watch = None
+        if self._fetch is not None:
+            self._fetch.cancel()
+            self._fetch = None
+        if self._debounce_id:
+            GLib.source_remove(self._debounce_id)
+            self._execute_debounced_action()
+        self._item = None
+        self._context = {}
+
+    def _show_suffix(self, item: ItemModel) -> None:
+        match item.type:
+            case "toggle" | "toggle_card":
+                suffix = self.toggle_switch
+                spec = _state_source(item)
+                on_result = self._on_state_result
+                self._set_switch(False)
+            case "button" | "grid_card" if not item.properties.get("buttons"):
+                suffix = self.btn
+                self.btn.set_label(item.button_text or "Run")
+                for css in ("suggested-action", "destructive-action", "default-action"):
+                    self.btn.remove_css_class(css)
+                match item.style:
+                    case "destructive": self.btn.add_css_class("destructive-action")
+                    case "suggested": self.btn.add_css_class("suggested-action")
+                    case _: self.btn.add_css_class("default-action")
+                spec = None
+            case "slider":
+                suffix = self.slider
+                spec = _resolve_source(item.value_command, SUBPROCESS_TIMEOUT_SHORT)
+                on_result = self._on_number_result
+                self._updating = True
+                try:
+                    self.slider.get_adjustment().configure(
+                        item.default, item.minimum, item.maximum,
+                        item.step, item.step * 10, 0,
                     )
+                finally:
+                    self._updating = False
+            case "label":
+                suffix = self.value_lbl
+                value: ValueConfig = (
+                    item.value if item.value is not None else LABEL_NA  # type: ignore[assignment]
+                )
+                spec = _label_source(value)
+                on_result = self._on_label_result
+                self.value_lbl.set_label(
+                    LABEL_PLACEHOLDER if spec is not None else _static_text(value)
+                )
+            case _:
+                # Multi-button rows, selections and entries: activate to reveal
+                suffix = None
+                spec = None
+
+        for widget in self._suffixes:
+            widget.set_visible(widget is suffix)
+        self.toggle_switch.set_sensitive(spec is None)
+        self.slider.set_sensitive(spec is None)
+        if spec is None:
+            return
 
-        if key := self.properties.get("key"):
-            utility.save_setting(
-                str(key).strip(), new_state ^ self.key_inverse, as_int=self.save_as_int
-            )
+        store = _get_state_store()
+        if store.get(spec.key) is None:
+            if spec.key[0] == "setting" and spec.fetch:
+                # Settings are a small file read, as when a toggle row is built
+                store.publish(spec.key, spec.fetch())
+            else:
+                # One shared fetch; the result reaches this row through the store
+                self._fetch = _get_scheduler().subscribe(
+                    spec, _ignore_result, is_active=self.get_mapped
+                )
+        self._watch = store.watch(spec.key, on_result)
+
+    # ─── Store Updates ───
+    def _on_state_result(self, result: PollResult) -> None:
+        # A failed fetch keeps the last value, as the real rows do
+        if (state := _state_from_result(result)) is not None:
+            self._set_switch(state)
+            self.toggle_switch.set_sensitive(True)
+
+    def _on_number_result(self, result: PollResult) -> None:
+        value = _number_from_result(result)
+        if value is None or self._debounce_id:
+            return  # Keep a value the user is still dragging
+        self._updating = True
+        try:
+            self.slider.set_value(value)
+        finally:
+            self._updating = False
+        self.slider.set_sensitive(True)
+
+    def _on_label_result(self, result: PollResult) -> None:
+        self.value_lbl.set_label(_label_from_result(result))
+
+    def _set_switch(self, state: bool) -> None:
+        if state != self.toggle_switch.get_active():
+            self._updating = True
+            try:
+                self.toggle_switch.set_active(state)
+            finally:
+                self._updating = False
 
+    # ─── User Actions ───
+    def _on_toggle_changed(self, _switch: Gtk.Switch, state: bool) -> bool:
+        if not self._updating and self._item is not None:
+            _run_toggle_action(self._item, state)
         return False
+
+    def _on_button_clicked(self, _button: Gtk.Button) -> None:
+        if self._item is not None:
+            _run_press_action(self._item.action, self._item.title, self._context)
+
+    def _on_value_changed(self, scale: Gtk.Scale) -> None:
+        if self._updating or self._item is None:
+            return
+        snapped = _snap_value(scale.get_value(), self._item)
+        pending = self._pending_value
+        if pending is not None and abs(snapped - pending) < MIN_STEP_VALUE:
+            return
+        self._pending_value = snapped
+
+        if not self._item.debounce:
+            self._execute_debounced_action()
+            return
+        _safe_source_remove(self._debounce_id)
+        self._debounce_id = GLib.timeout_add(
+            SLIDER_DEBOUNCE_MS, self._execute_debounced_action
+        )
+
+    def _execute_debounced_action(self) -> bool:
+        self._debounce_id = 0
+        value, self._pending_value = self._pending_value, None
+        if value is not None and self._item is not None:
+            _run_slider_action(self._item.action, value)
+        return GLib.SOURCE_REMOVE
+
+
+def _ignore_result(_result: PollResult) -> None:
+    """Callback of subscriptions that only exist to trigger a fetch."""
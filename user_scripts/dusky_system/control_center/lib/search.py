@@ -0,0 +1,490 @@
+"""
+Search index and ranking for the Dusky Control Center.
+
+Built once per config (re)load from the compiled pages, so a keystroke never
+walks or copies the config tree. Each entry holds the normalized title and
+description, their word tokens, a title character mask, the breadcrumb and a
+ready-to-render item (description already prefixed with the breadcrumb).
+
+Matching runs in two tiers; every exact match outranks every fuzzy one:
+- Exact: the query as a substring (three or more characters, bounded by the
+  rarest trigram's postings) or as a word prefix (shorter queries, from
+  precomputed prefix postings). Scored by where it lands: whole title, title
+  prefix, word start, anywhere.
+- Fuzzy, only while fewer than `limit` exact hits exist: every query word
+  must match, in any order, as a title subsequence (acronym, word-start and
+  contiguity bonuses, gap penalty) or within one edit of a token. Typos are
+  resolved against the token vocabulary, not per entry, and the character
+  mask skips titles that cannot contain the word. Two-character queries
+  only match acronyms ("nl" for "Night Light") and pairs anchored at a word
+  start ("kb" for "Keybinds").
+
+Title matches weigh more than description matches. The top `limit` results
+come from bounded heaps; ties keep config order.
+"""
+from __future__ import annotations
+
+import heapq
+import re
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
+from typing import Final
+
+from lib.model import ItemModel, PageModel, SectionModel
+
+__all__ = [
+    "SearchEntry",
+    "SearchIndex",
+]
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+GRAM_SIZE: Final[int] = 3
+BREADCRUMB_SEPARATOR: Final[str] = " › "
+DESCRIPTION_SEPARATOR: Final[str] = " • "
+
+# Exact tier
+SCORE_EXACT: Final[float] = 1000.0
+SCORE_PREFIX: Final[float] = 800.0
+SCORE_WORD: Final[float] = 600.0
+SCORE_SUBSTRING: Final[float] = 400.0
+DESCRIPTION_WEIGHT: Final[float] = 0.5
+LENGTH_PENALTY: Final[float] = 0.01  # Per title character: shorter is more specific
+# Fuzzy tier, kept below the weakest exact score (a description substring)
+FUZZY_MAX: Final[float] = 190.0
+FUZZY_TYPO: Final[float] = 0.45  # Fraction of FUZZY_MAX for a one-edit match
+TYPO_MIN_LENGTH: Final[int] = 4
+BONUS_WORD_START: Final[float] = 2.0
+BONUS_CONSECUTIVE: Final[float] = 1.0
+PENALTY_GAP: Final[float] = 0.2
+
+# Structural items are descended into but never listed themselves
+_CONTAINER_TYPES: Final[frozenset[str]] = frozenset({"navigation", "expander"})
+_TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"\w+")
+
+ExpandFunc = Callable[[ItemModel], Iterable[ItemModel]]
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+@dataclass(frozen=True, slots=True)
+class SearchEntry:
+    """One searchable item."""
+
+    item: ItemModel  # Rendered as the result row
+    title: str  # Normalized (casefolded) text
+    description: str
+    title_tokens: tuple[str, ...]
+    description_tokens: tuple[str, ...]
+    title_mask: int  # Characters in the title, see _char_mask
+    breadcrumb: str
+    page: str  # Id (or title) of the sidebar page holding the item
+    source: ItemModel  # The configured item, as its page row holds it
+    trail: tuple[ItemModel, ...]  # Navigation and expander items above it, outermost first
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+def _char_mask(text: str) -> int:
+    """Bitset of the word characters in text (collisions only weaken it)."""
+    mask = 0
+    for ch in set(text):
+        if ch.isalnum():
+            mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
+class SearchIndex:
+    """Immutable index over every listable item of a config."""
+
+    __slots__ = (
+        "entries", "_grams", "_prefix_ids", "_pair_ids", "_title_token_ids",
+        "_description_token_ids",
+    )
+
+    def __init__(self, entries: list[SearchEntry]) -> None:
+        self.entries: tuple[SearchEntry, ...] = tuple(entries)
+        self._grams: dict[str, list[int]] = {}
+        # Short-query postings: one- and two-character word prefixes of the
+        # title or description, and the two-letter title subsequences that
+        # start a word (acronym runs, or a word's first letter and a later one)
+        self._prefix_ids: dict[str, list[int]] = {}
+        self._pair_ids: dict[str, list[int]] = {}
+        self._title_token_ids: dict[str, list[int]] = {}
+        self._description_token_ids: dict[str, list[int]] = {}
+
+        for idx, entry in enumerate(self.entries):
+            for gram in _grams(f"{entry.title}\n{entry.description}"):
+                self._grams.setdefault(gram, []).append(idx)
+            for token in set(entry.title_tokens):
+                self._title_token_ids.setdefault(token, []).append(idx)
+            for token in set(entry.description_tokens):
+                self._description_token_ids.setdefault(token, []).append(idx)
+
+            for prefix in _prefixes(entry.title_tokens + entry.description_tokens):
+                self._prefix_ids.setdefault(prefix, []).append(idx)
+            for pair in _word_pairs(entry):
+                self._pair_ids.setdefault(pair, []).append(idx)
+
+    @classmethod
+    def build(
+        cls, pages: Iterable[PageModel], expand: ExpandFunc | None = None
+    ) -> SearchIndex:
+        """
+        Index compiled pages. `expand` turns a directory generator item into
+        its generated items; without it generators are skipped.
+        """
+        entries: list[SearchEntry] = []
+        for page in pages:
+            _collect_layout(
+                page.layout, page.title, page.id or page.title, (), expand, entries
+            )
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(self, query: str, limit: int = 50) -> list[SearchEntry]:
+        """The `limit` best matches, most relevant first."""
+        query = _normalize(query)
+        if not query or limit <= 0:
+            return []
+        short = len(query) < GRAM_SIZE
+
+        # (score, -index) pairs: ties keep config order. nlargest keeps a
+        # bounded heap of `limit` items.
+        if short:
+            exact = self._score(query, self._prefix_ids.get(query, ()))
+        else:
+            exact = self._substring_matches(query)
+        ranked = heapq.nlargest(limit, exact)
+        if len(ranked) < limit:
+            # Every exact match outranks every fuzzy one
+            matched = {-neg_idx for _score, neg_idx in exact}
+            if short:
+                # Too short for typos or loose subsequences
+                fuzzy = self._pair_matches(query, matched)
+            else:
+                fuzzy = self._fuzzy_matches(query, matched)
+            ranked += heapq.nlargest(limit - len(ranked), fuzzy)
+        return [self.entries[-neg_idx] for _score, neg_idx in ranked]
+
+    # ─── Exact Tier ───
+    def _substring_matches(self, query: str) -> list[tuple[float, int]]:
+        # The rarest trigram bounds the candidates
+        rarest: list[int] | None = None
+        for gram in _grams(query):
+            ids = self._grams.get(gram)
+            if ids is None:
+                return []
+            if rarest is None or len(ids) < len(rarest):
+                rarest = ids
+        return self._score(query, rarest or ())
+
+    def _score(self, query: str, ids: Iterable[int]) -> list[tuple[float, int]]:
+        """Exact-tier scores of the candidates that contain the query."""
+        entries = self.entries
+        scored = []
+        for idx in ids:
+            entry = entries[idx]
+            score = _substring_score(query, entry.title)
+            if not score:
+                score = _substring_score(query, entry.description) * DESCRIPTION_WEIGHT
+            if score:
+                scored.append((score - len(entry.title) * LENGTH_PENALTY, -idx))
+        return scored
+
+    # ─── Fuzzy Tier ───
+    def _pair_matches(self, query: str, exclude: set[int]) -> list[tuple[float, int]]:
+        """Two-character queries: acronyms ("nl") and in-word pairs ("kb")."""
+        pattern = _subsequence_pattern(query)
+        entries = self.entries
+        scored = []
+        for idx in self._pair_ids.get(query, ()):
+            if idx in exclude:
+                continue
+            entry = entries[idx]
+            match = pattern.search(entry.title)
+            if match is not None and (score := _subsequence_score(query, entry, match)):
+                scored.append((score - len(entry.title) * LENGTH_PENALTY, -idx))
+        return scored
+
+    def _fuzzy_matches(
+        self, query: str, exclude: set[int]
+    ) -> list[tuple[float, int]]:
+        """Entries matching every query word fuzzily, scored by the mean."""
+        words = query.split()
+        totals: dict[int, float] | None = None
+        for word in words:
+            scores = self._fuzzy_word(word, len(words) > 1)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {i: s + scores[i] for i, s in totals.items() if i in scores}
+            if not totals:
+                return []
+
+        entries = self.entries
+        return [
+            (total / len(words) - len(entries[idx].title) * LENGTH_PENALTY, -idx)
+            for idx, total in (totals or {}).items()
+            if idx not in exclude
+        ]
+
+    def _fuzzy_word(self, word: str, multi: bool) -> dict[int, float]:
+        """Best fuzzy score per entry for one query word."""
+        scores: dict[int, float] = {}
+
+        def keep(idx: int, score: float) -> None:
+            if score > scores.get(idx, 0.0):
+                scores[idx] = score
+
+        if multi:
+            # Words of a multi-word query may match exactly, in any order
+            if len(word) < GRAM_SIZE:
+                for idx in self._prefix_ids.get(word, ()):
+                    keep(idx, FUZZY_MAX * DESCRIPTION_WEIGHT)
+            else:
+                for score, neg_idx in self._substring_matches(word):
+                    keep(-neg_idx, FUZZY_MAX * score / SCORE_EXACT)
+
+        # Subsequences and acronyms, in titles only (descriptions are long
+        # enough to contain almost any subsequence)
+        pattern = _subsequence_pattern(word)
+        word_mask = _char_mask(word)
+        for idx, entry in enumerate(self.entries):
+            if entry.title_mask & word_mask != word_mask:
+                continue
+            if (match := pattern.search(entry.title)) is not None:
+                keep(idx, _subsequence_score(word, entry, match))
+
+        # Typos, resolved once against the vocabulary rather than per entry
+        if len(word) >= TYPO_MIN_LENGTH:
+            for token_ids, weight in (
+                (self._title_token_ids, 1.0),
+                (self._description_token_ids, DESCRIPTION_WEIGHT),
+            ):
+                for token, ids in token_ids.items():
+                    if _is_typo_of(word, token):
+                        for idx in ids:
+                            keep(idx, FUZZY_MAX * FUZZY_TYPO * weight)
+        return scores
+
+
+def _initials(entry: SearchEntry) -> str:
+    return "".join(token[0] for token in entry.title_tokens)
+
+
+def _word_pairs(entry: SearchEntry) -> set[str]:
+    initials = _initials(entry)
+    pairs = {initials[i:i + 2] for i in range(len(initials) - 1)}
+    for token in entry.title_tokens:
+        pairs.update(token[0] + ch for ch in token[1:])
+    return pairs
+
+
+def _prefixes(tokens: Iterable[str]) -> set[str]:
+    """The one- and two-character prefixes of tokens."""
+    return {
+        token[:size]
+        for token in tokens
+        for size in range(1, min(len(token), GRAM_SIZE - 1) + 1)
+    }
+
+
+# =============================================================================
+# SCORING
+# =============================================================================
+def _is_word_start(text: str, pos: int) -> bool:
+    return pos == 0 or not text[pos - 1].isalnum()
+
+
+def _substring_score(query: str, text: str) -> float:
+    pos = text.find(query)
+    if pos < 0:
+        return 0.0
+    if len(query) == len(text):
+        return SCORE_EXACT
+    if pos == 0:
+        return SCORE_PREFIX
+    if _is_word_start(text, pos) or text.find(" " + query, pos) >= 0:
+        return SCORE_WORD
+    return SCORE_SUBSTRING
+
+
+def _subsequence_pattern(word: str) -> re.Pattern[str]:
+    """Regex locating `word` as a subsequence, each character in a group."""
+    return re.compile(".*?".join(f"({re.escape(ch)})" for ch in word), re.DOTALL)
+
+
+def _subsequence_score(word: str, entry: SearchEntry, match: re.Match[str]) -> float:
+    """Score a title subsequence match; 0 when it is too scattered to be useful."""
+    # An acronym ("ncc" for "Night Color Control") is the best fuzzy match
+    if word in _initials(entry):
+        return FUZZY_MAX
+
+    title = entry.title
+    positions = [match.start(g) for g in range(1, len(word) + 1)]
+    bonus = 0.0
+    prev = -2
+    for pos in positions:
+        if _is_word_start(title, pos):
+            bonus += BONUS_WORD_START
+        if pos == prev + 1:
+            bonus += BONUS_CONSECUTIVE
+        prev = pos
+    gaps = positions[-1] - positions[0] + 1 - len(word)
+    quality = (bonus - gaps * PENALTY_GAP) / (len(word) * BONUS_WORD_START)
+    if quality <= 0:
+        return 0.0
+    return FUZZY_MAX * min(0.9, 0.5 + quality / 2)
+
+
+def _is_typo_of(word: str, token: str) -> bool:
+    """Whether token (or its prefix, for partial words) is one edit from word."""
+    size = len(word)
+    return abs(len(token[:size + 1]) - size) <= 1 and any(
+        _within_one_edit(word, token[:n]) for n in (size - 1, size, size + 1)
+    )
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Damerau-Levenshtein distance <= 1 (insert, delete, substitute or swap)."""
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    i = 0
+    while i < min(la, lb) and a[i] == b[i]:
+        i += 1
+    if la > lb:
+        return a[i + 1:] == b[i:]
+    if la < lb:
+        return a[i:] == b[i + 1:]
+    if a[i + 1:] == b[i + 1:]:
+        return True
+    # Adjacent transposition
+    return a[i:i + 2] == b[i:i + 2][::-1] and a[i + 2:] == b[i + 2:]
+
+
+# =============================================================================
+# COLLECTION
+# =============================================================================
+def _collect_layout(
+    layout: tuple[SectionModel, ...],
+    breadcrumb: str,
+    page: str,
+    trail: tuple[ItemModel, ...],
+    expand: ExpandFunc | None,
+    entries: list[SearchEntry],
+) -> None:
+    for section in layout:
+        items = section.items if section.item is None else (section.item,)
+        _collect_items(items, breadcrumb, page, trail, expand, entries)
+
+
+def _collect_items(
+    items: Iterable[ItemModel],
+    breadcrumb: str,
+    page: str,
+    trail: tuple[ItemModel, ...],
+    expand: ExpandFunc | None,
+    entries: list[SearchEntry],
+) -> None:
+    for item in items:
+        if item.type == "directory_generator":
+            if expand is not None:
+                _collect_items(expand(item), breadcrumb, page, trail, expand, entries)
+            continue
+
+        if item.type not in _CONTAINER_TYPES:
+            entries.append(_make_entry(item, breadcrumb, page, trail))
+
+        if item.layout:
+            sub_title = str(item.properties.get("title", "Submenu"))
+            _collect_layout(
+                item.layout, breadcrumb + BREADCRUMB_SEPARATOR + sub_title, page,
+                trail + (item,), expand, entries,
+            )
+        if item.type == "expander" and item.children:
+            _collect_items(
+                item.children, breadcrumb + BREADCRUMB_SEPARATOR + item.title, page,
+                trail + (item,), expand, entries,
+            )
+
+
+def _make_entry(
+    item: ItemModel, breadcrumb: str, page: str, trail: tuple[ItemModel, ...]
+) -> SearchEntry:
+    # Match on the configured text only, not on model default titles
+    title = _normalize(str(item.properties.get("title", "")))
+    description = _normalize(item.description)
+    shown = (
+        f"{breadcrumb}{DESCRIPTION_SEPARATOR}{item.description}"
+        if item.description
+        else breadcrumb
+    )
+    return SearchEntry(
+        item=replace(item, description=shown),
+        title=title,
+        description=description,
+        title_tokens=tuple(_TOKEN_PATTERN.findall(title)),
+        description_tokens=tuple(_TOKEN_PATTERN.findall(description)),
+        title_mask=_char_mask(title),
+        breadcrumb=breadcrumb,
+        page=page,
+        source=item,
+        trail=trail,
+    )
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+def _benchmark(items: int = 10_000, rounds: int = 20) -> None:
+    """Per-keystroke latency over a synthetic config (`python -m lib.search`)."""
+    import random
+
+    from lib.model import compile_pages
+
+    rng = random.Random(0)
+    words = [
+        "audio", "bluetooth", "brightness", "battery", "display", "network",
+        "night", "light", "power", "profile", "keyboard", "mouse", "theme",
+        "wallpaper", "update", "backup", "monitor", "volume", "privacy", "wifi",
+    ]
+
+    def text(n: int) -> str:
+        return " ".join(rng.choice(words) for _ in range(n))
+
+    layout = [{
+        "type": "section",
+        "items": [
+            {"type": "button", "properties": {"title": text(2), "description": text(6)}}
+            for _ in range(items)
+        ],
+    }]
+    started = time.perf_counter()
+    index = SearchIndex.build(compile_pages({"pages": [{"title": "Bench", "layout": layout}]}))
+    print(f"index: {len(index)} entries in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    for query in ("b", "bl", "blu", "blue", "bluet", "blutooth", "nl", "light night", "xyzq"):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            hits = index.search(query)
+        elapsed = (time.perf_counter() - started) / rounds * 1000
+        print(f"{query!r:14} {elapsed:7.2f} ms  {len(hits)} hits")
+
+
+if __name__ == "__main__":
+    _benchmark()
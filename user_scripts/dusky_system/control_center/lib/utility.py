@@ -6,7 +6,10 @@ All file I/O is atomic. All public functions are safe to call from any thread.
 """
 from __future__ import annotations
 
+import datetime
+import hashlib
 import logging
+import marshal
 import os
 import re
 import shlex
@@ -15,6 +18,7 @@ import subprocess
 import sys
 import tempfile
 import threading
+import time
 from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Final, TypeVar, overload
@@ -28,8 +32,12 @@ __all__ = [
     "CACHE_DIR",
     "LABEL_NA",
     "SETTINGS_DIR",
+    "ConfigError",
+    "compile_config",
     "execute_command",
     "get_cache_dir",
+    "get_provider_value",
+    "get_setting_path",
     "get_system_value",
     "load_config",
     "load_setting",
@@ -48,6 +56,11 @@ _T = TypeVar("_T")
 LABEL_NA: Final[str] = "N/A"
 _SHELL_METACHARACTERS: Final[frozenset[str]] = frozenset("|&;()<>$`\\\"'*?[]#~=!{}%")
 _TILDE_PATTERN: Final[re.Pattern[str]] = re.compile(r"(?:^|(?<=\s))~(?=/|$|\s)")
+_THERMAL_ZONE_PATTERN: Final[re.Pattern[str]] = re.compile(r"^thermal\.zone(\d+)$")
+_SIZE_SUFFIXES: Final[tuple[str, ...]] = ("B", "Ki", "Mi", "Gi", "Ti", "Pi")
+# Bump when the normalized layout changes so stale snapshots are ignored
+_CONFIG_SNAPSHOT_VERSION: Final[int] = 2
+_YAML_LOADER: Final = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def _get_xdg_path(env_var: str, default_suffix: str) -> Path:
@@ -168,21 +181,154 @@ def get_cache_dir() -> Path:
 # =============================================================================
 # CONFIGURATION LOADER
 # =============================================================================
+class ConfigError(ValueError):
+    """The config document does not have the required structure."""
+
+
 def load_config(config_path: Path) -> dict[str, object]:
-    """Load and parse YAML configuration safely."""
+    """
+    Load and parse YAML configuration safely.
+
+    The compiled document is snapshotted (marshal) in the cache directory,
+    keyed by mtime, size and content hash, so unchanged configs skip YAML
+    parsing entirely. Every call returns a fresh copy. An unreadable file or
+    YAML error yields {}; a document of the wrong shape raises ConfigError.
+    """
+    started = time.perf_counter()
     try:
-        content = config_path.read_text(encoding="utf-8")
-    except (FileNotFoundError, OSError) as e:
+        stat = config_path.stat()
+    except OSError as e:
         log.warning("Config file unreadable: %s (%s)", config_path, e)
         return {}
 
+    snapshot_path = _config_snapshot_path(config_path)
+    snapshot = _read_config_snapshot(snapshot_path)
+    if (
+        snapshot is not None
+        and snapshot["mtime_ns"] == stat.st_mtime_ns
+        and snapshot["size"] == stat.st_size
+    ):
+        _log_config_load(config_path, "snapshot", started)
+        return snapshot["data"]
+
     try:
-        data = yaml.safe_load(content)
-    except yaml.YAMLError as e:
-        log.error("YAML syntax error in %s: %s", config_path, e)
+        raw = config_path.read_bytes()
+    except OSError as e:
+        log.warning("Config file unreadable: %s (%s)", config_path, e)
         return {}
 
-    return data if isinstance(data, dict) else {}
+    digest = hashlib.sha256(raw).hexdigest()
+    if snapshot is not None and snapshot["sha256"] == digest:
+        # Touched but unchanged: reuse the compiled document
+        data = snapshot["data"]
+        source = "snapshot"
+    else:
+        try:
+            loaded = yaml.load(raw.decode("utf-8"), Loader=_YAML_LOADER)
+        except yaml.YAMLError as e:
+            log.error("YAML syntax error in %s: %s", config_path, e)
+            return {}
+        data = compile_config(loaded)
+        source = "yaml"
+
+    _write_config_snapshot(snapshot_path, {
+        "version": _CONFIG_SNAPSHOT_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest,
+        "data": data,
+    })
+    _log_config_load(config_path, source, started)
+    return data
+
+
+def compile_config(document: object) -> dict[str, object]:
+    """
+    Validate a parsed YAML document and normalize it to plain builtins:
+    string keys, lists for sequences and sets, ISO strings for dates. The
+    result is marshal-safe. Raises ConfigError when the page list is malformed.
+    """
+    if not isinstance(document, dict):
+        raise ConfigError(f"Config is not a dictionary (got {type(document).__name__})")
+    data: dict[str, object] = _normalize_config_value(document)  # type: ignore[assignment]
+    _validate_config(data)
+    return data
+
+
+def _validate_config(data: dict[str, object]) -> None:
+    if "pages" not in data:
+        raise ConfigError("Config missing required 'pages' key")
+    pages = data["pages"]
+    if not isinstance(pages, list):
+        raise ConfigError("'pages' must be a list")
+    for idx, page in enumerate(pages):
+        if not isinstance(page, dict):
+            raise ConfigError(f"Page {idx} is not a dictionary")
+        if "title" not in page:
+            raise ConfigError(f"Page {idx} missing required 'title' key")
+
+
+def _normalize_config_value(value: object) -> object:
+    if isinstance(value, dict):
+        return {str(k): _normalize_config_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_config_value(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_normalize_config_value(v) for v in value), key=str)
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    return str(value)
+
+
+def _config_snapshot_path(config_path: Path) -> Path:
+    key = hashlib.sha256(str(config_path.resolve()).encode()).hexdigest()[:16]
+    return get_cache_dir() / f"config-{key}.snapshot"
+
+
+def _read_config_snapshot(path: Path) -> dict[str, object] | None:
+    """Read a snapshot, or None if it is missing, corrupt or outdated."""
+    try:
+        snapshot = marshal.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        log.debug("Ignoring unreadable config snapshot %s: %s", path, e)
+        return None
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("version") != _CONFIG_SNAPSHOT_VERSION
+        or not isinstance(snapshot.get("data"), dict)
+    ):
+        return None
+    return snapshot
+
+
+def _write_config_snapshot(path: Path, snapshot: dict[str, object]) -> None:
+    """Atomically replace the snapshot (Temp File -> Rename). Best effort."""
+    temp_path: Path | None = None
+    try:
+        temp_fd, temp_path_str = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        temp_path = Path(temp_path_str)
+        with os.fdopen(temp_fd, "wb") as f:
+            marshal.dump(snapshot, f)
+        temp_path.replace(path)
+        temp_path = None
+    except (OSError, ValueError) as e:
+        log.warning("Could not write config snapshot %s: %s", path, e)
+    finally:
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
+
+
+def _log_config_load(config_path: Path, source: str, started: float) -> None:
+    log.info(
+        "Loaded %s from %s in %.1f ms",
+        config_path.name, source, (time.perf_counter() - started) * 1000,
+    )
 
 
 # =============================================================================
@@ -399,6 +545,146 @@ def _get_gpu_model() -> str:
     return LABEL_NA
 
 
+# =============================================================================
+# LIVE VALUE PROVIDERS (/proc & /sys)
+# =============================================================================
+# Unlike system values these are re-read on every poll, replacing commands
+# such as `free -h | awk` or `brightnessctl -m | awk`. Every reader takes the
+# filesystem root so it can run against a fake /proc and /sys tree.
+_cpu_samples_lock: Final = threading.Lock()
+_cpu_samples: dict[Path, tuple[int, int]] = {}
+
+
+def get_provider_value(name: str, root: Path = Path("/")) -> str | None:
+    """
+    Read a live metric by provider name (e.g. `memory.used`). Returns None if
+    the name is unknown or the backing files are missing or malformed.
+    """
+    zone = _THERMAL_ZONE_PATTERN.match(name)
+    reader = _PROVIDERS.get(name)
+    if zone is None and reader is None:
+        log.debug("Unknown value provider: %s", name)
+        return None
+
+    try:
+        if zone is not None:
+            return _read_thermal_zone(root, int(zone.group(1)))
+        return reader(root)  # type: ignore[misc]
+    except (OSError, ValueError, IndexError, ZeroDivisionError):
+        return None
+
+
+def _read_int(path: Path) -> int:
+    return int(path.read_text(encoding="utf-8").strip())
+
+
+def _read_meminfo(root: Path) -> dict[str, int]:
+    """Parse /proc/meminfo into kB values."""
+    info: dict[str, int] = {}
+    for line in (root / "proc/meminfo").read_text(encoding="utf-8").splitlines():
+        key, _, rest = line.partition(":")
+        parts = rest.split()
+        if parts:
+            info[key] = int(parts[0])
+    return info
+
+
+def _format_size(kib: int) -> str:
+    """Human-readable size in the style of `free -h` (e.g. 2.5Gi, 512Mi)."""
+    size = float(kib * 1024)
+    for suffix in _SIZE_SUFFIXES:
+        if size < 1024 or suffix == _SIZE_SUFFIXES[-1]:
+            break
+        size /= 1024
+    if suffix == "B":
+        return f"{int(size)}B"
+    return f"{size:.1f}{suffix}" if size < 10 else f"{round(size)}{suffix}"
+
+
+def _memory_used_kib(info: dict[str, int]) -> int:
+    # Same definition as procps `free`: total minus available
+    return info["MemTotal"] - info["MemAvailable"]
+
+
+def _read_memory_used(root: Path) -> str:
+    return _format_size(_memory_used_kib(_read_meminfo(root)))
+
+
+def _read_memory_available(root: Path) -> str:
+    return _format_size(_read_meminfo(root)["MemAvailable"])
+
+
+def _read_memory_percent(root: Path) -> str:
+    info = _read_meminfo(root)
+    return str(round(_memory_used_kib(info) * 100 / info["MemTotal"]))
+
+
+def _first_device(class_dir: Path, kind: str | None = None) -> Path:
+    """First device in a /sys/class directory, optionally filtered by `type`."""
+    for device in sorted(class_dir.iterdir()):
+        if kind is None:
+            return device
+        try:
+            if (device / "type").read_text(encoding="utf-8").strip() == kind:
+                return device
+        except OSError:
+            continue
+    raise FileNotFoundError(class_dir)
+
+
+def _read_backlight_percent(root: Path) -> str:
+    device = _first_device(root / "sys/class/backlight")
+    brightness = _read_int(device / "brightness")
+    return str(round(brightness * 100 / _read_int(device / "max_brightness")))
+
+
+def _read_battery_capacity(root: Path) -> str:
+    device = _first_device(root / "sys/class/power_supply", "Battery")
+    return str(_read_int(device / "capacity"))
+
+
+def _read_battery_status(root: Path) -> str:
+    device = _first_device(root / "sys/class/power_supply", "Battery")
+    return (device / "status").read_text(encoding="utf-8").strip()
+
+
+def _read_cpu_usage(root: Path) -> str:
+    """
+    Busy percentage since the previous read of the same root (since boot on
+    the first read), from the aggregate `cpu` line of /proc/stat.
+    """
+    with (root / "proc/stat").open(encoding="utf-8") as f:
+        fields = [int(v) for v in f.readline().split()[1:]]
+    # idle + iowait
+    idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+    total = sum(fields[:8])
+
+    with _cpu_samples_lock:
+        prev_idle, prev_total = _cpu_samples.get(root, (0, 0))
+        _cpu_samples[root] = (idle, total)
+
+    delta_total = total - prev_total
+    if delta_total <= 0:
+        return "0"
+    return str(round((delta_total - (idle - prev_idle)) * 100 / delta_total))
+
+
+def _read_thermal_zone(root: Path, zone: int) -> str:
+    millidegrees = _read_int(root / f"sys/class/thermal/thermal_zone{zone}/temp")
+    return f"{round(millidegrees / 1000)}°C"
+
+
+_PROVIDERS: Final[dict[str, Callable[[Path], str]]] = {
+    "backlight.percent": _read_backlight_percent,
+    "battery.capacity": _read_battery_capacity,
+    "battery.status": _read_battery_status,
+    "cpu.usage": _read_cpu_usage,
+    "memory.available": _read_memory_available,
+    "memory.percent": _read_memory_percent,
+    "memory.used": _read_memory_used,
+}
+
+
 # =============================================================================
 # SETTINGS PERSISTENCE (Atomic File I/O)
 # =============================================================================
@@ -421,6 +707,11 @@ def _validate_settings_path(key: str) -> Path | None:
         return None
 
 
+def get_setting_path(key: str) -> Path | None:
+    """Resolve a settings key to its file path (None if the key is invalid)."""
+    return _validate_settings_path(key)
+
+
 def save_setting(
     key: str, value: bool | int | float | str, *, as_int: bool = False
 ) -> bool: